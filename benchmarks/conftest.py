@@ -0,0 +1,38 @@
+import os
+from collections.abc import Iterator
+from itertools import cycle, islice
+from typing import Any
+
+import pytest
+from django.db.models import Model
+from tests.test_app.models import (
+    ChoiceModel,
+    IntChoice,
+    LazyChoiceModel,
+    PlainChoiceModel,
+    TextChoice,
+)
+
+# Number of rows stored, per model, for benchmarks reading from the database
+ROWS = int(os.environ.get("CHOICEFIELD_BENCHMARK_ROWS", "1000000"))
+BATCH_SIZE = 10_000
+MODELS = (ChoiceModel, LazyChoiceModel, PlainChoiceModel)
+
+
+def build(model: type[Model], count: int) -> list[Any]:
+    pairs = islice(zip(cycle(TextChoice), cycle(IntChoice)), count)
+    return [
+        model(text_choice=text_choice, int_choice=int_choice)
+        for text_choice, int_choice in pairs
+    ]
+
+
+@pytest.fixture(scope="session")
+def populated(django_db_setup: None, django_db_blocker: Any) -> Iterator[int]:
+    with django_db_blocker.unblock():
+        for model in MODELS:
+            for offset in range(0, ROWS, BATCH_SIZE):
+                model.objects.bulk_create(build(model, min(BATCH_SIZE, ROWS - offset)))
+        yield ROWS
+        for model in MODELS:
+            model.objects.all().delete()
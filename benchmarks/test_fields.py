@@ -0,0 +1,189 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.apps.registry import Apps
+from django.db import connection
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.graph import MigrationGraph
+from django.db.migrations.state import ModelState, ProjectState
+from django.db.models import CharField, Field, Model, TextChoices
+from tests.test_app.models import ChoiceModel, IntChoice, PlainChoiceModel, TextChoice
+
+from choicefield import ChoiceField
+
+models = pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(ChoiceModel, id="choicefield"),
+        pytest.param(PlainChoiceModel, id="django"),
+    ],
+)
+
+
+@pytest.mark.benchmark(group="descriptor-get")
+@models
+def test_get(benchmark: Any, model: type[Model]) -> None:
+    instance = model(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE)
+    assert benchmark(getattr, instance, "int_choice") == IntChoice.ONE
+
+
+@pytest.mark.benchmark(group="descriptor-set-member")
+@models
+def test_set_member(benchmark: Any, model: type[Model]) -> None:
+    instance = model(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE)
+    benchmark(setattr, instance, "int_choice", IntChoice.TWO)
+
+
+@pytest.mark.benchmark(group="descriptor-set-value")
+@models
+def test_set_value(benchmark: Any, model: type[Model]) -> None:
+    instance = model(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE)
+    benchmark(setattr, instance, "int_choice", 2)
+
+
+@pytest.mark.benchmark(group="to-python")
+@models
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param(IntChoice.TWO, id="member"),
+        pytest.param(2, id="value"),
+        pytest.param("2", id="string"),
+    ],
+)
+def test_to_python(benchmark: Any, model: type[Model], value: Any) -> None:
+    field = model._meta.get_field("int_choice")
+    assert benchmark(field.to_python, value) == IntChoice.TWO
+
+
+@pytest.mark.benchmark(group="from-db-value")
+@models
+def test_db_converters(benchmark: Any, model: type[Model]) -> None:
+    field = model._meta.get_field("text_choice")
+    expression = field.get_col(model._meta.db_table)
+    converters = [
+        *connection.ops.get_db_converters(expression),
+        *expression.get_db_converters(connection),
+    ]
+
+    def convert() -> Any:
+        value = "SECOND"
+        for converter in converters:
+            value = converter(value, expression, connection)
+        return value
+
+    assert benchmark(convert) == TextChoice.SECOND
+
+
+@pytest.mark.benchmark(group="get-db-prep-value")
+@models
+def test_get_db_prep_value(benchmark: Any, model: type[Model]) -> None:
+    field = model._meta.get_field("int_choice")
+    assert benchmark(field.get_db_prep_value, IntChoice.TWO, connection) == 2
+
+
+@pytest.mark.benchmark(group="filter-parameters")
+@models
+def test_compile_filter(benchmark: Any, model: type[Model]) -> None:
+    queryset = model.objects.filter(
+        text_choice=TextChoice.FIRST, int_choice__in=[IntChoice.ONE, IntChoice.TWO]
+    )
+
+    def compile_filter() -> Any:
+        return queryset.query.get_compiler(using="default").as_sql()
+
+    __, params = benchmark(compile_filter)
+    assert list(params) == [1, 2, "FIRST"]
+
+
+# An enum the size of e.g. a catalogue of region codes
+Region = TextChoices(  # type: ignore[misc]
+    "Region", [(f"R{index:05}", f"R{index:05}") for index in range(5000)]
+)
+
+
+@pytest.mark.benchmark(group="validate-large-enum")
+@pytest.mark.parametrize(
+    "field",
+    [
+        pytest.param(ChoiceField(Region), id="choicefield"),
+        pytest.param(CharField(max_length=6, choices=Region.choices), id="django"),
+    ],
+)
+def test_validate_large_enum(benchmark: Any, field: Field) -> None:
+    benchmark(field.validate, Region("R04999"), None)
+
+
+def define_models(
+    field: Callable[[type[TextChoices]], Field],
+    apps: Apps,
+    enums: tuple[type[TextChoices], ...] = (TextChoice, IntChoice),
+) -> None:
+    # Many models of a project, each with a handful of fields of a few shared enums
+    for index in range(50):
+        attrs: dict[str, Any] = {
+            f"field_{position}": field(enums[position % len(enums)])
+            for position in range(10)
+        }
+        attrs["__module__"] = __name__
+        attrs["Meta"] = type("Meta", (), {"apps": apps, "app_label": "populated"})
+        type(f"Populated{index}", (Model,), attrs)
+
+
+field_factories = pytest.mark.parametrize(
+    "field",
+    [
+        pytest.param(ChoiceField, id="choicefield"),
+        pytest.param(
+            lambda enum: CharField(max_length=255, choices=enum.choices), id="django"
+        ),
+    ],
+)
+
+
+@pytest.mark.benchmark(group="define-models")
+@field_factories
+def test_define_models(
+    benchmark: Any, field: Callable[[type[TextChoices]], Field]
+) -> None:
+    benchmark(lambda: define_models(field, Apps()))
+
+
+@pytest.mark.benchmark(group="render-model-state")
+@field_factories
+def test_render_model_state(
+    benchmark: Any, field: Callable[[type[TextChoices]], Field]
+) -> None:
+    apps = Apps()
+    define_models(field, apps)
+    state = ProjectState()
+    for model in apps.all_models["populated"].values():
+        state.add_model(ModelState.from_model(model))
+    # Like `migrate`, rendering a state clones every field via its deconstruction
+    rendered = benchmark(lambda: state.clone().apps)
+    assert len(rendered.get_models()) == 50
+
+
+@pytest.mark.benchmark(group="detect-changes")
+@pytest.mark.parametrize(
+    "pin_values",
+    [pytest.param(True, id="pinned"), pytest.param(False, id="unpinned")],
+)
+def test_detect_changes(benchmark: Any, pin_values: bool) -> None:  # noqa: FBT001
+    apps = Apps()
+    define_models(
+        lambda enum: ChoiceField(enum, pin_values=pin_values),
+        apps,
+        enums=(TextChoice, Region),
+    )
+    to_state = ProjectState()
+    for model in apps.all_models["populated"].values():
+        to_state.add_model(ModelState.from_model(model))
+    # Like `makemigrations --check`, comparing models with the state of migrations
+    from_state = to_state.clone()
+
+    def detect_changes() -> dict[str, Any]:
+        return MigrationAutodetector(from_state, to_state).changes(MigrationGraph())
+
+    assert benchmark(detect_changes) == {}
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from django.db.models import Model
+from django.forms import modelform_factory
+from django.test import Client
+from django.urls import reverse
+from tests.test_app.models import ChoiceModel, PlainChoiceModel
+
+models = pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(ChoiceModel, id="choicefield"),
+        pytest.param(PlainChoiceModel, id="django"),
+    ],
+)
+
+
+@pytest.mark.benchmark(group="form-validation")
+@models
+def test_form_validation(benchmark: Any, model: type[Model]) -> None:
+    form_class = modelform_factory(model, fields=["text_choice", "int_choice"])
+
+    def validate() -> bool:
+        form = form_class(data={"text_choice": "SECOND", "int_choice": "2"})
+        return form.is_valid()
+
+    assert benchmark(validate) is True
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group="admin-changelist")
+@models
+def test_render_admin_changelist(
+    benchmark: Any, admin_client: Client, populated: int, model: type[Model]
+) -> None:
+    url = reverse(f"admin:test_app_{model._meta.model_name}_changelist")
+
+    def render() -> Any:
+        return admin_client.get(url)
+
+    assert benchmark.pedantic(render, rounds=10).status_code == HTTPStatus.OK
+
+
+@pytest.mark.benchmark(group="render-changelist-selects")
+@models
+def test_render_selects(benchmark: Any, model: type[Model]) -> None:
+    # Like a changelist with an editable choice, 500 forms of the same form class
+    form_class = modelform_factory(model, fields=["text_choice"])
+
+    def render() -> list[str]:
+        return [
+            str(form_class(prefix=f"form-{index}")["text_choice"])
+            for index in range(500)
+        ]
+
+    assert len(benchmark(render)) == 500
@@ -0,0 +1,81 @@
+from typing import Any
+
+import pytest
+from django.db.models import Model
+from tests.test_app.models import (
+    ChoiceModel,
+    IntChoice,
+    LazyChoiceModel,
+    PlainChoiceModel,
+    TextChoice,
+)
+
+from .conftest import build
+
+models = pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(ChoiceModel, id="choicefield"),
+        pytest.param(PlainChoiceModel, id="django"),
+    ],
+)
+reading_models = pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(ChoiceModel, id="choicefield"),
+        pytest.param(LazyChoiceModel, id="choicefield-lazy"),
+        pytest.param(PlainChoiceModel, id="django"),
+    ],
+)
+BULK_SIZE = 10_000
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group="iterator")
+@reading_models
+def test_iterate_instances(benchmark: Any, populated: int, model: type[Model]) -> None:
+    def iterate() -> int:
+        return sum(1 for __ in model.objects.iterator(chunk_size=5000))
+
+    assert benchmark.pedantic(iterate, rounds=3) == populated
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group="iterator-values-list")
+@reading_models
+def test_iterate_values_list(
+    benchmark: Any, populated: int, model: type[Model]
+) -> None:
+    queryset = model.objects.values_list("text_choice", "int_choice")
+
+    def iterate() -> int:
+        return sum(1 for __ in queryset.iterator(chunk_size=5000))
+
+    assert benchmark.pedantic(iterate, rounds=3) == populated
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group="bulk-create")
+@models
+def test_bulk_create(benchmark: Any, model: type[Model]) -> None:
+    def bulk_create() -> None:
+        model.objects.bulk_create(build(model, BULK_SIZE))
+
+    benchmark.pedantic(bulk_create, rounds=5)
+
+
+@pytest.mark.django_db()
+@pytest.mark.benchmark(group="bulk-update")
+@models
+def test_bulk_update(benchmark: Any, model: type[Model]) -> None:
+    instances = model.objects.bulk_create(build(model, BULK_SIZE))
+    for instance in instances:
+        instance.text_choice = TextChoice.SECOND
+        instance.int_choice = IntChoice.TWO
+
+    def bulk_update() -> None:
+        model.objects.bulk_update(
+            instances, ["text_choice", "int_choice"], batch_size=1000
+        )
+
+    benchmark.pedantic(bulk_update, rounds=5)
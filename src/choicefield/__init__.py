@@ -1,8 +1,20 @@
-from .fields import ChoiceField
+from .expressions import ChoiceLabel, ChoiceName, ChoiceOrder
+from .fields import ChoiceField, FlagField, MultiChoiceField, UnknownChoice
+from .query import ChoiceQuerySet
 
 try:
     from ._version import __version__
 except ImportError:  # pragma: no cover
     __version__ = "unknown"
 
-__all__ = ("__version__", "ChoiceField")
+__all__ = (
+    "__version__",
+    "ChoiceField",
+    "FlagField",
+    "MultiChoiceField",
+    "ChoiceQuerySet",
+    "ChoiceLabel",
+    "ChoiceName",
+    "ChoiceOrder",
+    "UnknownChoice",
+)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterator
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+import django
+from django.contrib import admin
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db.models import Count, QuerySet
+from django.utils.translation import gettext as _
+
+if TYPE_CHECKING:
+    from django.contrib.admin import ModelAdmin
+    from django.contrib.admin.filters import _ListFilterChoices
+    from django.contrib.admin.views.main import ChangeList
+    from django.db.models import Field, Model
+    from django.http import HttpRequest
+
+__all__ = ("ChoiceFieldListFilter",)
+
+
+class ChoiceFieldListFilter(admin.ChoicesFieldListFilter):
+    """
+    List filter of a `ChoiceField`, showing the number of rows of every member. All
+    members are counted in a single grouped query over the changelist's rows.
+
+    Counts of large tables can be cached, by setting `cache_timeout` on a subclass:
+
+        class StatusFilter(ChoiceFieldListFilter):
+            cache_timeout = 60
+
+        list_filter = [("status", StatusFilter)]
+    """
+
+    # Seconds to cache counts for, counting on every request when `None`
+    cache_timeout: int | None = None
+    cache_alias = DEFAULT_CACHE_ALIAS
+
+    def __init__(  # noqa: PLR0913
+        self,
+        field: Field[Any, Any],
+        request: HttpRequest,
+        params: dict[str, str],
+        model: type[Model],
+        model_admin: ModelAdmin[Any],
+        field_path: str,
+    ) -> None:
+        super().__init__(field, request, params, model, model_admin, field_path)
+        # Only kept by list filters themselves as of Django 5.0
+        self.request = request
+
+    def get_count_queryset(self, changelist: ChangeList) -> QuerySet[Any]:
+        # Count rows as if no member was selected, like facets do
+        if django.VERSION >= (5, 0):
+            return changelist.get_queryset(
+                self.request, exclude_parameters=self.expected_parameters()
+            )
+        queryset: QuerySet[Any] = changelist.root_queryset
+        for spec in changelist.filter_specs:
+            if spec is not self:
+                queryset = spec.queryset(self.request, queryset) or queryset
+        return queryset
+
+    def get_counts(self, changelist: ChangeList) -> dict[Any, int]:
+        """
+        Number of rows by stored value, with `None` for rows without a value.
+        """
+        queryset = (
+            self.get_count_queryset(changelist)
+            .order_by()
+            .values_list(self.field_path)
+            .annotate(count=Count("pk"))
+        )
+        if self.cache_timeout is None:
+            return self.count(queryset)
+
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.md5(
+            f"{sql}{params!r}".encode(), usedforsecurity=False
+        ).hexdigest()
+        cache = caches[self.cache_alias]
+        key = f"choicefield.admin.counts.{digest}"
+        counts: dict[Any, int] | None = cache.get(key)
+        if counts is None:
+            counts = self.count(queryset)
+            cache.set(key, counts, self.cache_timeout)
+        return counts
+
+    def count(self, queryset: QuerySet[Any]) -> dict[Any, int]:
+        return {
+            value.value if isinstance(value, Enum) else value: count
+            for value, count in queryset
+        }
+
+    def is_selected(self, lookup: Any) -> bool:
+        if django.VERSION >= (5, 0):
+            # Selected values are a list, to select multiple of them
+            return self.lookup_val is not None and str(lookup) in self.lookup_val
+        return str(lookup) == self.lookup_val
+
+    def choices(self, changelist: ChangeList) -> Iterator[_ListFilterChoices]:
+        counts = self.get_counts(changelist)
+        yield {
+            "selected": self.lookup_val is None and not self.lookup_val_isnull,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+            "display": _("All"),
+        }
+        for lookup, title in self.field.flatchoices:
+            if lookup is None:
+                continue
+            yield {
+                "selected": self.is_selected(lookup),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg: lookup}, [self.lookup_kwarg_isnull]
+                ),
+                "display": f"{title} ({counts.get(lookup, 0)})",
+            }
+        if self.field.null:
+            empty_value_display = changelist.model_admin.get_empty_value_display()
+            yield {
+                "selected": bool(self.lookup_val_isnull),
+                "query_string": changelist.get_query_string(
+                    {self.lookup_kwarg_isnull: "True"}, [self.lookup_kwarg]
+                ),
+                "display": f"{empty_value_display} ({counts.get(None, 0)})",
+            }
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from django.db import models
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils.deconstruct import deconstructible
+from django.utils.translation import get_language
+
+from .fields import (
+    ChoiceField,
+    MemberLabel,
+    MemberName,
+    MemberTransform,
+    check_choice_field,
+)
+
+if TYPE_CHECKING:
+    from django.db.models.sql.compiler import SQLCompiler
+
+__all__ = ("ChoiceLabel", "ChoiceName", "ChoiceOrder")
+
+
+@deconstructible(path="choicefield.ChoiceOrder")
+class ChoiceOrder(models.Expression):
+    """
+    Rank of a `ChoiceField`'s member, by the enum's declaration order or by an
+    explicit `ordering` of members, for ordering rows in the database:
+
+        Order.objects.order_by(ChoiceOrder("status"), "-created")
+
+    Compiles to a `CASE` mapping every stored value to its rank. Values without a
+    rank come last, as does `NULL` unless `None` is part of `ordering`.
+    """
+
+    def __init__(self, field: str, ordering: Iterable[Any] | None = None) -> None:
+        super().__init__(output_field=models.PositiveSmallIntegerField())
+        self.name = field
+        self.ordering = tuple(ordering) if ordering is not None else None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, ordering={self.ordering!r})"
+
+    def resolve_expression(
+        self,
+        query: Any = None,
+        allow_joins: bool = True,  # noqa: FBT001,FBT002
+        reuse: Any = None,
+        summarize: bool = False,  # noqa: FBT001,FBT002
+        for_save: bool = False,  # noqa: FBT001,FBT002
+    ) -> Any:
+        column = models.F(self.name).resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
+        choice_field = check_choice_field(column.output_field, self.name)
+
+        if self.ordering is None:
+            members = list(choice_field.enum)
+        else:
+            members = list(
+                dict.fromkeys(choice_field.to_python(value) for value in self.ordering)
+            )
+        case = models.Case(
+            *(
+                models.When(**{self.name: member}, then=models.Value(rank))
+                for rank, member in enumerate(members)
+            ),
+            default=models.Value(len(members)),
+            output_field=self.output_field,
+        )
+        return case.resolve_expression(query, allow_joins, reuse, summarize, for_save)
+
+
+class ChoiceText(models.Expression):
+    """
+    Text of a `ChoiceField`'s member, compiled to a `CASE` over stored values. Texts
+    are resolved for the language active when the query is compiled, and the `CASE`
+    fragment is cached by enum and language. Values that aren't a member's are
+    `NULL`.
+    """
+
+    transform_class: ClassVar[type[MemberTransform]]
+    # Fragments following the column, with their parameters, by kind of text, enum,
+    # codes and language
+    fragments: ClassVar[dict[tuple[Any, ...], tuple[str, tuple[Any, ...]]]] = {}
+
+    def __init__(self, field: str) -> None:
+        super().__init__(output_field=models.CharField())
+        self.name = field
+        self.column: Any = models.F(field)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+    def get_source_expressions(self) -> list[Any]:
+        return [self.column]
+
+    def set_source_expressions(self, exprs: Sequence[Any]) -> None:
+        (self.column,) = exprs
+
+    def resolve_expression(
+        self,
+        query: Any = None,
+        allow_joins: bool = True,  # noqa: FBT001,FBT002
+        reuse: Any = None,
+        summarize: bool = False,  # noqa: FBT001,FBT002
+        for_save: bool = False,  # noqa: FBT001,FBT002
+    ) -> Any:
+        resolved = super().resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
+        check_choice_field(resolved.column.output_field, self.name)
+        return resolved
+
+    def fragment(self) -> tuple[str, tuple[Any, ...]]:
+        choice_field: ChoiceField = self.column.output_field
+        codes = tuple(choice_field.codes.items()) if choice_field.codes else None
+        key = (self.transform_class, choice_field.enum, codes, get_language())
+        try:
+            return self.fragments[key]
+        except KeyError:
+            pass
+        # Shares texts with lookups on names and labels
+        table = self.transform_class(self.column).match_table()
+        params: list[Any] = []
+        for member, text, __ in table:
+            params += (choice_field.get_prep_value(member), text)
+        fragment = (" ".join(["WHEN %s THEN %s"] * len(table)) + " END", tuple(params))
+        self.fragments[key] = fragment
+        return fragment
+
+    def as_sql(
+        self, compiler: SQLCompiler, connection: BaseDatabaseWrapper
+    ) -> tuple[str, list[Any]]:
+        column_sql, column_params = compiler.compile(self.column)
+        sql, params = self.fragment()
+        if not params:
+            return "NULL", []
+        return f"CASE {column_sql} {sql}", [*column_params, *params]
+
+
+@deconstructible(path="choicefield.ChoiceName")
+class ChoiceName(ChoiceText):
+    """
+    Name of a `ChoiceField`'s member:
+
+        Order.objects.values_list("id", ChoiceName("status"))
+    """
+
+    transform_class = MemberName
+
+
+@deconstructible(path="choicefield.ChoiceLabel")
+class ChoiceLabel(ChoiceText):
+    """
+    Label of a `ChoiceField`'s member, in the active language:
+
+        Order.objects.values_list("id", ChoiceLabel("status"))
+    """
+
+    transform_class = MemberLabel
@@ -1,26 +1,63 @@
 from __future__ import annotations
 
-from enum import Enum
+import itertools
+import logging
+import operator
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from enum import Enum, Flag
+from functools import partialmethod, reduce
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, Final, TypeVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, Final, TypeVar, cast
 
-from django.core.exceptions import ValidationError
-from django.db import models
+import django
+from django.apps import AppConfig, apps
+from django.core import checks
+from django.core.exceptions import EmptyResultSet, FieldError, ValidationError
+from django.db import models, router
 from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.operations import BaseDatabaseOperations
+from django.db.backends.utils import names_digest  # type: ignore[attr-defined]
 from django.db.models.enums import Choices
+from django.db.models.expressions import Col
 from django.db.models.fields import Field
-from django.db.models.lookups import Transform
-from django.forms import Field as FormField, TypedChoiceField
+from django.db.models.lookups import In, Lookup, Transform
+from django.forms import (
+    Field as FormField,
+    Select,
+    TypedChoiceField,
+    TypedMultipleChoiceField,
+)
+from django.forms.renderers import BaseRenderer, get_default_renderer
+from django.forms.widgets import ChoiceWidget
+from django.utils.safestring import SafeString, mark_safe
+from django.utils.translation import get_language
+
+try:
+    from django.utils.choices import BlankChoiceIterator
+except ImportError:  # pragma: no cover
+    # Django < 5.0 only ever passes lists of choices
+    BlankChoiceIterator = ()  # type: ignore[assignment,misc]
 
 if TYPE_CHECKING:
     from django.db.models.fields import _ChoicesList
+    from django.db.models.sql.compiler import SQLCompiler
 
-__all__ = ("ChoiceField", "Choice")
+__all__ = ("ChoiceField", "Choice", "FlagField", "MultiChoiceField", "UnknownChoice")
 
 
 T = TypeVar("T", bound=Enum)
 M = TypeVar("M", bound=models.Model)
 
+if TYPE_CHECKING:
+    AnyLookup = Lookup[Any]
+else:
+    # Lookups are only generic to type checkers
+    AnyLookup = Lookup
+
+logger = logging.getLogger("choicefield")
+
 
 supported_internal_types: Final = MappingProxyType[type, str](
     {
@@ -28,6 +65,156 @@ supported_internal_types: Final = MappingProxyType[type, str](
         str: "CharField",
     }
 )
+# Name of `CheckConstraint`'s condition argument, which used to be `check`
+check_argument: Final = "condition" if django.VERSION >= (5, 1) else "check"
+# Attribute of enum classes holding their `EnumMetadata`
+metadata_attribute: Final = "_choicefield_metadata"
+# Identifies choices of form fields and widgets, see `SharedChoices`
+choices_keys: Final = itertools.count()
+# Upper bound of entries kept in caches derived from form choices
+max_shared_choices: Final = 1024
+# Integer column types, from smallest to largest
+compact_integer_types: Final = (
+    "PositiveSmallIntegerField",
+    "SmallIntegerField",
+    "IntegerField",
+    "BigIntegerField",
+)
+
+
+def compact_integer_type(values: Iterable[int]) -> str:
+    """
+    Find the smallest integer column type able to store all the given values.
+    """
+    low, high = min(values), max(values)
+    for internal_type in compact_integer_types:
+        lower, upper = BaseDatabaseOperations.integer_field_ranges[internal_type]
+        if lower <= low and high <= upper:
+            return internal_type
+    return compact_integer_types[-1]
+
+
+def bitwise_and(connection: BaseDatabaseWrapper, lhs: str, rhs: str) -> str:
+    if connection.vendor == "oracle":
+        return f"BITAND({lhs}, {rhs})"
+    return f"({lhs} & {rhs})"
+
+
+def build_decode_table(enum: type[T], python_type: type) -> dict[Any, T | None]:
+    """
+    Index every canonical representation of the enum's members, mapping it to its
+    member. Makes decoding of the common case a single dict lookup.
+
+    Only representations that `ChoiceField.to_python` would resolve to the very same
+    member are included, anything else (including values an enum could accept via an
+    overridden `_missing_`) is left to the regular enum lookup.
+    """
+    table: dict[Any, T | None] = {None: None}
+    for member in enum:
+        table[member] = member
+        if not isinstance(member.value, python_type):
+            continue
+        table.setdefault(member.value, member)
+        if python_type is int:
+            # Integers might be passed in their string form, e.g. via forms
+            table.setdefault(str(member.value), member)
+    return table
+
+
+def build_encode_table(
+    decode_table: dict[Any, T | None], codes: Mapping[T, int] | None = None
+) -> dict[Any, Any]:
+    """
+    Invert a decode table, mapping every known representation of a member to the
+    value stored in the database. That's the member's value, unless it has a code.
+    """
+    if codes is None:
+        return {
+            key: member.value
+            for key, member in decode_table.items()
+            if member is not None
+        }
+    return {
+        key: codes[member] for key, member in decode_table.items() if member is not None
+    }
+
+
+class EnumMetadata:
+    """
+    Everything derived from an enum alone, computed once and shared by all fields of
+    the enum. Decode and encode tables are shared as well, so they must only ever be
+    extended with entries that hold for any field of the enum.
+    """
+
+    __slots__ = (
+        "choices",
+        "decode_table",
+        "encode_table",
+        "internal_type",
+        "python_type",
+        "stored_values",
+        "value_width",
+        "values",
+    )
+
+    def __init__(self, enum: type[Enum]) -> None:
+        self.values = tuple(member.value for member in enum)
+        self.python_type = type(next(iter(enum)).value)
+        try:
+            self.internal_type = supported_internal_types[self.python_type]
+        except KeyError as exc:
+            raise TypeError(
+                f"Enum with values of type {self.python_type.__name__!r}"
+                f" is not supported"
+            ) from exc
+        self.choices: tuple[tuple[Any, Any], ...] = (
+            tuple(cast(type[Choices], enum).choices)
+            if hasattr(enum, "choices")
+            else tuple((member.value, member.name) for member in enum)
+        )
+        self.decode_table = build_decode_table(enum, self.python_type)
+        self.encode_table = build_encode_table(self.decode_table)
+        self.stored_values = frozenset(self.encode_table[member] for member in enum)
+        self.value_width = max(
+            (len(value) for value in self.values if isinstance(value, str)), default=0
+        )
+
+
+def get_enum_metadata(enum: type[Enum]) -> EnumMetadata:
+    """
+    Metadata of an enum, kept on the enum class itself. Metadata refers to members,
+    which refer to their enum, so it can't be kept by a (weakly keyed) registry
+    without keeping every enum alive. On the class, it's dropped along with the enum.
+    """
+    try:
+        return enum.__dict__[metadata_attribute]  # type: ignore[no-any-return]
+    except KeyError:
+        metadata = EnumMetadata(enum)
+        setattr(enum, metadata_attribute, metadata)
+        return metadata
+
+
+def is_app_model(model: type[models.Model]) -> bool:
+    """
+    Whether a model is one declared by an app. Models rendered from migration state
+    already carry the options of its fields, as do the temporary models built by
+    schema editors, e.g. SQLite's table remake, which aren't part of any app.
+    """
+    return (
+        not model._meta.abstract
+        and model.__module__ != "__fake__"
+        and model._meta.app_config is not None
+    )
+
+
+def extend_meta_option(model: type[models.Model], name: str, items: list[Any]) -> None:
+    """
+    Add items to a list option of a model's Meta, as if they were declared on it.
+    """
+    # Meta's list might be shared with other models, e.g. via an abstract base
+    setattr(model._meta, name, [*getattr(model._meta, name), *items])
+    # Let migrations pick them up
+    model._meta.original_attrs[name] = getattr(model._meta, name)
 
 
 class Choice:
@@ -49,67 +236,495 @@ class Choice:
             )
 
         data = instance.__dict__
-        if not isinstance(data[self.field.attname], self.field.enum):
-            data[self.field.attname] = self.field.to_python(data[self.field.attname])
-
-        return data[self.field.attname]  # type: ignore[no-any-return]
+        value = data[self.field.attname]
+        if not isinstance(value, self.field.enum) and not isinstance(
+            value, unknown_types
+        ):
+            value = data[self.field.attname] = self.decode(value)
+        return value  # type: ignore[no-any-return]
 
     def __set__(self, instance: M, value: Any) -> None:
         instance.__dict__[self.field.attname] = self.field.to_python(value)
 
+    def decode(self, value: Any) -> Any:
+        return self.field.to_python(value)
+
+
+class LazyChoice(Choice):
+    """
+    Descriptor of a lazy `ChoiceField`, keeping values as is until first accessed.
+    """
+
+    __slots__ = ()
+
+    def __set__(self, instance: M, value: Any) -> None:
+        instance.__dict__[self.field.attname] = value
+
+    def decode(self, value: Any) -> Any:
+        # Values loaded from the database are kept as stored, as are assigned values
+        try:
+            return self.field._db_decode_table[value]
+        except (KeyError, TypeError):
+            pass
+        try:
+            return self.field.to_python(value)
+        except ValidationError:
+            return self.field._from_stored(value)
+
+
+class MultiChoice(Choice):
+    """
+    Descriptor of a `MultiChoiceField`, holding a `frozenset` of members.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: M | None, cls: type[M] | None = None) -> Any:
+        if instance is not None:
+            value = instance.__dict__.get(self.field.attname)
+            if isinstance(value, frozenset):
+                return value
+        return super().__get__(instance, cls)
+
+
+class UnknownChoice:
+    """
+    A value that isn't one of the enum's, e.g. one left in the database after its
+    member was removed, as converted by a field with `on_unknown="wrap"`. Saving it
+    stores the value as is.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"UnknownChoice({self.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, UnknownChoice):
+            return bool(self.value == other.value)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((UnknownChoice, self.value))
+
+
+class UnknownInt(int):
+    """
+    An integer that isn't one of the enum's, as loaded by a field with
+    `on_unknown="raw"`. It's equal to the integer as stored, while telling the
+    field that it was loaded rather than assigned.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> int:
+        return int(self)
+
+
+class UnknownStr(str):
+    """
+    A string that isn't one of the enum's, as loaded by a field with
+    `on_unknown="raw"`. See `UnknownInt`.
+    """
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return str(self)
+
+
+# Values that aren't one of the enum's, as converted by the `on_unknown` policy
+unknown_types: Final = (UnknownChoice, UnknownInt, UnknownStr)
+
 
 class ChoiceField(Field):  # type: ignore[type-arg]
     description = "A field storing an enum value"
     descriptor_class = Choice
     empty_strings_allowed = False
+    # Lookup matching rows of any of a list of members, see `MemberLookup`
+    members_lookup = "in"
+    # What to convert values that aren't one of the enum's into
+    unknown_policies = ("raise", "wrap", "raw")
+    # Upper bound of distinct unknown values counted
+    max_unknown_values = 1024
 
-    def __init__(self, enum: type[T], *args: Any, **kwargs: Any) -> None:
-        self.enum = enum
-        self._values = kwargs.pop("_values", None) or tuple(
-            member.value for member in self.enum
-        )
-        self.python_type = type(next(iter(self.enum)).value)
-        try:
-            self._internal_type = supported_internal_types[self.python_type]
-        except KeyError as exc:
+    def __init__(  # noqa: PLR0913
+        self,
+        enum: type[T],
+        *args: Any,
+        lazy: bool = False,
+        compact: bool = False,
+        headroom: int = 0,
+        codes: Mapping[Any, int] | None = None,
+        db_constraint: bool = False,
+        pin_values: bool = True,
+        on_unknown: str = "raise",
+        transitions: Mapping[Any, Iterable[Any]] | None = None,
+        partial_indexes: Iterable[Any] = (),
+        **kwargs: Any,
+    ) -> None:
+        if on_unknown not in self.unknown_policies:
             raise TypeError(
-                f"Enum with values of type {self.python_type.__name__!r}"
-                f" is not supported"
-            ) from exc
+                f"'on_unknown' must be one of: {', '.join(self.unknown_policies)}"
+            )
+        self.enum: type[Enum] = enum
+        self.lazy = lazy
+        self.db_constraint = db_constraint
+        self.pin_values = pin_values
+        self.on_unknown = on_unknown
+        # Number of conversions of values that aren't the enum's, by value
+        self.unknown_values: Counter[Any] = Counter()
+        self.compact = compact
+        self.headroom = headroom
+        if self.lazy:
+            self.descriptor_class = LazyChoice
+        metadata = get_enum_metadata(self.enum)
+        self._values = kwargs.pop("_values", None) or metadata.values
+        self.python_type = metadata.python_type
+        self._internal_type = metadata.internal_type
+        # Tables are shared by all fields of the enum, unless values are stored as
+        # codes
+        self._decode_table = metadata.decode_table
+        self.codes = self._pin_codes(codes) if codes is not None else None
+        if self.codes is None:
+            self._db_decode_table = self._decode_table
+            self._encode_table = metadata.encode_table
+            # Stored values of all members, i.e. the column's domain
+            self._stored_values = metadata.stored_values
+        else:
+            member_codes: dict[Any, int] = {
+                self._decode_table[value]: code
+                for value, code in self.codes.items()
+                if value in self._decode_table
+            }
+            self._db_decode_table = {
+                code: member for member, code in member_codes.items()
+            }
+            self._db_decode_table[None] = None
+            self._encode_table = build_encode_table(self._decode_table, member_codes)
+            # Codes of removed values are kept, so the column doesn't shrink
+            self._internal_type = compact_integer_type(self.codes.values())
+            self._stored_values = frozenset(
+                self._encode_table[member] for member in self.enum
+            )
+
+        # Column type of a compact integer field, as pinned in migrations by fields
+        # that don't pin their values
+        column_type = kwargs.pop("_column_type", None)
+        if self.compact and self._internal_type == "IntegerField":
+            self._internal_type = column_type or compact_integer_type(
+                self._typed_values
+            )
 
         kwargs.setdefault("choices", self.enum_to_choices(self.enum))
         if self._internal_type == "CharField":
-            kwargs.setdefault("max_length", 255)
+            kwargs.setdefault(
+                "max_length",
+                self.value_width + self.headroom if self.compact else 255,
+            )
         super().__init__(*args, **kwargs)
+        self._valid_choices_cache: tuple[Any, frozenset[Any]] = (None, frozenset())
+        self.transitions = (
+            self._build_transitions(transitions) if transitions is not None else None
+        )
+        self.partial_indexes = tuple(
+            self._option_member("partial_indexes", value) for value in partial_indexes
+        )
+        # Members allowed to transition to a member, by member
+        self._transition_sources: dict[Any, tuple[Enum, ...]] = {}
+        for source, targets in (self.transitions or {}).items():
+            for target in targets:
+                self._transition_sources.setdefault(target, ())
+                self._transition_sources[target] += (source,)
+
+    def _option_member(self, option: str, value: Any) -> Enum:
+        try:
+            member = self._decode_table[value]
+        except (KeyError, TypeError):
+            member = None
+        if member is None:
+            raise TypeError(
+                f"{value!r} in {option!r} is not a member of {self.enum.__qualname__}"
+            )
+        return member
+
+    def _build_transitions(
+        self, transitions: Mapping[Any, Iterable[Any]]
+    ) -> dict[Enum, frozenset[Enum]]:
+        return {
+            self._option_member("transitions", source): frozenset(
+                self._option_member("transitions", target) for target in targets
+            )
+            for source, targets in transitions.items()
+        }
+
+    def _pin_codes(self, codes: Mapping[Any, int]) -> dict[Any, int]:
+        if self.python_type is not str:
+            raise TypeError("Codes are only supported for string based enums")
+
+        # Codes are pinned by value, values that are no longer part of the enum are
+        # kept, so that their codes can't be reused.
+        pinned = {
+            member.value if isinstance(member, self.enum) else member: code
+            for member, code in codes.items()
+        }
+        missing = [member.name for member in self.enum if member.value not in pinned]
+        if missing:
+            raise TypeError(f"Missing codes for members: {', '.join(missing)}")
+        if len(set(pinned.values())) != len(pinned):
+            raise TypeError("Codes must be unique")
+        return dict(sorted(pinned.items(), key=lambda item: item[1]))
+
+    def contribute_to_class(
+        self,
+        cls: type[M],
+        name: str,
+        private_only: bool = False,  # noqa: FBT001,FBT002
+    ) -> None:
+        super().contribute_to_class(cls, name, private_only)
+        if self.db_constraint and is_app_model(cls):
+            self._contribute_constraint(cls)
+        if self.partial_indexes and is_app_model(cls):
+            self._contribute_partial_indexes(cls)
+        if self.transitions is not None and f"transition_{name}" not in cls.__dict__:
+            setattr(
+                cls,
+                f"transition_{name}",
+                partialmethod(transition_instance, field=self),
+            )
+
+    def _contribute_constraint(self, cls: type[M]) -> None:
+        db_table = cls._meta.db_table
+        # Named like partial indexes, within Django's limit of 30 characters
+        digest = names_digest(db_table, self.name, length=6)
+        condition: dict[str, Any] = {
+            check_argument: models.Q(
+                **{f"{self.name}__raw__in": sorted(self._stored_values)}
+            )
+        }
+        constraint = models.CheckConstraint(
+            name=f"{db_table[:11]}_{self.name[:7]}_{digest}_chk", **condition
+        )
+        extend_meta_option(cls, "constraints", [constraint])
+
+    def _contribute_partial_indexes(self, cls: type[M]) -> None:
+        db_table = cls._meta.db_table
+        indexes = []
+        for member in self.partial_indexes:
+            stored = self.get_prep_value(member)
+            # Named like Django names indexes, within its limit of 30 characters
+            digest = names_digest(db_table, self.name, str(stored), length=6)
+            indexes.append(
+                models.Index(
+                    fields=[self.name],
+                    name=f"{db_table[:11]}_{self.name[:7]}_{digest}_idx",
+                    condition=models.Q(**{f"{self.name}__raw": stored}),
+                )
+            )
+        extend_meta_option(cls, "indexes", indexes)
+
+    @property
+    def _valid_choices(self) -> frozenset[Any]:
+        """
+        Keys of the field's (flattened) choices, recomputed if choices are replaced.
+        """
+        choices, valid_choices = self._valid_choices_cache
+        if choices is not self.choices:
+            valid_choices = frozenset(key for key, __ in self.flatchoices)
+            self._valid_choices_cache = (self.choices, valid_choices)
+        return valid_choices
+
+    @property
+    def _typed_values(self) -> list[Any]:
+        return [value for value in self._values if isinstance(value, self.python_type)]
+
+    @property
+    def value_width(self) -> int:
+        """
+        Length of the longest value of a string based enum.
+        """
+        metadata = get_enum_metadata(self.enum)
+        if self._values == metadata.values:
+            return metadata.value_width
+        return max(len(value) for value in self._typed_values)
+
+    def _check_column_size(self) -> list[checks.CheckMessage]:
+        if self.compact or self.codes is not None:
+            return []
+        elif self._internal_type == "CharField":
+            if self.max_length is not None and self.max_length > self.value_width:
+                return [
+                    checks.Info(
+                        f"Column is sized for values of length {self.max_length}, "
+                        f"while the longest enum value has a length of "
+                        f"{self.value_width}.",
+                        hint="Pass compact=True to size the column by enum values.",
+                        obj=self,
+                        id="choicefield.I001",
+                    )
+                ]
+        elif self._internal_type == "IntegerField":
+            internal_type = compact_integer_type(self._typed_values)
+            if internal_type != self._internal_type:
+                return [
+                    checks.Info(
+                        f"Column of type {self._internal_type} is larger than needed "
+                        f"to store all enum values.",
+                        hint=f"Pass compact=True to store values as {internal_type}.",
+                        obj=self,
+                        id="choicefield.I002",
+                    )
+                ]
+        return []
 
     def enum_to_choices(self, enum: type[T]) -> _ChoicesList:
-        if hasattr(enum, "choices"):
-            return cast(type[Choices], enum).choices
-        return [(member.value, member.name) for member in enum]
+        return list(get_enum_metadata(enum).choices)
 
     def get_internal_type(self) -> str:
         return self._internal_type
 
-    def from_db_value(
-        self, value: Any, expression: Any, connection: Any
-    ) -> T | Any | None:
+    def from_db_value(self, value: Any, expression: Any, connection: Any) -> Any:
         if isinstance(expression, RawValue):
             return value
-        return self.to_python(value)
+        return self._from_stored(value)
+
+    def _from_stored(self, value: Any) -> Any:
+        """
+        Convert a value loaded from the database, applying the field's `on_unknown`
+        policy to values that aren't one of the enum's.
+        """
+        try:
+            return self._db_decode_table[value]
+        except (KeyError, TypeError):
+            pass
+        if self.codes is None:
+            try:
+                return self.to_python(value)
+            except ValidationError as exc:
+                error = exc
+        else:
+            error = ValidationError(
+                f"{value!r} is not a valid code of {self.enum.__qualname__}",
+                code="invalid",
+            )
+        return self._unknown(value, error)
+
+    def _to_stored(self, member: Any) -> Any:
+        try:
+            return self._encode_table[member]
+        except KeyError:
+            # Unknown values are stored as they were found
+            return getattr(member, "value", member)
+
+    def _unknown(self, value: Any, error: ValidationError) -> Any:
+        """
+        Count a value loaded from the database that isn't one of the enum's, and
+        convert it by the field's `on_unknown` policy.
+        """
+        try:
+            if (
+                value in self.unknown_values
+                or len(self.unknown_values) < self.max_unknown_values
+            ):
+                self.unknown_values[value] += 1
+                if self.unknown_values[value] == 1 and self.on_unknown != "raise":
+                    logger.warning("Unknown value %r of %s", value, self)
+        except TypeError:
+            # Unhashable values are never stored
+            pass
+
+        if self.on_unknown == "raise":
+            raise error
+        elif self.on_unknown == "wrap":
+            return UnknownChoice(value)
+        elif type(value) is int:
+            return UnknownInt(value)
+        elif type(value) is str:
+            return UnknownStr(value)
+        return value
+
+    def get_col(self, alias: str, output_field: Any = None) -> Col:
+        if self.lazy:
+            return LazyCol(alias, self, output_field)
+        return super().get_col(alias, output_field)
+
+    def get_db_converters(
+        self, connection: BaseDatabaseWrapper
+    ) -> list[Callable[..., Any]]:
+        # Specialise the conversion of database values once per query, instead of
+        # going through `from_db_value` for each and every row. Raw values never
+        # get here, as `RawValue` opts out of the field's converters.
+        decode_table = self._db_decode_table
+        from_stored = self._from_stored
+
+        def convert(value: Any, expression: Any, connection: Any) -> Any:
+            try:
+                return decode_table[value]
+            except KeyError:
+                return from_stored(value)
+
+        return [convert]
+
+    def to_python(self, value: Any) -> Any:
+        try:
+            return self._decode_table[value]
+        except (KeyError, TypeError):
+            # Not a known representation (or unhashable), resolve it via the enum
+            pass
 
-    def to_python(self, value: Any) -> T | None:
         if isinstance(value, self.enum) or value is None:
             return value
+        elif isinstance(value, unknown_types):
+            # Values loaded by the `on_unknown` policy, which only ever applies to
+            # values from the database
+            return value
         try:
             return self.enum(self.python_type(value))
         except (ValueError, TypeError) as exc:
             raise ValidationError(str(exc), code="invalid") from exc
 
+    def check_transitions(self, transitions: Mapping[Any, Any]) -> None:
+        """
+        Raise a `ValidationError` for any transition the field's graph doesn't
+        allow. Fields without a graph allow any transition.
+        """
+        if self.transitions is None:
+            return
+        invalid = [
+            (source, target)
+            for source, target in transitions.items()
+            if target not in self.transitions.get(source, ())
+        ]
+        if invalid:
+            raise ValidationError(
+                "Transitions not allowed: %(transitions)s",
+                code="invalid_transition",
+                params={
+                    "transitions": ", ".join(
+                        f"{source.name} -> {getattr(target, 'name', target)}"
+                        for source, target in invalid
+                    )
+                },
+            )
+
     def validate(self, value: Any, model_instance: M | None) -> None:
         if isinstance(value, self.enum):
             # Run validation on enum value instead of enum instance
             # (helps out with validation against `choices`)
             value = value.value
+        try:
+            valid = value not in self.empty_values and value in self._valid_choices
+        except TypeError:
+            valid = False
+        if valid:
+            # Like `Field.validate` does for a matching choice, only without walking
+            # all of them. Anything else gets the exact same treatment.
+            return
         super().validate(value, model_instance)
 
     def formfield(self, *args: Any, **kwargs: Any) -> FormField:
@@ -117,9 +732,14 @@ class ChoiceField(Field):  # type: ignore[type-arg]
         return super().formfield(*args, **kwargs)
 
     def get_prep_value(self, value: Any) -> Any:
+        try:
+            return self._encode_table[value]
+        except (KeyError, TypeError):
+            pass
+
         value = self.to_python(super().get_prep_value(value))
-        if isinstance(value, self.enum):
-            return value.value
+        if value is not None:
+            return self._to_stored(value)
         return value
 
     def get_db_prep_value(
@@ -128,36 +748,938 @@ class ChoiceField(Field):  # type: ignore[type-arg]
         connection: BaseDatabaseWrapper,
         prepared: bool = False,  # noqa: FBT001,FBT002
     ) -> Any:
+        # There's no backend specific adaptation of stored values, so a known
+        # member (or value) encodes the same way whether it's prepared or not.
+        try:
+            return self._encode_table[value]
+        except (KeyError, TypeError):
+            pass
+
         prepared_value = super().get_db_prep_value(value, connection, prepared)
         if prepared_value is None and not self.null:
             raise ValidationError(self.error_messages["null"], code="null")
         elif isinstance(prepared_value, self.enum):
-            prepared_value = prepared_value.value
+            prepared_value = self._to_stored(prepared_value)
 
         return prepared_value
 
+    def encode_many(self, values: Iterable[Any]) -> list[Any]:
+        """
+        Prepare many values for the database in one go, e.g. ahead of bulk writes.
+        """
+        encode_table = self._encode_table
+        get_prep_value = self.get_prep_value
+        encoded = []
+        for value in values:
+            try:
+                encoded.append(encode_table[value])
+            except (KeyError, TypeError):
+                encoded.append(get_prep_value(value))
+        return encoded
+
     def value_to_string(self, obj: M) -> Any:
-        value = self.value_from_object(obj)
-        return self.get_prep_value(value)
+        # Serialize enum values, which aren't necessarily what's stored
+        value = self.to_python(self.value_from_object(obj))
+        if isinstance(value, (self.enum, *unknown_types)):
+            return value.value
+        return value
 
     def deconstruct(self) -> tuple[str, str, Any, Any]:
         name, path, args, kwargs = super().deconstruct()
-        if path == "choicefield.fields.ChoiceField":  # pragma: no branch
-            path = "choicefield.ChoiceField"
+        if path.startswith("choicefield.fields."):  # pragma: no branch
+            path = path.replace("choicefield.fields.", "choicefield.", 1)
         kwargs.pop("choices", None)
         kwargs["enum"] = self.enum
-        kwargs["_values"] = self._values
+        if self.pin_values:
+            kwargs["_values"] = self._values
+        else:
+            # Only what decides the column is kept, the autodetector then ignores
+            # changes of members that don't alter it
+            kwargs["pin_values"] = False
+            if self.compact and self.python_type is int:
+                kwargs["_column_type"] = self._internal_type
+        for option, default in (
+            ("lazy", False),
+            ("compact", False),
+            ("headroom", 0),
+            ("codes", None),
+            ("db_constraint", False),
+            ("on_unknown", "raise"),
+        ):
+            value = getattr(self, option)
+            if value != default:
+                kwargs[option] = value
+        # Transitions don't alter the column, and are left out of migrations. So are
+        # partial indexes, which are kept by the model's state instead.
         return name, path, args, kwargs
 
 
+def transition_instance(instance: M, target: Any, *, field: ChoiceField) -> bool:
+    """
+    Move an instance to a member, as `transition_<name>` of models with a field
+    declaring `transitions`. The row is updated only if it's currently at a member
+    allowed to transition to the target, so that concurrent transitions don't need
+    to lock it: whichever comes first wins, and the others find nothing to update.
+    The instance's value is only changed by a successful transition.
+    """
+    member = field.to_python(target)
+    sources = field._transition_sources.get(member)
+    if not sources:
+        raise ValidationError(
+            "No transitions to %(target)s are allowed",
+            code="invalid_transition",
+            params={"target": getattr(member, "name", member)},
+        )
+    if instance.pk is None:
+        raise ValueError(
+            f"Can't transition {type(instance).__qualname__!r} instance without a "
+            f"primary key"
+        )
+    db = instance._state.db or router.db_for_write(type(instance), instance=instance)
+    updated = (
+        type(instance)
+        ._base_manager.using(db)
+        .filter(pk=instance.pk, **{f"{field.name}__in": sources})
+        .update(**{field.name: member})
+    )
+    if updated:
+        instance.__dict__[field.attname] = member
+    return bool(updated)
+
+
+def check_choice_field(field: Any, name: str) -> ChoiceField:
+    """
+    The field, if it's a plain `ChoiceField`, i.e. neither a flag nor a multi choice
+    field.
+    """
+    if not isinstance(field, ChoiceField) or isinstance(
+        field, (FlagField, MultiChoiceField)
+    ):
+        raise TypeError(f"{name!r} is not a ChoiceField")
+    return field
+
+
+@checks.register("choicefield", deploy=True)
+def check_column_sizes(
+    app_configs: Sequence[AppConfig] | None = None, **kwargs: Any
+) -> list[checks.CheckMessage]:
+    """
+    Report columns of choice fields that are larger than their enum needs. Opt-in,
+    via `manage.py check --deploy --tag choicefield`, as it's a hint rather than a
+    problem.
+    """
+    if app_configs is None:
+        app_configs = list(apps.get_app_configs())
+    return [
+        message
+        for app_config in app_configs
+        for model in app_config.get_models()
+        for field in model._meta.local_fields
+        if isinstance(field, ChoiceField)
+        for message in field._check_column_size()
+    ]
+
+
 @ChoiceField.register_lookup
 class RawValue(Transform):
     lookup_name = "raw"
     template = "%(expressions)s"
 
+    def get_db_converters(self, connection: BaseDatabaseWrapper) -> list[Any]:
+        # Leave stored values as is
+        return []
+
+
+@ChoiceField.register_lookup
+class ChoiceIn(In):
+    """
+    `in` lookup rewriting lists of values by what's known about the column's domain.
+    Values spanning a contiguous range of integers are compared as a range, and when
+    the domain is enforced by a database constraint, all members are compared as not
+    null and most members by their (shorter) complement.
+    """
+
+    # Smallest number of values to compare as a range
+    min_range_size = 3
+
+    def get_prep_lookup(self) -> Any:
+        if isinstance(self.lhs, RawValue):
+            # Raw values are compared as stored
+            self.prepare_rhs = False
+        elif self.prepare_rhs and self._has_values(self.rhs):
+            return self.lhs.output_field.encode_many(self.rhs)
+        return super().get_prep_lookup()
+
+    @staticmethod
+    def _has_values(rhs: Any) -> bool:
+        return isinstance(rhs, (list, tuple, set, frozenset)) and not any(
+            hasattr(value, "resolve_expression") for value in rhs
+        )
+
+    def as_sql(
+        self, compiler: SQLCompiler, connection: BaseDatabaseWrapper
+    ) -> tuple[str, list[Any]]:
+        if isinstance(self.lhs, RawValue) or not self._has_values(self.rhs):
+            # Database constraints are defined by raw values, and can't rely on
+            # themselves
+            return super().as_sql(compiler, connection)
+        try:
+            values = frozenset(self.rhs) - {None}
+        except TypeError:
+            return super().as_sql(compiler, connection)
+        if not values:
+            raise EmptyResultSet
+
+        field = self.lhs.output_field
+        domain = field._stored_values if field.db_constraint else None
+        lhs_sql, params = self.process_lhs(compiler, connection)
+        # NULL never matches a list of values, nor its complement or a range
+        if domain is not None and values >= domain:
+            return f"{lhs_sql} IS NOT NULL", params
+        elif (
+            len(values) >= self.min_range_size
+            and all(type(value) is int for value in values)
+            and max(values) - min(values) + 1 == len(values)
+        ):
+            return f"{lhs_sql} BETWEEN %s AND %s", [*params, min(values), max(values)]
+        elif domain is not None and values <= domain:
+            complement = sorted(domain - values)
+            if len(complement) < len(values):
+                placeholders = ", ".join(["%s"] * len(complement))
+                return f"{lhs_sql} NOT IN ({placeholders})", [*params, *complement]
+        return super().as_sql(compiler, connection)
+
+
+class MemberTransform(Transform):
+    """
+    Matches members by their name or label, in Python, instead of in the database.
+    Lookups on it resolve to the members they match and compile to the field's lookup
+    of a list of members, using the column as is.
+    """
+
+    output_field = models.CharField()
+    # Texts of members by enum, attribute and language
+    match_tables: ClassVar[
+        dict[tuple[Any, str, str | None], tuple[tuple[Enum, str, str], ...]]
+    ] = {}
+
+    @property
+    def choice_field(self) -> ChoiceField:
+        return cast(ChoiceField, self.lhs.output_field)
+
+    def texts(self, enum: type[Enum]) -> Iterable[tuple[Enum, str]]:
+        raise NotImplementedError
+
+    def match_table(self) -> tuple[tuple[Enum, str, str], ...]:
+        """
+        Members along with their text and casefolded text, for the active language.
+        """
+        enum = self.choice_field.enum
+        key = (enum, self.lookup_name, get_language())
+        try:
+            return self.match_tables[key]
+        except KeyError:
+            pass
+        table = tuple(
+            (member, str(text), str(text).casefold())
+            for member, text in self.texts(enum)
+        )
+        self.match_tables[key] = table
+        return table
+
+    def as_sql(
+        self,
+        compiler: SQLCompiler,
+        connection: BaseDatabaseWrapper,
+        *args: Any,
+        **kwargs: Any,
+    ) -> tuple[str, list[Any]]:
+        raise FieldError(
+            f"{self.lookup_name!r} of a ChoiceField can only be used by lookups"
+        )
+
+
+@ChoiceField.register_lookup
+class MemberName(MemberTransform):
+    lookup_name = "name"
+
+    def texts(self, enum: type[Enum]) -> Iterable[tuple[Enum, str]]:
+        return ((member, member.name) for member in enum)
+
+
+@ChoiceField.register_lookup
+class MemberLabel(MemberTransform):
+    lookup_name = "label"
+
+    def texts(self, enum: type[Enum]) -> Iterable[tuple[Enum, str]]:
+        labels = dict(self.choice_field.enum_to_choices(enum))
+        return (
+            (member, labels[member.value]) for member in enum if member.value in labels
+        )
+
+
+class MemberLookup(AnyLookup):
+    """
+    Compares names or labels of members with the given text, in Python.
+    """
+
+    prepare_rhs = False
+    # Whether texts are compared casefolded
+    case_insensitive = False
+
+    def get_prep_lookup(self) -> Any:
+        if hasattr(self.rhs, "resolve_expression"):
+            raise TypeError(
+                f"{self.lookup_name!r} of {self.lhs.lookup_name!r} requires a value"
+            )
+        return self.prepare(str(self.rhs))
+
+    def prepare(self, value: str) -> Any:
+        return value.casefold() if self.case_insensitive else value
+
+    def match(self, text: str, value: Any) -> bool:
+        raise NotImplementedError
+
+    def as_sql(
+        self, compiler: SQLCompiler, connection: BaseDatabaseWrapper
+    ) -> tuple[str, list[Any]]:
+        transform = self.lhs
+        column, field = transform.lhs, transform.lhs.output_field
+        members = [
+            member
+            for member, text, folded in transform.match_table()
+            if self.match(folded if self.case_insensitive else text, self.rhs)
+        ]
+        if not members:
+            raise EmptyResultSet
+        lookup = field.get_lookup(field.members_lookup)(column, members)
+        return compiler.compile(lookup)
+
+
+@MemberTransform.register_lookup
+class MemberExact(MemberLookup):
+    lookup_name = "exact"
+
+    def match(self, text: str, value: Any) -> bool:
+        return bool(text == value)
+
+
+@MemberTransform.register_lookup
+class MemberIExact(MemberExact):
+    lookup_name = "iexact"
+    case_insensitive = True
+
+
+@MemberTransform.register_lookup
+class MemberContains(MemberLookup):
+    lookup_name = "contains"
+
+    def match(self, text: str, value: Any) -> bool:
+        return value in text
+
+
+@MemberTransform.register_lookup
+class MemberIContains(MemberContains):
+    lookup_name = "icontains"
+    case_insensitive = True
+
+
+@MemberTransform.register_lookup
+class MemberStartsWith(MemberLookup):
+    lookup_name = "startswith"
+
+    def match(self, text: str, value: Any) -> bool:
+        return text.startswith(value)
+
+
+@MemberTransform.register_lookup
+class MemberIStartsWith(MemberStartsWith):
+    lookup_name = "istartswith"
+    case_insensitive = True
+
+
+@MemberTransform.register_lookup
+class MemberEndsWith(MemberLookup):
+    lookup_name = "endswith"
+
+    def match(self, text: str, value: Any) -> bool:
+        return text.endswith(value)
+
+
+@MemberTransform.register_lookup
+class MemberIEndsWith(MemberEndsWith):
+    lookup_name = "iendswith"
+    case_insensitive = True
+
+
+@MemberTransform.register_lookup
+class MemberRegex(MemberLookup):
+    lookup_name = "regex"
+
+    def prepare(self, value: str) -> Any:
+        return re.compile(value, re.IGNORECASE if self.case_insensitive else 0)
+
+    def match(self, text: str, value: Any) -> bool:
+        return value.search(text) is not None
+
+
+@MemberTransform.register_lookup
+class MemberIRegex(MemberRegex):
+    lookup_name = "iregex"
+    case_insensitive = True
+
+
+@MemberTransform.register_lookup
+class MemberIn(MemberLookup):
+    lookup_name = "in"
+
+    def get_prep_lookup(self) -> Any:
+        if isinstance(self.rhs, str) or not isinstance(self.rhs, Iterable):
+            raise TypeError(f"'in' of {self.lhs.lookup_name!r} requires an iterable")
+        if any(hasattr(value, "resolve_expression") for value in self.rhs):
+            raise TypeError(f"'in' of {self.lhs.lookup_name!r} requires values")
+        return frozenset(str(value) for value in self.rhs)
+
+    def match(self, text: str, value: Any) -> bool:
+        return text in value
+
+
+class FlagField(ChoiceField):
+    """
+    A field storing any combination of `enum.Flag` members, as a single integer.
+    """
+
+    description = "A field storing a combination of enum flags"
+    members_lookup = "has_any"
+    # Upper bound of combinations remembered by the decode table
+    max_decoded_combinations = 1024
+
+    def __init__(self, enum: type[T], *args: Any, **kwargs: Any) -> None:
+        if not issubclass(enum, Flag):
+            raise TypeError(f"{enum.__qualname__!r} is not a subclass of enum.Flag")
+        for option in ("db_constraint", "transitions", "partial_indexes"):
+            if kwargs.get(option):
+                raise TypeError(f"{option!r} isn't supported by FlagField")
+        if kwargs.get("on_unknown", "raise") != "raise":
+            raise TypeError("'on_unknown' isn't supported by FlagField")
+        # Combinations aren't listed as choices
+        kwargs.setdefault("choices", None)
+        super().__init__(enum, *args, **kwargs)
+
+    @property
+    def _typed_values(self) -> list[Any]:
+        return [0, reduce(operator.or_, super()._typed_values, 0)]
+
+    def to_python(self, value: Any) -> Any:
+        try:
+            return self._decode_table[value]
+        except (KeyError, TypeError):
+            pass
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return reduce(operator.or_, map(self.to_python, value), self.enum(0))
+
+        member = super().to_python(value)
+        if (
+            member is not None
+            and len(self._decode_table) < self.max_decoded_combinations
+        ):
+            # Remember combinations as they're seen, there's (at most) 2^n of them
+            self._decode_table[member] = self._decode_table[member.value] = member
+            self._encode_table[member] = self._encode_table[member.value] = member.value
+        return member
+
+    def formfield(self, *args: Any, **kwargs: Any) -> FormField:
+        kwargs.setdefault("form_class", FlagFormField)
+        kwargs.setdefault(
+            "choices",
+            [
+                (value, label)
+                for value, label in self.enum_to_choices(self.enum)
+                if value
+            ],
+        )
+        kwargs.setdefault("coerce", self.to_python)
+        return super().formfield(*args, **kwargs)
+
+
+class FlagLookup(AnyLookup):
+    """
+    Compares bits of stored flags with the given flags, by bitwise AND.
+    """
+
+    # Compares `bits`, being the bitwise AND of stored flags and given flags
+    template: str
+
+    def as_sql(
+        self, compiler: SQLCompiler, connection: BaseDatabaseWrapper
+    ) -> tuple[str, list[Any]]:
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        bits = bitwise_and(connection, lhs_sql, rhs_sql)
+        sql = self.template % {"bits": bits, "rhs": rhs_sql}
+        params = [*lhs_params, *rhs_params]
+        if "%(rhs)s" in self.template:
+            params.extend(rhs_params)
+        return sql, params
+
+
+# Combinations aren't part of the enum's domain
+FlagField.register_lookup(In)
+
+
+@FlagField.register_lookup
+class HasAny(FlagLookup):
+    lookup_name = "has_any"
+    template = "%(bits)s <> 0"
+
+
+@FlagField.register_lookup
+class HasAll(FlagLookup):
+    lookup_name = "has_all"
+    template = "%(bits)s = %(rhs)s"
+
+
+@FlagField.register_lookup
+class HasNone(FlagLookup):
+    lookup_name = "has_none"
+    template = "%(bits)s = 0"
+
+
+class MultiChoiceField(ChoiceField):
+    """
+    A field storing a set of enum members, either as a bitmask of the members or as a
+    sorted, delimited string of their values.
+    """
+
+    description = "A field storing a set of enum values"
+    descriptor_class = MultiChoice
+    members_lookup = "overlaps"
+    storages = ("bitmask", "delimited")
+    # Number of bits available to a bitmask, which fits all of them in a
+    # `BigIntegerField`
+    max_bitmask_members = 63
+    # Upper bound of sets remembered by the decode table
+    max_decoded_combinations = 1024
+
+    def __init__(
+        self,
+        enum: type[T],
+        *args: Any,
+        storage: str | None = None,
+        delimiter: str = ",",
+        bits: Mapping[Any, int] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        for option in (
+            "lazy",
+            "codes",
+            "db_constraint",
+            "transitions",
+            "partial_indexes",
+        ):
+            if kwargs.get(option):
+                raise TypeError(f"{option!r} isn't supported by MultiChoiceField")
+        if kwargs.get("on_unknown", "raise") != "raise":
+            raise TypeError("'on_unknown' isn't supported by MultiChoiceField")
+        values = kwargs.get("_values") or get_enum_metadata(enum).values
+        self.storage = self._pick_storage(storage, values, delimiter, bits)
+        self.delimiter = delimiter
+
+        # Sets aren't listed as choices, and the column is sized by the enum
+        kwargs.setdefault("choices", None)
+        if self.storage == "delimited":
+            kwargs.setdefault(
+                "max_length", len(self._join(values)) + kwargs.get("headroom", 0)
+            )
+        else:
+            kwargs.setdefault("max_length", None)
+        super().__init__(enum, *args, **kwargs)
+
+        self.bits = self._pin_bits(bits) if bits is not None else None
+        # Bits of members, by their pinned value and never by their position
+        self._bits = (
+            {member: 1 << self.bits[member.value] for member in self.enum}
+            if self.bits is not None
+            else {}
+        )
+        empty = 0 if self.storage == "bitmask" else ""
+        self._db_decode_table: dict[Any, frozenset[Enum] | None] = {  # type: ignore[assignment]
+            None: None,
+            empty: frozenset(),
+        }
+        self._encode_table = {frozenset(): empty}
+        if self.bits is not None:
+            # Bits of removed values are kept, so the column doesn't shrink
+            self._internal_type = compact_integer_type(
+                [0, sum(1 << bit for bit in self.bits.values())]
+            )
+        else:
+            self._internal_type = "CharField"
+
+    def _pick_storage(
+        self,
+        storage: str | None,
+        values: tuple[Any, ...],
+        delimiter: str,
+        bits: Mapping[Any, int] | None,
+    ) -> str:
+        if storage is None:
+            return "bitmask" if bits is not None else "delimited"
+        elif storage not in self.storages:
+            raise TypeError(f"Storage must be one of: {', '.join(self.storages)}")
+        elif storage == "bitmask" and bits is None:
+            raise TypeError("Bitmask storage requires 'bits' for members")
+        elif storage == "delimited" and bits is not None:
+            raise TypeError("'bits' are only supported by bitmask storage")
+        elif storage == "delimited" and any(delimiter in str(v) for v in values):
+            raise TypeError(f"Enum values can't contain the delimiter {delimiter!r}")
+        return storage
+
+    def _pin_bits(self, bits: Mapping[Any, int]) -> dict[Any, int]:
+        # Like codes, bits are pinned by value and values that are no longer part of
+        # the enum are kept, so that their bits can't be reused.
+        pinned = {
+            member.value if isinstance(member, self.enum) else member: bit
+            for member, bit in bits.items()
+        }
+        missing = [member.name for member in self.enum if member.value not in pinned]
+        if missing:
+            raise TypeError(f"Missing bits for members: {', '.join(missing)}")
+        if len(set(pinned.values())) != len(pinned):
+            raise TypeError("Bits must be unique")
+        if not all(0 <= bit < self.max_bitmask_members for bit in pinned.values()):
+            raise TypeError(
+                f"Bits must be between 0 and {self.max_bitmask_members - 1}"
+            )
+        return dict(sorted(pinned.items(), key=lambda item: item[1]))
+
+    def _join(self, values: Iterable[Any]) -> str:
+        # Values are wrapped in delimiters, making every value matchable by pattern
+        values = sorted(values)
+        if not values:
+            return ""
+        delimiter = self.delimiter
+        return delimiter + delimiter.join(map(str, values)) + delimiter
+
+    def _check_column_size(self) -> list[checks.CheckMessage]:
+        return []
+
+    def _remember(self, stored: Any, members: frozenset[Enum]) -> None:
+        if len(self._encode_table) < self.max_decoded_combinations:
+            self._db_decode_table[stored] = members
+            self._encode_table[members] = stored
+
+    def _from_stored(self, value: Any) -> Any:
+        try:
+            return self._db_decode_table[value]
+        except (KeyError, TypeError):
+            pass
+
+        if self.storage == "bitmask":
+            if not isinstance(value, int) or value & ~sum(self._bits.values()):
+                raise ValidationError(
+                    f"{value!r} is not a valid bitmask of {self.enum.__qualname__}",
+                    code="invalid",
+                )
+            members = frozenset(
+                member for member, bit in self._bits.items() if value & bit
+            )
+        else:
+            to_member = super().to_python
+            members = frozenset(
+                to_member(value) for value in str(value).split(self.delimiter) if value
+            )
+        self._remember(value, members)
+        return members
+
+    def _to_stored(self, members: frozenset[Enum]) -> Any:
+        try:
+            return self._encode_table[members]
+        except KeyError:
+            pass
+
+        if self.storage == "bitmask":
+            stored: Any = sum(self._bits[member] for member in members)
+        else:
+            stored = self._join(member.value for member in members)
+        self._remember(stored, members)
+        return stored
+
+    def to_python(self, value: Any) -> Any:
+        if isinstance(value, frozenset):
+            # Trust sets of members, such as the ones decoded from the database
+            if value in self._encode_table:
+                return value
+        elif isinstance(value, self.enum):
+            return frozenset((value,))
+        elif isinstance(value, int if self.storage == "bitmask" else str):
+            return self._from_stored(value)
+        elif value is None:
+            return None
+
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            value = (value,)
+        members = frozenset(map(super().to_python, value))
+        if None in members:
+            raise ValidationError(
+                f"Sets of {self.enum.__qualname__} can't contain None", code="invalid"
+            )
+        return members
+
+    def validate(self, value: Any, model_instance: M | None) -> None:
+        super().validate(value, model_instance)
+        if not self.blank and value == frozenset():
+            raise ValidationError(self.error_messages["blank"], code="blank")
+
+    def formfield(self, *args: Any, **kwargs: Any) -> FormField:
+        kwargs.setdefault("form_class", MultiChoiceFormField)
+        kwargs.setdefault("choices", self.enum_to_choices(self.enum))
+        kwargs.setdefault("coerce", super().to_python)
+        return super().formfield(*args, **kwargs)
+
+    def value_to_string(self, obj: M) -> Any:
+        value = self.to_python(self.value_from_object(obj))
+        if value is None:
+            return value
+        return sorted(member.value for member in value)
+
+    def deconstruct(self) -> tuple[str, str, Any, Any]:
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["storage"] = self.storage
+        if self.delimiter != ",":
+            kwargs["delimiter"] = self.delimiter
+        if self.bits is not None:
+            kwargs["bits"] = self.bits
+        return name, path, args, kwargs
+
+
+class MultiChoiceLookup(AnyLookup):
+    """
+    Matches stored sets containing all, or any, of the given members.
+    """
+
+    prepare_rhs = False
+    # Whether all given members need to be contained, or any of them
+    match_all: bool
+
+    def get_prep_lookup(self) -> Any:
+        return self.lhs.output_field.to_python(self.rhs)
+
+    def as_sql(
+        self, compiler: SQLCompiler, connection: BaseDatabaseWrapper
+    ) -> tuple[str, list[Any]]:
+        field = self.lhs.output_field
+        if not self.rhs and not self.match_all:
+            raise EmptyResultSet
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        if not self.rhs:
+            # Every set contains no members
+            return f"{lhs_sql} IS NOT NULL", lhs_params
+        if field.storage == "bitmask":
+            mask = field._to_stored(self.rhs)
+            bits = bitwise_and(connection, lhs_sql, "%s")
+            if self.match_all:
+                return f"{bits} = %s", [*lhs_params, mask, mask]
+            return f"{bits} <> 0", [*lhs_params, mask]
+
+        conditions, params = [], []
+        for member in self.rhs:
+            joined = field._join([member.value])
+            if connection.vendor == "sqlite":
+                # SQLite's LIKE ignores case
+                conditions.append(f"INSTR({lhs_sql}, %s) > 0")
+                params.extend([*lhs_params, joined])
+            else:
+                pattern = connection.ops.prep_for_like_query(joined)
+                conditions.append(
+                    f"{lhs_sql} {connection.operators['contains'] % '%s'}"
+                )
+                params.extend([*lhs_params, f"%{pattern}%"])
+        connector = " AND " if self.match_all else " OR "
+        return f"({connector.join(conditions)})", params
+
+
+MultiChoiceField.register_lookup(In)
+
+
+@MultiChoiceField.register_lookup
+class Contains(MultiChoiceLookup):
+    lookup_name = "contains"
+    match_all = True
+
+
+@MultiChoiceField.register_lookup
+class Overlaps(MultiChoiceLookup):
+    lookup_name = "overlaps"
+    match_all = False
+
+
+class LazyCol(Col):
+    """
+    Column of a lazy `ChoiceField`. Values selected to populate model instances are
+    left as stored, for the field's descriptor to decode on first access, while any
+    other selection of it (e.g. via `.values()`) is decoded as usual.
+    """
+
+    populates_instances = False
+
+    def select_format(
+        self, compiler: SQLCompiler, sql: str, params: Any
+    ) -> tuple[str, Any]:
+        query = compiler.query
+        # A column instance is either part of the model's default columns, which are
+        # recreated for each compilation, or it's a selection of its own.
+        self.populates_instances = query.default_cols and not any(
+            self is annotation for annotation in query.annotation_select.values()
+        )
+        return super().select_format(  # type: ignore[misc,no-any-return]
+            compiler, sql, params
+        )
+
+    def get_db_converters(self, connection: BaseDatabaseWrapper) -> list[Any]:
+        if self.populates_instances:
+            return []
+        return super().get_db_converters(connection)
+
+
+def flat_choice_keys(choices: Iterable[Any]) -> Iterable[Any]:
+    for key, label in choices:
+        if isinstance(label, (list, tuple)):
+            yield from (group_key for group_key, __ in label)
+        else:
+            yield key
+
+
+class SharedChoices:
+    """
+    Identifies the choices of a form field or widget across its (deep) copies, as made
+    for every form instance, letting them share whatever is derived from the choices.
+    Only lists and tuples of choices are identified, as e.g. callables can change.
+    """
+
+    _keyed_choices: Any = None
+    _choices_key: int = -1
+    choices: Any
+
+    def choices_key(self) -> int | None:
+        choices = self.choices
+        while isinstance(choices, BlankChoiceIterator):
+            choices = choices.choices
+        if not isinstance(choices, (list, tuple)):
+            return None
+        elif self._keyed_choices is not self.choices:
+            self._keyed_choices = self.choices
+            self._choices_key = next(choices_keys)
+        return self._choices_key
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        key = self.choices_key()
+        obj = super().__deepcopy__(memo)  # type: ignore[misc]
+        if key is not None:
+            # Copied choices are equal to the original ones
+            obj._keyed_choices, obj._choices_key = obj.choices, key
+        return obj
+
+
+def remember(cache: dict[Any, Any], key: Any, value: Any) -> Any:
+    if len(cache) >= max_shared_choices:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+class ChoiceSelect(SharedChoices, Select):
+    """
+    Select widget rendering its options once per choices, language and selected value,
+    instead of once per form. The rest of the widget renders as usual.
+    """
+
+    # Options are rendered right before the closing tag
+    closing_tag = "\n</select>"
+    # Rendered options, by key of choices, renderer, language and selected values
+    rendered_options: ClassVar[dict[Any, str]] = {}
+
+    def render(
+        self,
+        name: str,
+        value: Any,
+        attrs: dict[str, Any] | None = None,
+        renderer: BaseRenderer | None = None,
+    ) -> SafeString:
+        choices_key = self.choices_key()
+        if (
+            choices_key is None
+            or self.allow_multiple_selected
+            # Other templates might render options by name or attributes
+            or self.option_template_name != Select.option_template_name
+        ):
+            return super().render(name, value, attrs, renderer)
+
+        renderer = renderer or get_default_renderer()
+        key = (choices_key, renderer, get_language(), tuple(self.format_value(value)))
+        try:
+            options = self.rendered_options[key]
+        except KeyError:
+            # Options of a select don't depend on its name or attributes
+            select = super().render("", value, None, renderer)
+            start, end = select.find(">") + 1, select.rfind(self.closing_tag)
+            if not 0 < start <= end:
+                return super().render(name, value, attrs, renderer)
+            options = remember(self.rendered_options, key, select[start:end])
+
+        # Skip building the options, which are already rendered
+        context = super(ChoiceWidget, self).get_context(name, value, attrs)
+        context["widget"]["optgroups"] = []
+        html = renderer.render(self.template_name, context)
+        end = html.rfind(self.closing_tag)
+        if end < 0:
+            return super().render(name, value, attrs, renderer)
+        return mark_safe(html[:end] + options + html[end:])  # noqa: S308
+
+
+class ChoiceFormField(SharedChoices, TypedChoiceField):
+    widget = ChoiceSelect
+    # Valid values, and their string forms, by key of choices
+    valid_values: ClassVar[dict[int, tuple[frozenset[Any], frozenset[str]]]] = {}
 
-class ChoiceFormField(TypedChoiceField):
     def prepare_value(self, value: Any) -> Any:
-        if isinstance(value, Enum):
+        if isinstance(value, (Enum, *unknown_types)):
             return value.value
         return value
+
+    def valid_value(self, value: Any) -> bool:
+        key = self.choices_key()
+        if key is None:
+            return super().valid_value(value)
+        try:
+            keys, text_keys = self.valid_values[key]
+        except KeyError:
+            keys = frozenset(flat_choice_keys(self.choices))
+            text_keys = frozenset(map(str, keys))
+            remember(self.valid_values, key, (keys, text_keys))
+        try:
+            if value in keys:
+                return True
+        except TypeError:
+            # Unhashable, compare it as a string like `ChoiceField.valid_value` does
+            pass
+        return str(value) in text_keys
+
+
+class FlagFormField(TypedMultipleChoiceField):
+    def prepare_value(self, value: Any) -> Any:
+        if isinstance(value, Flag):
+            return [
+                member.value
+                for member in type(value)
+                if member.value and member in value
+            ]
+        return value
+
+
+class MultiChoiceFormField(TypedMultipleChoiceField):
+    def prepare_value(self, value: Any) -> Any:
+        if isinstance(value, frozenset):
+            return sorted(member.value for member in value)
+        return value
@@ -0,0 +1,305 @@
+"""
+Opt-in instrumentation of conversions done by choice fields. Conversions are counted
+by field and direction, with a sample of their latency, how many were resolved by a
+decode (or encode) table and how many failed on an invalid value.
+
+Nothing is instrumented until a `Recorder` is started, and conversions go through the
+fields' regular methods again once every recorder has stopped.
+
+    with Recorder(sink=LoggingSink()):
+        ...
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, NamedTuple
+
+from django.core.exceptions import ValidationError
+
+from .fields import (
+    Choice,
+    ChoiceField,
+    FlagField,
+    LazyChoice,
+    MultiChoice,
+    MultiChoiceField,
+)
+
+__all__ = ("LoggingSink", "Recorder", "Report")
+
+
+# Instrumented methods, by the direction of their conversion, along with the table
+# they resolve values by
+directions: dict[str, tuple[str, str]] = {
+    "to_python": ("to_python", "_decode_table"),
+    "from_db_value": ("from_db", "_db_decode_table"),
+    "get_db_prep_value": ("to_db", "_encode_table"),
+}
+field_classes = (ChoiceField, FlagField, MultiChoiceField)
+descriptor_classes = (Choice, LazyChoice, MultiChoice)
+
+# Started recorders, conversions are only instrumented while there are any
+recorders: list[Recorder] = []
+# Original methods of instrumented classes, by class and name
+originals: dict[tuple[type, str], Callable[..., Any]] = {}
+lock = threading.Lock()
+
+
+class Active(threading.local):
+    # Directions currently being converted by the thread, so that methods calling
+    # their parent's (instrumented) method are only counted once
+    def __init__(self) -> None:
+        self.directions: set[str] = set()
+
+
+active = Active()
+
+
+class Report(NamedTuple):
+    """
+    Conversions recorded since a recorder was started, or last flushed. Every
+    mapping is keyed by field (as `app_label.Model.field`) and direction, being one
+    of `to_python`, `from_db`, `to_db` and `get` (a descriptor access).
+    """
+
+    conversions: dict[tuple[str, str], int]
+    # Sampled durations of conversions, in seconds
+    latencies: dict[tuple[str, str], list[float]]
+    hits: dict[tuple[str, str], int]
+    misses: dict[tuple[str, str], int]
+    errors: dict[tuple[str, str], int]
+
+    def summary(self) -> list[dict[str, Any]]:
+        """
+        A row per field and direction, with the mean of sampled latencies.
+        """
+        rows = []
+        for key, count in sorted(self.conversions.items()):
+            samples = self.latencies.get(key, [])
+            rows.append(
+                {
+                    "field": key[0],
+                    "direction": key[1],
+                    "conversions": count,
+                    "mean": sum(samples) / len(samples) if samples else None,
+                    "samples": len(samples),
+                    "hits": self.hits.get(key, 0),
+                    "misses": self.misses.get(key, 0),
+                    "errors": self.errors.get(key, 0),
+                }
+            )
+        return rows
+
+
+class Recorder:
+    """
+    Aggregates conversions of all choice fields while started, passing them on to its
+    sink when flushed. The duration of every `sample_every`:th conversion, by field
+    and direction, is sampled.
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[Report], Any] | None = None,
+        sample_every: int = 100,
+    ) -> None:
+        if sample_every < 1:
+            raise TypeError("'sample_every' must be a positive integer")
+        self.sink = sink
+        self.sample_every = sample_every
+        self.reset()
+
+    def reset(self) -> None:
+        self.conversions: Counter[tuple[str, str]] = Counter()
+        self.latencies: defaultdict[tuple[str, str], list[float]] = defaultdict(list)
+        self.hits: Counter[tuple[str, str]] = Counter()
+        self.misses: Counter[tuple[str, str]] = Counter()
+        self.errors: Counter[tuple[str, str]] = Counter()
+
+    def start(self) -> None:
+        with lock:
+            if not recorders:
+                install()
+            recorders.append(self)
+
+    def stop(self) -> None:
+        with lock:
+            recorders.remove(self)
+            if not recorders:
+                uninstall()
+
+    def flush(self) -> Report:
+        """
+        Hand what's been recorded over to the sink, and start over.
+        """
+        report = Report(
+            conversions=dict(self.conversions),
+            latencies=dict(self.latencies),
+            hits=dict(self.hits),
+            misses=dict(self.misses),
+            errors=dict(self.errors),
+        )
+        self.reset()
+        if self.sink is not None:
+            self.sink(report)
+        return report
+
+    def __enter__(self) -> Recorder:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+        self.flush()
+
+
+class LoggingSink:
+    """
+    Sink logging a line per field and direction of a report.
+    """
+
+    def __init__(
+        self, logger: logging.Logger | str = "choicefield", level: int = logging.INFO
+    ) -> None:
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.level = level
+
+    def __call__(self, report: Report) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        for row in report.summary():
+            self.logger.log(
+                self.level,
+                "%s %s: %d conversions, mean %.2fus (%d samples), "
+                "%d hits, %d misses, %d errors",
+                row["field"],
+                row["direction"],
+                row["conversions"],
+                (row["mean"] or 0) * 1e6,
+                row["samples"],
+                row["hits"],
+                row["misses"],
+                row["errors"],
+            )
+
+
+def is_hit(table: dict[Any, Any], value: Any) -> bool:
+    try:
+        return value in table
+    except TypeError:
+        return False
+
+
+def record(
+    function: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    key: tuple[str, str],
+    *,
+    hit: bool | None,
+) -> Any:
+    direction = key[1]
+    sampling = []
+    for recorder in recorders:
+        recorder.conversions[key] += 1
+        if recorder.conversions[key] % recorder.sample_every == 0:
+            sampling.append(recorder)
+        if hit is not None:
+            (recorder.hits if hit else recorder.misses)[key] += 1
+
+    active.directions.add(direction)
+    start = time.perf_counter()
+    try:
+        return function(*args, **kwargs)
+    except (ValidationError, ValueError):
+        for recorder in recorders:
+            recorder.errors[key] += 1
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        active.directions.discard(direction)
+        for recorder in sampling:
+            recorder.latencies[key].append(elapsed)
+
+
+def instrument_method(
+    function: Callable[..., Any], direction: str, table_name: str
+) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def method(self: ChoiceField, value: Any, *args: Any, **kwargs: Any) -> Any:
+        if direction in active.directions:
+            return function(self, value, *args, **kwargs)
+        key = (str(self), direction)
+        hit = is_hit(getattr(self, table_name), value)
+        return record(function, (self, value, *args), kwargs, key, hit=hit)
+
+    return method
+
+
+def instrument_converters(function: Callable[..., Any]) -> Callable[..., Any]:
+    # Values loaded from the database are converted by the field's converters,
+    # rather than by `from_db_value`
+    @functools.wraps(function)
+    def get_db_converters(self: ChoiceField, connection: Any) -> list[Any]:
+        key = (str(self), "from_db")
+        table = self._db_decode_table
+
+        def instrument(converter: Callable[..., Any]) -> Callable[..., Any]:
+            def convert(value: Any, expression: Any, connection: Any) -> Any:
+                args = (value, expression, connection)
+                return record(converter, args, {}, key, hit=is_hit(table, value))
+
+            return convert
+
+        return [instrument(converter) for converter in function(self, connection)]
+
+    return get_db_converters
+
+
+def instrument_descriptor(function: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(function)
+    def get(self: Choice, instance: Any, cls: Any = None) -> Any:
+        if instance is None or "get" in active.directions:
+            return function(self, instance, cls)
+        key = (str(self.field), "get")
+        return record(function, (self, instance, cls), {}, key, hit=None)
+
+    return get
+
+
+def patch(cls: type, name: str, method: Callable[..., Any]) -> None:
+    originals[cls, name] = cls.__dict__[name]
+    setattr(cls, name, method)
+
+
+def install() -> None:
+    for cls in field_classes:
+        for name, (direction, table_name) in directions.items():
+            if name in cls.__dict__:
+                method = cls.__dict__[name]
+                patch(cls, name, instrument_method(method, direction, table_name))
+        if "get_db_converters" in cls.__dict__:
+            method = cls.__dict__["get_db_converters"]
+            patch(cls, "get_db_converters", instrument_converters(method))
+    for descriptor in descriptor_classes:
+        if "__get__" in descriptor.__dict__:
+            get = descriptor.__dict__["__get__"]
+            patch(descriptor, "__get__", instrument_descriptor(get))
+
+
+def uninstall() -> None:
+    for (cls, name), function in originals.items():
+        setattr(cls, name, function)
+    originals.clear()
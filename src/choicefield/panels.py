@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import Any
+
+from debug_toolbar.panels import Panel
+from django.http import HttpRequest, HttpResponse
+from django.utils.html import format_html, format_html_join
+from django.utils.translation import gettext_lazy as _, ngettext
+
+from .instrumentation import Recorder
+
+__all__ = ("ChoiceFieldPanel",)
+
+
+class ChoiceFieldPanel(Panel):  # type: ignore[misc]
+    """
+    Django Debug Toolbar panel listing conversions of choice fields made while
+    handling a request. Add `"choicefield.panels.ChoiceFieldPanel"` to
+    `DEBUG_TOOLBAR_PANELS` to enable it.
+    """
+
+    title = _("Choice fields")
+    # Sample the duration of every conversion, a request makes comparatively few
+    sample_every = 1
+
+    def enable_instrumentation(self) -> None:
+        self.recorder = Recorder(sample_every=self.sample_every)
+        self.recorder.start()
+
+    def disable_instrumentation(self) -> None:
+        self.recorder.stop()
+
+    def generate_stats(self, request: HttpRequest, response: HttpResponse) -> None:
+        rows = self.recorder.flush().summary()
+        self.record_stats(
+            {"rows": rows, "conversions": sum(row["conversions"] for row in rows)}
+        )
+
+    @property
+    def nav_subtitle(self) -> str:
+        count = self.get_stats().get("conversions", 0)
+        return ngettext("%(count)d conversion", "%(count)d conversions", count) % {
+            "count": count
+        }
+
+    @property
+    def content(self) -> str:
+        rows = self.get_stats().get("rows", [])
+        body = format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td>"
+            "<td>{}</td><td>{}</td></tr>",
+            (
+                (
+                    row["field"],
+                    row["direction"],
+                    row["conversions"],
+                    "" if row["mean"] is None else f"{row['mean'] * 1e6:.2f}µs",
+                    row["hits"],
+                    row["misses"],
+                    row["errors"],
+                )
+                for row in rows
+            ),
+        )
+        return format_html(
+            "<table><thead><tr><th>{}</th><th>{}</th><th>{}</th><th>{}</th>"
+            "<th>{}</th><th>{}</th><th>{}</th></tr></thead><tbody>{}</tbody></table>",
+            _("Field"),
+            _("Direction"),
+            _("Conversions"),
+            _("Mean"),
+            _("Hits"),
+            _("Misses"),
+            _("Errors"),
+            body,
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        return super().get_stats() or {}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from enum import Enum
+from itertools import product
+from typing import Any, TypeVar
+
+from django.db import models, router, transaction
+from django.db.models.constants import LOOKUP_SEP
+
+from .fields import ChoiceField, check_choice_field
+
+__all__ = ("ChoiceQuerySet",)
+
+
+M = TypeVar("M", bound=models.Model)
+
+logger = logging.getLogger("choicefield")
+
+
+class ChoiceQuerySet(models.QuerySet[M]):
+    """
+    QuerySet with helpers for models having a `ChoiceField`. Use it as a manager via
+    `ChoiceQuerySet.as_manager()`.
+    """
+
+    def _choice_field(self, path: str) -> ChoiceField:
+        model: Any = self.model
+        *relations, name = path.split(LOOKUP_SEP)
+        for relation in relations:
+            model = model._meta.get_field(relation).related_model
+        return check_choice_field(model._meta.get_field(name), path)
+
+    def count_by_choice(self, *fields: str) -> dict[Any, int]:
+        """
+        Count rows by members of a `ChoiceField`, in a single grouped query. Every
+        member is included, with a count of 0 when there are no rows of it, while
+        `None` is only included when there are rows without a value.
+
+        Passing multiple fields counts rows by combination of members, keyed by
+        tuples of members.
+        """
+        if not fields:
+            raise TypeError("count_by_choice() requires at least one field")
+        choice_fields = [self._choice_field(path) for path in fields]
+        rows = (
+            self.order_by()
+            .values_list(*(f"{path}{LOOKUP_SEP}raw" for path in fields))
+            .annotate(count=models.Count("*"))
+        )
+
+        # Groups are decoded from stored values directly, instead of via converters
+        decoders = [
+            (field._db_decode_table, field._from_stored) for field in choice_fields
+        ]
+        counts: dict[Any, int]
+        if len(choice_fields) == 1:
+            ((decode_table, from_stored),) = decoders
+            counts = dict.fromkeys(choice_fields[0].enum, 0)
+            for value, count in rows:
+                try:
+                    member = decode_table[value]
+                except (KeyError, TypeError):
+                    member = from_stored(value)
+                counts[member] = count
+            return counts
+
+        counts = dict.fromkeys(product(*(field.enum for field in choice_fields)), 0)
+        for *values, count in rows:
+            members: list[Enum | None] = []
+            for value, (decode_table, from_stored) in zip(values, decoders):
+                try:
+                    members.append(decode_table[value])
+                except (KeyError, TypeError):
+                    members.append(from_stored(value))
+            counts[tuple(members)] = count
+        return counts
+
+    def transition(self, field: str, transitions: Mapping[Any, Any]) -> dict[Any, int]:
+        """
+        Move rows from members of a `ChoiceField` to other members, in a single
+        `UPDATE` mapping every source member to its target with a `CASE`. Returns the
+        number of rows moved from each source member. Transitions not allowed by the
+        field's `transitions` raise a `ValidationError`.
+
+        Rows are counted within the same transaction, ahead of the update and
+        without locking them. Under e.g. `READ COMMITTED`, rows concurrently changed
+        in between make the counts approximate, which is logged as a warning.
+
+            Order.objects.filter(created__lt=cutoff).transition(
+                "status",
+                {Status.PENDING: Status.EXPIRED, Status.RETRYING: Status.FAILED},
+            )
+        """
+        choice_field = self._choice_field(field)
+        members = {
+            choice_field.to_python(source): choice_field.to_python(target)
+            for source, target in transitions.items()
+        }
+        if None in members:
+            raise TypeError("Rows without a value can't be transitioned")
+        choice_field.check_transitions(members)
+        if not members:
+            return {}
+
+        # Like `update()` does, the queryset's own database comes first
+        db = self._db or router.db_for_write(  # type: ignore[attr-defined]
+            self.model, **self._hints  # type: ignore[attr-defined]
+        )
+        rows = self.using(db).filter(**{f"{field}__in": list(members)})
+        case = models.Case(
+            *(
+                models.When(
+                    **{field: source},
+                    then=models.Value(target, output_field=choice_field),
+                )
+                for source, target in members.items()
+            ),
+            output_field=choice_field,
+        )
+        with transaction.atomic(using=db):
+            counts = rows.count_by_choice(field)
+            updated = rows.update(**{field: case})
+        moved = {source: counts[source] for source in members}
+        if sum(moved.values()) != updated:
+            logger.warning(
+                "Counted %d rows to transition by %s, while %d were updated",
+                sum(moved.values()),
+                choice_field,
+                updated,
+            )
+        return moved
@@ -1,8 +1,12 @@
 import re
 from http import HTTPStatus
 
+from django.contrib.admin import site
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from .test_app.models import (
@@ -10,6 +14,8 @@ from .test_app.models import (
     IntChoice,
     IntegerEnum,
     NativeEnumModel,
+    NullableModel,
+    OrdinalModel,
     StringEnum,
     TextChoice,
 )
@@ -70,3 +76,95 @@ class TestViews(TestCase):
         self.assertContains(
             response, '<option value="4" selected>FOUR</option>', html=True
         )
+
+    def test_can_update_model_storing_codes(self) -> None:
+        instance = OrdinalModel.objects.create(text_choice=TextChoice.FIRST)
+        url = reverse("admin:test_app_ordinalmodel_change", args=[instance.pk])
+        response = self.client.get(url)
+        self.assertContains(
+            response, '<option value="FIRST" selected>first</option>', html=True
+        )
+        data = {"text_choice": "SECOND", "str_enum": "B"}
+        response = self.client.post(url, data, follow=False)
+        assert response.status_code == HTTPStatus.FOUND
+        instance.refresh_from_db()
+        assert instance.text_choice is TextChoice.SECOND
+        assert instance.str_enum is StringEnum.B
+
+
+class TestChoiceFieldListFilter(TestCase):
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.user = User.objects.create_superuser(username="test", password="test")
+        NullableModel.objects.bulk_create(
+            [
+                NullableModel(choice=IntChoice.ONE),
+                NullableModel(choice=IntChoice.ONE),
+                NullableModel(choice=None),
+            ]
+        )
+
+    def setUp(self) -> None:
+        super().setUp()
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_filter_choices(self, url: str) -> list[tuple[str, bool]]:
+        response = self.client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        (spec,) = response.context["cl"].filter_specs
+        return [
+            (str(choice["display"]), choice["selected"])
+            for choice in spec.choices(response.context["cl"])
+        ]
+
+    def test_counts_members_in_a_single_query(self) -> None:
+        request = RequestFactory().get("/")
+        request.user = self.user
+        model_admin = site._registry[NullableModel]
+        changelist = model_admin.get_changelist_instance(request)
+        (spec,) = changelist.filter_specs
+        with CaptureQueriesContext(connection) as queries:
+            choices = [str(choice["display"]) for choice in spec.choices(changelist)]
+        assert choices == ["All", "one (2)", "two (0)", "- (1)"]
+        (query,) = queries.captured_queries
+        assert "GROUP BY" in query["sql"]
+
+    def test_counts_rows_unaffected_by_own_selection(self) -> None:
+        url = reverse("admin:test_app_nullablemodel_changelist")
+        assert self.get_filter_choices(f"{url}?choice__exact=2") == [
+            ("All", False),
+            ("one (2)", False),
+            ("two (0)", True),
+            ("- (1)", False),
+        ]
+        assert self.get_filter_choices(f"{url}?choice__isnull=True") == [
+            ("All", False),
+            ("one (2)", False),
+            ("two (0)", False),
+            ("- (1)", True),
+        ]
+
+    def test_filters_rows(self) -> None:
+        url = reverse("admin:test_app_nullablemodel_changelist")
+        response = self.client.get(f"{url}?choice__exact=1")
+        assert response.context["cl"].result_count == 2
+        response = self.client.get(f"{url}?choice__isnull=True")
+        assert response.context["cl"].result_count == 1
+
+    def test_caches_counts(self) -> None:
+        OrdinalModel.objects.create(text_choice=TextChoice.SECOND)
+        url = reverse("admin:test_app_ordinalmodel_changelist")
+        expected = [("All", True), ("first (0)", False), ("second (1)", False)]
+        assert self.get_filter_choices(url) == expected
+        OrdinalModel.objects.create(text_choice=TextChoice.FIRST)
+        assert self.get_filter_choices(url) == expected
+        cache.clear()
+        assert self.get_filter_choices(url) == [
+            ("All", True),
+            ("first (1)", False),
+            ("second (1)", False),
+        ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlainChoiceModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    models.CharField(
+                        choices=[("FIRST", "first"), ("SECOND", "second")],
+                        max_length=255,
+                    ),
+                ),
+                ("int_choice", models.IntegerField(choices=[(1, "one"), (2, "two")])),
+            ],
+        ),
+    ]
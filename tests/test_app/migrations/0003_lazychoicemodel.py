@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:31
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0002_plainchoicemodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LazyChoiceModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    choicefield.ChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        enum=tests.test_app.models.TextChoice,
+                        lazy=True,
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "int_choice",
+                    choicefield.ChoiceField(
+                        _values=(1, 2),
+                        enum=tests.test_app.models.IntChoice,
+                        lazy=True,
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
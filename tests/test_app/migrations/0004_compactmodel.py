@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:33
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0003_lazychoicemodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompactModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    choicefield.ChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        compact=True,
+                        enum=tests.test_app.models.TextChoice,
+                        headroom=4,
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "int_choice",
+                    choicefield.ChoiceField(
+                        _values=(1, 2),
+                        compact=True,
+                        enum=tests.test_app.models.IntChoice,
+                    ),
+                ),
+            ],
+        ),
+    ]
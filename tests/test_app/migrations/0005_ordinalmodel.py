@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:34
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0004_compactmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrdinalModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    choicefield.ChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        codes={"FIRST": 1, "SECOND": 2},
+                        enum=tests.test_app.models.TextChoice,
+                    ),
+                ),
+                (
+                    "str_enum",
+                    choicefield.ChoiceField(
+                        _values=("A", "B"),
+                        blank=True,
+                        codes={"A": 1, "B": 2, "C": 3},
+                        enum=tests.test_app.models.StringEnum,
+                        lazy=True,
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:36
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0005_ordinalmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FlagModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "permissions",
+                    choicefield.FlagField(
+                        _values=(1, 2, 4), enum=tests.test_app.models.Permission
+                    ),
+                ),
+                (
+                    "features",
+                    choicefield.FlagField(
+                        _values=(1, 2),
+                        blank=True,
+                        enum=tests.test_app.models.Feature,
+                        null=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:40
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0006_flagmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MultiChoiceModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choices",
+                    choicefield.MultiChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        bits={"FIRST": 0, "SECOND": 1},
+                        enum=tests.test_app.models.TextChoice,
+                        storage="bitmask",
+                    ),
+                ),
+                (
+                    "int_choices",
+                    choicefield.MultiChoiceField(
+                        _values=(1, 2),
+                        blank=True,
+                        enum=tests.test_app.models.IntChoice,
+                        max_length=5,
+                        storage="delimited",
+                    ),
+                ),
+                (
+                    "str_enums",
+                    choicefield.MultiChoiceField(
+                        _values=("A", "B"),
+                        enum=tests.test_app.models.StringEnum,
+                        max_length=5,
+                        null=True,
+                        storage="delimited",
+                    ),
+                ),
+            ],
+        ),
+    ]
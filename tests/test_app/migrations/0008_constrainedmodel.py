@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:43
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0007_multichoicemodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConstrainedModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    choicefield.ChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        db_constraint=True,
+                        enum=tests.test_app.models.TextChoice,
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "int_choice",
+                    choicefield.ChoiceField(
+                        _values=(1, 2),
+                        blank=True,
+                        db_constraint=True,
+                        enum=tests.test_app.models.IntChoice,
+                        null=True,
+                    ),
+                ),
+                (
+                    "str_enum",
+                    choicefield.ChoiceField(
+                        _values=("A", "B"),
+                        codes={"A": 1, "B": 2},
+                        db_constraint=True,
+                        enum=tests.test_app.models.StringEnum,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.CheckConstraint(
+                        check=models.Q(("text_choice__in", ("FIRST", "SECOND"))),
+                        name="test_app_co_text_ch_ff95c8_chk",
+                    ),
+                    models.CheckConstraint(
+                        check=models.Q(("int_choice__in", (1, 2))),
+                        name="test_app_co_int_cho_bfa310_chk",
+                    ),
+                    models.CheckConstraint(
+                        check=models.Q(("str_enum__in", ("A", "B"))),
+                        name="test_app_co_str_enu_ac6e7e_chk",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-17 15:51
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0008_constrainedmodel"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="constrainedmodel",
+            name="test_app_co_text_ch_ff95c8_chk",
+        ),
+        migrations.RemoveConstraint(
+            model_name="constrainedmodel",
+            name="test_app_co_int_cho_bfa310_chk",
+        ),
+        migrations.RemoveConstraint(
+            model_name="constrainedmodel",
+            name="test_app_co_str_enu_ac6e7e_chk",
+        ),
+        migrations.AddField(
+            model_name="constrainedmodel",
+            name="level",
+            field=choicefield.ChoiceField(
+                _values=(1, 2, 3, 4, 5),
+                blank=True,
+                db_constraint=True,
+                enum=tests.test_app.models.Level,
+                null=True,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="constrainedmodel",
+            constraint=models.CheckConstraint(
+                check=models.Q(("text_choice__raw__in", ["FIRST", "SECOND"])),
+                name="test_app_co_text_ch_ff95c8_chk",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="constrainedmodel",
+            constraint=models.CheckConstraint(
+                check=models.Q(("int_choice__raw__in", [1, 2])),
+                name="test_app_co_int_cho_bfa310_chk",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="constrainedmodel",
+            constraint=models.CheckConstraint(
+                check=models.Q(("str_enum__raw__in", [1, 2])),
+                name="test_app_co_str_enu_ac6e7e_chk",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="constrainedmodel",
+            constraint=models.CheckConstraint(
+                check=models.Q(("level__raw__in", [1, 2, 3, 4, 5])),
+                name="test_app_co_level_1e25ba_chk",
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:10
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0009_constrainedmodel_level"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TolerantModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "text_choice",
+                    choicefield.ChoiceField(
+                        _values=("FIRST", "SECOND"),
+                        enum=tests.test_app.models.TextChoice,
+                        max_length=255,
+                        on_unknown="wrap",
+                    ),
+                ),
+                (
+                    "int_choice",
+                    choicefield.ChoiceField(
+                        _values=(1, 2),
+                        enum=tests.test_app.models.IntChoice,
+                        null=True,
+                        on_unknown="raw",
+                    ),
+                ),
+                (
+                    "str_enum",
+                    choicefield.ChoiceField(
+                        _values=("A", "B"),
+                        codes={"A": 1, "B": 2},
+                        enum=tests.test_app.models.StringEnum,
+                        null=True,
+                        on_unknown="wrap",
+                    ),
+                ),
+            ],
+        ),
+    ]
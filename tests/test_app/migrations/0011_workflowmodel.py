@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:13
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0010_tolerantmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WorkflowModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "level",
+                    choicefield.ChoiceField(
+                        _values=(1, 2, 3, 4, 5), enum=tests.test_app.models.Level
+                    ),
+                ),
+                (
+                    "lazy_level",
+                    choicefield.ChoiceField(
+                        _values=(1, 2, 3, 4, 5),
+                        default=1,
+                        enum=tests.test_app.models.Level,
+                        lazy=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
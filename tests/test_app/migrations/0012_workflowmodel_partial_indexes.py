@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0011_workflowmodel"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workflowmodel",
+            index=models.Index(
+                condition=models.Q(("level__raw", 1)),
+                fields=["level"],
+                name="test_app_wo_level_237626_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workflowmodel",
+            index=models.Index(
+                condition=models.Q(("level__raw", 2)),
+                fields=["level"],
+                name="test_app_wo_level_c27232_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:55
+
+import choicefield
+import tests.test_app.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("test_app", "0012_workflowmodel_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="multichoicemodel",
+            name="letters",
+            field=choicefield.MultiChoiceField(
+                _values=("x", "X"),
+                enum=tests.test_app.models.Letter,
+                max_length=5,
+                null=True,
+                storage="delimited",
+            ),
+        ),
+    ]
@@ -1,10 +1,13 @@
-from enum import Enum
+from collections.abc import Callable
+from enum import Enum, Flag, IntFlag, auto
+from typing import Any
 
 from django.contrib import admin
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-from choicefield import ChoiceField
+from choicefield import ChoiceField, ChoiceQuerySet, FlagField, MultiChoiceField
+from choicefield.admin import ChoiceFieldListFilter
 
 
 class TextChoice(models.TextChoices):
@@ -21,6 +24,8 @@ class ChoiceModel(models.Model):
     text_choice = ChoiceField(TextChoice)
     int_choice = ChoiceField(IntChoice)
 
+    objects = ChoiceQuerySet.as_manager()
+
     class Meta:
         app_label = "test_app"
 
@@ -33,13 +38,15 @@ class ChoiceModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 class NullableModel(models.Model):
     choice = ChoiceField(IntChoice, null=True, blank=True)
 
+    objects = ChoiceQuerySet.as_manager()
+
     class Meta:
         app_label = "test_app"
 
 
 @admin.register(NullableModel)
 class NullableModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
-    ...
+    list_filter = (("choice", ChoiceFieldListFilter),)
 
 
 class IntegerEnum(int, Enum):
@@ -76,3 +83,159 @@ class InlinedModel(models.Model):
 @admin.register(InlinedModel)
 class InlinedModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     ...
+
+
+class PlainChoiceModel(models.Model):
+    text_choice = models.CharField(max_length=255, choices=TextChoice.choices)
+    int_choice = models.IntegerField(choices=IntChoice.choices)
+
+    class Meta:
+        app_label = "test_app"
+
+
+@admin.register(PlainChoiceModel)
+class PlainChoiceModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    ...
+
+
+class LazyChoiceModel(models.Model):
+    text_choice = ChoiceField(TextChoice, lazy=True)
+    int_choice = ChoiceField(IntChoice, lazy=True, null=True)
+
+    class Meta:
+        app_label = "test_app"
+
+
+@admin.register(LazyChoiceModel)
+class LazyChoiceModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    ...
+
+
+class CompactModel(models.Model):
+    text_choice = ChoiceField(TextChoice, compact=True, headroom=4)
+    int_choice = ChoiceField(IntChoice, compact=True)
+
+    class Meta:
+        app_label = "test_app"
+
+
+class OrdinalModel(models.Model):
+    text_choice = ChoiceField(
+        TextChoice, codes={TextChoice.FIRST: 1, TextChoice.SECOND: 2}
+    )
+    # Code 3 belongs to a value that's no longer part of the enum
+    str_enum = ChoiceField(
+        StringEnum, codes={"A": 1, "B": 2, "C": 3}, lazy=True, null=True, blank=True
+    )
+
+    objects = ChoiceQuerySet.as_manager()
+
+    class Meta:
+        app_label = "test_app"
+
+
+class CachedChoiceFieldListFilter(ChoiceFieldListFilter):
+    cache_timeout = 60
+
+
+@admin.register(OrdinalModel)
+class OrdinalModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    list_filter = (("text_choice", CachedChoiceFieldListFilter),)
+
+
+class Permission(IntFlag):
+    READ = 1
+    WRITE = 2
+    EXECUTE = 4
+
+
+class Feature(Flag):
+    SEARCH = auto()
+    EXPORT = auto()
+
+
+class FlagModel(models.Model):
+    permissions = FlagField(Permission)
+    features = FlagField(Feature, null=True, blank=True)
+
+    class Meta:
+        app_label = "test_app"
+
+
+@admin.register(FlagModel)
+class FlagModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    ...
+
+
+class Letter(str, Enum):
+    LOWER = "x"
+    UPPER = "X"
+
+
+class MultiChoiceModel(models.Model):
+    text_choices = MultiChoiceField(TextChoice, bits={"FIRST": 0, "SECOND": 1})
+    int_choices = MultiChoiceField(IntChoice, storage="delimited", blank=True)
+    str_enums = MultiChoiceField(StringEnum, storage="delimited", null=True)
+    letters = MultiChoiceField(Letter, storage="delimited", null=True)
+
+    class Meta:
+        app_label = "test_app"
+
+
+@admin.register(MultiChoiceModel)
+class MultiChoiceModelAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
+    ...
+
+
+class Level(models.IntegerChoices):
+    LOWEST = 1
+    LOW = 2
+    MEDIUM = 3
+    HIGH = 4
+    HIGHEST = 5
+
+
+class ConstrainedModel(models.Model):
+    text_choice = ChoiceField(TextChoice, db_constraint=True)
+    int_choice = ChoiceField(IntChoice, db_constraint=True, null=True, blank=True)
+    str_enum = ChoiceField(StringEnum, codes={"A": 1, "B": 2}, db_constraint=True)
+    level = ChoiceField(Level, db_constraint=True, null=True, blank=True)
+
+    class Meta:
+        app_label = "test_app"
+
+
+class TolerantModel(models.Model):
+    text_choice = ChoiceField(TextChoice, on_unknown="wrap")
+    int_choice = ChoiceField(IntChoice, on_unknown="raw", null=True)
+    str_enum = ChoiceField(
+        StringEnum, codes={"A": 1, "B": 2}, on_unknown="wrap", null=True
+    )
+
+    class Meta:
+        app_label = "test_app"
+
+
+class WorkflowModel(models.Model):
+    level = ChoiceField(
+        Level,
+        transitions={
+            Level.LOWEST: [Level.LOW],
+            Level.LOW: [Level.LOWEST, Level.MEDIUM],
+            Level.MEDIUM: [Level.HIGH],
+            Level.HIGH: [Level.HIGHEST],
+        },
+        partial_indexes=[Level.LOWEST, Level.LOW],
+    )
+    lazy_level = ChoiceField(
+        Level, lazy=True, transitions={1: [2]}, default=Level.LOWEST
+    )
+
+    objects = ChoiceQuerySet.as_manager()
+
+    # Added by the fields declaring transitions
+    transition_level: Callable[[Any], bool]
+    transition_lazy_level: Callable[[Any], bool]
+
+    class Meta:
+        app_label = "test_app"
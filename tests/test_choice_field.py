@@ -1,30 +1,85 @@
+import gc
+import re
+import weakref
 from enum import Enum
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
+from unittest import mock
 
 import pytest
-from django.core import serializers
-from django.core.exceptions import ValidationError
-from django.db import connection, models
-from django.db.models.expressions import Value
+from django import forms
+from django.apps import apps
+from django.core import checks, serializers
+from django.core.exceptions import FieldError, ValidationError
+from django.db import IntegrityError, connection, models, transaction
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.state import ModelState, ProjectState, StateApps
+from django.db.models.expressions import Col, F, Value
+from django.forms import Select, modelform_factory
 from django.test import TestCase
-
-from choicefield import ChoiceField
-from choicefield.fields import Choice
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from django.utils import translation
+from django.utils.functional import lazy
+
+from choicefield import ChoiceField, FlagField, MultiChoiceField, UnknownChoice
+from choicefield.fields import (
+    Choice,
+    ChoiceFormField,
+    ChoiceSelect,
+    MemberLabel,
+    RawValue,
+    build_decode_table,
+    check_column_sizes,
+    get_enum_metadata,
+    metadata_attribute,
+)
 
 from .test_app.models import (
     ChoiceModel,
+    CompactModel,
+    ConstrainedModel,
+    FlagModel,
     InlinedModel,
     IntChoice,
     IntegerEnum,
+    LazyChoiceModel,
+    Level,
+    MultiChoiceModel,
     NativeEnumModel,
     NullableModel,
+    OrdinalModel,
+    Permission,
     StringEnum,
     TextChoice,
+    TolerantModel,
+    WorkflowModel,
 )
 
 M = TypeVar("M", bound=models.Model)
 
 
+def detect_changes(before: ChoiceField, after: ChoiceField) -> list[str]:
+    def model_state(field: ChoiceField) -> ModelState:
+        with isolate_apps("tests.test_app"):
+
+            class Detected(models.Model):
+                choice = field
+
+                class Meta:
+                    app_label = "test_app"
+
+            return ModelState.from_model(Detected)
+
+    from_state, to_state = ProjectState(), ProjectState()
+    from_state.add_model(model_state(before))
+    to_state.add_model(model_state(after))
+    changes = MigrationAutodetector(from_state, to_state)._detect_changes()  # type: ignore[attr-defined]
+    return [
+        type(operation).__name__
+        for migration in changes.get("test_app", [])
+        for operation in migration.operations
+    ]
+
+
 @pytest.mark.django_db()
 class TestSave:
     @pytest.mark.parametrize(
@@ -373,6 +428,42 @@ class TestChoiceField:
         with pytest.raises(ValidationError, match=r"1337 is not a valid choice"):
             field.validate(value=1337, model_instance=None)
 
+    def test_validates_against_customised_choices(self) -> None:
+        field = ChoiceField(TextChoice, choices=[("SECOND", "second")])
+        field.validate(TextChoice.SECOND, None)
+        with pytest.raises(ValidationError) as exc:
+            field.validate(TextChoice.FIRST, None)
+        assert exc.value.code == "invalid_choice"
+        assert exc.value.messages == ["Value 'FIRST' is not a valid choice."]
+
+    def test_validates_against_grouped_choices(self) -> None:
+        field = ChoiceField(
+            TextChoice, choices=[("Group", [("FIRST", "first")]), ("SECOND", "second")]
+        )
+        field.validate(TextChoice.FIRST, None)
+        field.validate(TextChoice.SECOND, None)
+
+    def test_validates_against_replaced_choices(self) -> None:
+        field = ChoiceField(TextChoice)
+        field.validate(TextChoice.FIRST, None)
+        field.choices = [("SECOND", "second")]
+        with pytest.raises(ValidationError, match=r"'FIRST' is not a valid choice"):
+            field.validate(TextChoice.FIRST, None)
+
+    @pytest.mark.parametrize(
+        ("value", "code"),
+        [
+            pytest.param(None, "null", id="none"),
+            pytest.param("", "blank", id="empty_string"),
+            pytest.param([], "blank", id="unhashable"),
+        ],
+    )
+    def test_validates_empty_values(self, value: Any, code: str) -> None:
+        field = ChoiceField(TextChoice, choices=[*TextChoice.choices, (None, "-")])
+        with pytest.raises(ValidationError) as exc:
+            field.validate(value, None)
+        assert exc.value.code == code
+
     def test_get_db_prep_value_handles_prepared_enum(self) -> None:
         value = ChoiceField(InlinedModel.InlinedEnum).get_db_prep_value(
             value=InlinedModel.InlinedEnum.VALUE,
@@ -382,6 +473,1143 @@ class TestChoiceField:
         assert value == 0
 
 
+class TestCompact:
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [
+            pytest.param((0, 1, 32767), "PositiveSmallIntegerField", id="small"),
+            pytest.param((-1, 32767), "SmallIntegerField", id="negative_small"),
+            pytest.param((-32768, 32768), "IntegerField", id="integer"),
+            pytest.param((1, 2**31), "BigIntegerField", id="big"),
+        ],
+    )
+    def test_selects_smallest_integer_type(
+        self, values: tuple[int, ...], expected: str
+    ) -> None:
+        enum = Enum(  # type: ignore[misc]
+            "Values", {f"V{i}": value for i, value in enumerate(values)}
+        )
+        field = ChoiceField(enum, compact=True)
+        assert field.get_internal_type() == expected
+        assert ChoiceField(enum).get_internal_type() == "IntegerField"
+
+    def test_sizes_string_column_by_longest_value(self) -> None:
+        assert ChoiceField(TextChoice, compact=True).max_length == 6
+        assert ChoiceField(TextChoice, compact=True, headroom=10).max_length == 16
+        assert ChoiceField(TextChoice, compact=True, max_length=8).max_length == 8
+
+    def test_creates_compact_columns(self) -> None:
+        text_choice = CompactModel._meta.get_field("text_choice")
+        int_choice = CompactModel._meta.get_field("int_choice")
+        assert text_choice.db_type(connection) == "varchar(10)"
+        assert (
+            int_choice.db_type(connection)
+            == connection.data_types["PositiveSmallIntegerField"]
+        )
+
+    @pytest.mark.django_db()
+    def test_can_save_and_fetch(self) -> None:
+        CompactModel.objects.create(text_choice=TextChoice.SECOND, int_choice=2)
+        instance = CompactModel.objects.get()
+        assert instance.text_choice is TextChoice.SECOND
+        assert instance.int_choice is IntChoice.TWO
+
+    def test_deconstruct_includes_compact(self) -> None:
+        instance = ChoiceField(TextChoice, compact=True, headroom=2)
+        __, ___, args, kwargs = instance.deconstruct()
+        assert kwargs["compact"] is True
+        assert kwargs["headroom"] == 2
+        assert kwargs["max_length"] == 8
+        new = ChoiceField(*args, **kwargs)
+        assert new.max_length == 8
+        __, ___, ____, kwargs = ChoiceField(TextChoice).deconstruct()
+        assert "compact" not in kwargs
+        assert "headroom" not in kwargs
+
+    def test_pinned_values_decide_column_type(self) -> None:
+        field = ChoiceField(IntChoice, compact=True, _values=(1, 2, 70000))
+        assert field.get_internal_type() == "IntegerField"
+
+    def test_check_reports_oversized_columns(self) -> None:
+        messages = {
+            message.obj: message
+            for message in check_column_sizes([apps.get_app_config("test_app")])
+        }
+        text_choice = ChoiceModel._meta.get_field("text_choice")
+        assert messages[text_choice].id == "choicefield.I001"
+        message = messages[ChoiceModel._meta.get_field("int_choice")]
+        assert message.id == "choicefield.I002"
+        assert message.hint == (
+            "Pass compact=True to store values as PositiveSmallIntegerField."
+        )
+
+    def test_check_accepts_compact_columns(self) -> None:
+        messages = check_column_sizes([apps.get_app_config("test_app")])
+        assert not {message.obj for message in messages} & set(
+            CompactModel._meta.fields
+        )
+
+    def test_check_is_opt_in(self) -> None:
+        assert ChoiceModel._meta.get_field("text_choice").check() == []
+        assert checks.run_checks(tags=["choicefield"]) == []
+        assert checks.run_checks(tags=["choicefield"], include_deployment_checks=True)
+
+
+class TestCodes(TestCase):
+    instance: OrdinalModel
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.instance = OrdinalModel.objects.create(
+            text_choice=TextChoice.SECOND, str_enum="A"
+        )
+
+    def test_stores_codes(self) -> None:
+        assert list(
+            OrdinalModel.objects.values_list("text_choice__raw", "str_enum__raw")
+        ) == [(2, 1)]
+
+    def test_uses_integer_column(self) -> None:
+        field = OrdinalModel._meta.get_field("text_choice")
+        assert field.get_internal_type() == "PositiveSmallIntegerField"
+        assert field.max_length is None
+
+    def test_column_fits_codes_of_removed_values(self) -> None:
+        field = ChoiceField(TextChoice, codes={"FIRST": 1, "SECOND": 2, "C": 40000})
+        assert field.get_internal_type() == "IntegerField"
+
+    def test_fetches_enum_instances(self) -> None:
+        instance = OrdinalModel.objects.get()
+        assert instance.text_choice is TextChoice.SECOND
+        assert instance.str_enum is StringEnum.A
+        assert list(OrdinalModel.objects.values("text_choice", "str_enum")) == [
+            {"text_choice": TextChoice.SECOND, "str_enum": StringEnum.A}
+        ]
+
+    def test_can_filter(self) -> None:
+        queryset = OrdinalModel.objects.all()
+        assert queryset.filter(text_choice=TextChoice.SECOND).exists() is True
+        assert queryset.filter(text_choice="SECOND").exists() is True
+        assert queryset.filter(text_choice=TextChoice.FIRST).exists() is False
+        assert queryset.filter(text_choice__in=["FIRST", "SECOND"]).exists() is True
+        assert queryset.filter(str_enum=None).exists() is False
+
+    def test_can_update(self) -> None:
+        assert OrdinalModel.objects.update(text_choice="FIRST", str_enum=None) == 1
+        self.instance.refresh_from_db()
+        assert self.instance.text_choice is TextChoice.FIRST
+        assert self.instance.str_enum is None
+
+    def test_errors_fetching_retired_code(self) -> None:
+        OrdinalModel.objects.update(text_choice=Value(3))
+        with pytest.raises(
+            ValidationError, match=r"3 is not a valid code of TextChoice"
+        ):
+            OrdinalModel.objects.get()
+
+    def test_lazy_field_keeps_code_until_accessed(self) -> None:
+        instance = OrdinalModel.objects.get()
+        assert instance.__dict__["str_enum"] == 1
+        assert instance.str_enum is StringEnum.A
+
+    def test_can_serialize_and_parse(self) -> None:
+        (parsed,) = serializers.deserialize(
+            "json", serializers.serialize("json", OrdinalModel.objects.all())
+        )
+        assert isinstance(parsed.object, OrdinalModel)
+        assert parsed.object.text_choice is TextChoice.SECOND
+        assert parsed.object.str_enum is StringEnum.A
+
+    def test_can_validate(self) -> None:
+        self.instance.full_clean()
+
+    def test_deconstruct_pins_codes_by_value(self) -> None:
+        field = ChoiceField(TextChoice, codes={TextChoice.SECOND: 2, "FIRST": 1})
+        __, ___, args, kwargs = field.deconstruct()
+        assert kwargs["codes"] == {"FIRST": 1, "SECOND": 2}
+        assert ChoiceField(*args, **kwargs).codes == {"FIRST": 1, "SECOND": 2}
+
+    def test_errors_on_missing_codes(self) -> None:
+        with pytest.raises(TypeError, match=r"Missing codes for members: SECOND"):
+            ChoiceField(TextChoice, codes={TextChoice.FIRST: 1})
+
+    def test_errors_on_duplicate_codes(self) -> None:
+        with pytest.raises(TypeError, match=r"Codes must be unique"):
+            ChoiceField(TextChoice, codes={"FIRST": 1, "SECOND": 2, "THIRD": 1})
+
+    def test_errors_on_integer_enum(self) -> None:
+        with pytest.raises(TypeError, match=r"only supported for string based enums"):
+            ChoiceField(IntChoice, codes={IntChoice.ONE: 1, IntChoice.TWO: 2})
+
+
+class TestToPython:
+    @pytest.mark.parametrize(
+        ("enum", "value", "expected"),
+        [
+            pytest.param(IntChoice, IntChoice.ONE, IntChoice.ONE, id="int_member"),
+            pytest.param(IntChoice, 2, IntChoice.TWO, id="int_value"),
+            pytest.param(IntChoice, "2", IntChoice.TWO, id="int_value_as_string"),
+            pytest.param(IntChoice, 2.0, IntChoice.TWO, id="int_value_as_float"),
+            pytest.param(TextChoice, "FIRST", TextChoice.FIRST, id="text_value"),
+            pytest.param(StringEnum, "B", StringEnum.B, id="native_str_value"),
+            pytest.param(
+                InlinedModel.InlinedEnum,
+                InlinedModel.InlinedEnum.VALUE,
+                InlinedModel.InlinedEnum.VALUE,
+                id="plain_enum_member",
+            ),
+            pytest.param(
+                InlinedModel.InlinedEnum, 0, InlinedModel.InlinedEnum.VALUE, id="plain"
+            ),
+            pytest.param(IntChoice, None, None, id="none"),
+        ],
+    )
+    def test_decodes_to_member(
+        self, enum: type[Enum], value: Any, expected: Any
+    ) -> None:
+        assert ChoiceField(enum).to_python(value) is expected
+
+    def test_falls_back_to_enum_missing(self) -> None:
+        class CaseInsensitive(str, Enum):
+            A = "A"
+
+            @classmethod
+            def _missing_(cls, value: object) -> "CaseInsensitive | None":
+                if isinstance(value, str):
+                    return cls.__members__.get(value.upper())
+                return None
+
+        field = ChoiceField(CaseInsensitive)
+        assert field.to_python("A") is CaseInsensitive.A
+        assert field.to_python("a") is CaseInsensitive.A
+
+    def test_errors_on_unhashable_value(self) -> None:
+        with pytest.raises(ValidationError, match=r"int\(\) argument") as exc:
+            ChoiceField(IntChoice).to_python([1])
+        assert exc.value.code == "invalid"
+
+    def test_errors_on_enum_value_of_other_type(self) -> None:
+        class Mixed(Enum):
+            ONE = 1
+            A = "A"
+
+        with pytest.raises(ValidationError, match=r"invalid literal") as exc:
+            ChoiceField(Mixed).to_python("A")
+        assert exc.value.code == "invalid"
+
+
+class TestEncode:
+    @pytest.mark.parametrize(
+        ("enum", "value", "expected"),
+        [
+            pytest.param(IntChoice, IntChoice.ONE, 1, id="int_member"),
+            pytest.param(IntChoice, 2, 2, id="int_value"),
+            pytest.param(IntChoice, "2", 2, id="int_value_as_string"),
+            pytest.param(TextChoice, TextChoice.FIRST, "FIRST", id="text_member"),
+            pytest.param(TextChoice, "FIRST", "FIRST", id="text_value"),
+            pytest.param(
+                InlinedModel.InlinedEnum,
+                InlinedModel.InlinedEnum.VALUE,
+                0,
+                id="plain_enum_member",
+            ),
+            pytest.param(IntChoice, None, None, id="none"),
+        ],
+    )
+    def test_get_prep_value(self, enum: type[Enum], value: Any, expected: Any) -> None:
+        prepared = ChoiceField(enum).get_prep_value(value)
+        assert prepared == expected
+        assert type(prepared) is type(expected)
+
+    def test_get_db_prep_value_errors_on_null_for_non_nullable(self) -> None:
+        with pytest.raises(ValidationError, match=r"cannot be null"):
+            ChoiceField(IntChoice).get_db_prep_value(None, connection)
+        assert (
+            ChoiceField(IntChoice, null=True).get_db_prep_value(None, connection)
+            is None
+        )
+
+    def test_encode_many(self) -> None:
+        field = ChoiceField(IntChoice, null=True)
+        assert field.encode_many([IntChoice.ONE, 2, "1", None]) == [1, 2, 1, None]
+
+    def test_encode_many_errors_on_unknown_value(self) -> None:
+        with pytest.raises(ValidationError, match=r"3 is not a valid IntChoice"):
+            ChoiceField(IntChoice).encode_many([IntChoice.ONE, 3])
+
+
+@pytest.mark.django_db()
+class TestBulkWrite:
+    def test_can_bulk_create_and_bulk_update(self) -> None:
+        created = ChoiceModel.objects.bulk_create(
+            [
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE),
+                ChoiceModel(text_choice="SECOND", int_choice=2),
+            ]
+        )
+        for instance in created:
+            instance.int_choice = IntChoice.TWO
+        ChoiceModel.objects.bulk_update(created, ["int_choice"])
+        assert list(
+            ChoiceModel.objects.order_by("text_choice").values_list(
+                "text_choice__raw", "int_choice__raw"
+            )
+        ) == [("FIRST", 2), ("SECOND", 2)]
+
+
+class TestDatabaseConverters:
+    def test_converts_stored_values_to_members(self) -> None:
+        field = ChoiceField(IntChoice, null=True)
+        (converter,) = field.get_db_converters(connection)
+        assert converter(1, None, connection) is IntChoice.ONE
+        assert converter(None, None, connection) is None
+
+    def test_errors_converting_unknown_stored_value(self) -> None:
+        (converter,) = ChoiceField(TextChoice).get_db_converters(connection)
+        with pytest.raises(
+            ValidationError, match=r"'UNKNOWN' is not a valid TextChoice"
+        ):
+            converter("UNKNOWN", None, connection)
+
+    def test_raw_value_skips_field_converters(self) -> None:
+        expression = RawValue(ChoiceModel._meta.get_field("int_choice").get_col("t"))
+        assert expression.get_db_converters(connection) == []
+
+
+@pytest.mark.django_db()
+class TestDbConstraint:
+    def test_contributes_check_constraint(self) -> None:
+        constraints = {c.name: c for c in ConstrainedModel._meta.constraints}
+        constraint = constraints["test_app_co_text_ch_ff95c8_chk"]
+        assert isinstance(constraint, models.CheckConstraint)
+        assert len(constraints) == 4
+        assert all(len(name) <= 30 for name in constraints)
+        assert ChoiceModel._meta.constraints == []
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            pytest.param("text_choice", "THIRD", id="value"),
+            pytest.param("str_enum", 3, id="code"),
+        ],
+    )
+    def test_database_rejects_unknown_values(self, field: str, value: Any) -> None:
+        ConstrainedModel.objects.create(
+            text_choice=TextChoice.FIRST, str_enum=StringEnum.A
+        )
+        with pytest.raises(IntegrityError), transaction.atomic():
+            ConstrainedModel.objects.update(**{field: Value(value)})
+
+    def test_allows_null(self) -> None:
+        instance = ConstrainedModel.objects.create(
+            text_choice=TextChoice.SECOND, int_choice=None, str_enum=StringEnum.B
+        )
+        instance.full_clean()
+        assert list(
+            ConstrainedModel.objects.values_list("str_enum__raw", "int_choice")
+        ) == [(2, None)]
+
+    @pytest.mark.parametrize(
+        ("option", "kwargs"),
+        [
+            pytest.param("constraints", {"db_constraint": True}, id="constraint"),
+            pytest.param(
+                "indexes", {"partial_indexes": [IntChoice.ONE]}, id="partial-index"
+            ),
+        ],
+    )
+    @isolate_apps("tests.test_app")
+    def test_adds_option_to_each_concrete_model(
+        self, option: str, kwargs: dict[str, Any]
+    ) -> None:
+        class Base(models.Model):
+            choice = ChoiceField(IntChoice, **kwargs)
+
+            class Meta:
+                abstract = True
+                app_label = "test_app"
+
+        class First(Base): ...
+
+        class Second(Base): ...
+
+        assert getattr(Base._meta, option) == []
+        (first,) = getattr(First._meta, option)
+        (second,) = getattr(Second._meta, option)
+        assert first.name.startswith("test_app_fi_choice_")
+        assert second.name.startswith("test_app_se_choice_")
+
+    @isolate_apps("tests.test_app")
+    def test_long_names_are_kept_apart_within_limit(self) -> None:
+        class ConstrainedModelWithAVeryLongName(models.Model):
+            choice_with_a_very_long_name_one = ChoiceField(
+                IntChoice, db_constraint=True
+            )
+            choice_with_a_very_long_name_two = ChoiceField(
+                IntChoice, db_constraint=True
+            )
+
+            class Meta:
+                app_label = "test_app"
+
+        names = {c.name for c in ConstrainedModelWithAVeryLongName._meta.constraints}
+        assert len(names) == 2
+        assert all(len(name) <= 30 for name in names)
+
+    def test_autodetector_updates_constraint_with_enum(self) -> None:
+        class Before(models.TextChoices):
+            FIRST = "FIRST"
+
+        operations = detect_changes(
+            ChoiceField(Before, db_constraint=True),
+            ChoiceField(TextChoice, db_constraint=True),
+        )
+        assert "AlterField" in operations
+        assert operations[-1] == "AddConstraint"
+        assert "RemoveConstraint" in operations
+
+    def test_rendered_model_state_has_a_single_constraint(self) -> None:
+        model = ModelState.from_model(ConstrainedModel).render(apps=StateApps([], {}))
+        assert len(model._meta.constraints) == 4
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Remakes on SQLite")
+    @pytest.mark.django_db(transaction=True)
+    def test_table_remake_keeps_constraints(self) -> None:
+        field = ConstrainedModel._meta.get_field("level")
+        compact = ChoiceField(Level, compact=True, null=True, db_constraint=True)
+        compact.set_attributes_from_name("level")
+        # The table is remade via temporary models of it
+        with connection.schema_editor() as editor:
+            editor.alter_field(ConstrainedModel, field, compact)
+            editor.alter_field(ConstrainedModel, compact, field)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT sql FROM sqlite_master WHERE name = %s",
+                [ConstrainedModel._meta.db_table],
+            )
+            ((sql,),) = cursor.fetchall()
+        assert re.findall(r'CONSTRAINT "(\w+)" CHECK', sql) == [
+            c.name for c in ConstrainedModel._meta.constraints
+        ]
+
+    @pytest.mark.parametrize(
+        "field_class",
+        [
+            pytest.param(FlagField, id="flag"),
+            pytest.param(MultiChoiceField, id="multi"),
+        ],
+    )
+    def test_errors_on_unsupported_fields(self, field_class: type) -> None:
+        with pytest.raises(TypeError, match=r"'db_constraint' isn't supported"):
+            field_class(Permission, db_constraint=True)
+
+    def test_deconstruct_includes_db_constraint(self) -> None:
+        __, ___, args, kwargs = ChoiceField(
+            TextChoice, db_constraint=True
+        ).deconstruct()
+        assert kwargs["db_constraint"] is True
+        assert ChoiceField(*args, **kwargs).db_constraint is True
+        __, ___, ____, kwargs = ChoiceField(TextChoice).deconstruct()
+        assert "db_constraint" not in kwargs
+
+
+class TestPartialIndexes:
+    def test_contributes_index_per_member(self) -> None:
+        indexes = WorkflowModel._meta.indexes
+        assert [index.condition for index in indexes] == [
+            models.Q(level__raw=1),
+            models.Q(level__raw=2),
+        ]
+        assert all(index.fields == ["level"] for index in indexes)
+        assert len({index.name for index in indexes}) == 2
+        assert all(len(index.name) <= 30 for index in indexes)
+
+    @pytest.mark.django_db()
+    def test_filters_by_partial_index(self) -> None:
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, WorkflowModel._meta.db_table
+            )
+        for index in WorkflowModel._meta.indexes:
+            assert constraints[index.name]["index"] is True
+        index, __ = WorkflowModel._meta.indexes
+        assert index.name in WorkflowModel.objects.filter(level=Level.LOWEST).explain()
+
+    @isolate_apps("tests.test_app")
+    def test_conditions_are_of_stored_values(self) -> None:
+        class Coded(models.Model):
+            choice = ChoiceField(
+                StringEnum, codes={"A": 1, "B": 2}, partial_indexes=["B"]
+            )
+
+            class Meta:
+                app_label = "test_app"
+
+        (index,) = Coded._meta.indexes
+        assert index.condition == models.Q(choice__raw=2)
+
+    def test_autodetector_keeps_indexes_in_sync(self) -> None:
+        one = ChoiceField(IntChoice, partial_indexes=[IntChoice.ONE])
+        both = ChoiceField(IntChoice, partial_indexes=[IntChoice.ONE, IntChoice.TWO])
+        assert detect_changes(ChoiceField(IntChoice), one) == ["AddIndex"]
+        assert detect_changes(both, one) == ["RemoveIndex"]
+        assert detect_changes(one, ChoiceField(IntChoice, partial_indexes=[1])) == []
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Remakes on SQLite")
+    @pytest.mark.django_db(transaction=True)
+    def test_table_remake_keeps_indexes(self) -> None:
+        field = WorkflowModel._meta.get_field("lazy_level")
+        compact = ChoiceField(Level, compact=True, default=Level.LOWEST)
+        compact.set_attributes_from_name("lazy_level")
+        # The table is remade via temporary models of it
+        with connection.schema_editor() as editor:
+            editor.alter_field(WorkflowModel, field, compact)
+            editor.alter_field(WorkflowModel, compact, field)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s",
+                [WorkflowModel._meta.db_table],
+            )
+            names = sorted(name for (name,) in cursor.fetchall())
+        assert names == sorted(index.name for index in WorkflowModel._meta.indexes)
+
+    def test_rendered_model_state_has_indexes_once(self) -> None:
+        model = ModelState.from_model(WorkflowModel).render(apps=StateApps([], {}))
+        assert len(model._meta.indexes) == 2
+
+    def test_is_left_out_of_migrations(self) -> None:
+        __, __, __, kwargs = WorkflowModel._meta.get_field("level").deconstruct()
+        assert "partial_indexes" not in kwargs
+
+    def test_errors_on_unknown_member(self) -> None:
+        with pytest.raises(TypeError, match=r"3 in 'partial_indexes' is not a member"):
+            ChoiceField(IntChoice, partial_indexes=[3])
+
+    @pytest.mark.parametrize("field_class", [FlagField, MultiChoiceField])
+    def test_errors_on_unsupported_fields(self, field_class: type) -> None:
+        with pytest.raises(TypeError, match=r"'partial_indexes' isn't supported"):
+            field_class(Permission, partial_indexes=[Permission.READ])
+
+
+class TestUnpinnedValues:
+    def test_deconstruct_excludes_values(self) -> None:
+        __, ___, args, kwargs = ChoiceField(TextChoice, pin_values=False).deconstruct()
+        assert "_values" not in kwargs
+        assert kwargs["pin_values"] is False
+        assert "_column_type" not in kwargs
+        assert ChoiceField(*args, **kwargs).deconstruct()[3] == kwargs
+
+    def test_deconstruct_pins_column_type_of_compact_integers(self) -> None:
+        field = ChoiceField(IntChoice, compact=True, pin_values=False)
+        __, ___, args, kwargs = field.deconstruct()
+        assert kwargs["_column_type"] == "PositiveSmallIntegerField"
+        historical = ChoiceField(*args, **{**kwargs, "_column_type": "IntegerField"})
+        assert historical.get_internal_type() == "IntegerField"
+
+    def test_ignores_changed_members(self) -> None:
+        before = ChoiceField(IntChoice, compact=True, pin_values=False, _values=(1,))
+        after = ChoiceField(IntChoice, compact=True, pin_values=False)
+        assert detect_changes(before, after) == []
+        pinned = ChoiceField(IntChoice, compact=True, _values=(1,))
+        assert detect_changes(pinned, ChoiceField(IntChoice, compact=True)) == [
+            "AlterField"
+        ]
+
+    def test_detects_changed_column(self) -> None:
+        before = ChoiceField(
+            IntChoice, compact=True, pin_values=False, _column_type="IntegerField"
+        )
+        after = ChoiceField(IntChoice, compact=True, pin_values=False)
+        assert detect_changes(before, after) == ["AlterField"]
+        before = ChoiceField(TextChoice, compact=True, pin_values=False, max_length=5)
+        after = ChoiceField(TextChoice, compact=True, pin_values=False)
+        assert detect_changes(before, after) == ["AlterField"]
+
+    def test_multi_choice_field_keeps_bits(self) -> None:
+        bits = {"FIRST": 0, "SECOND": 1}
+        before = MultiChoiceField(
+            TextChoice, bits=bits, pin_values=False, _values=("FIRST",)
+        )
+        after = MultiChoiceField(TextChoice, bits=bits, pin_values=False)
+        assert detect_changes(before, after) == []
+        __, ___, ____, kwargs = after.deconstruct()
+        assert "_values" not in kwargs
+        assert kwargs["bits"] == bits
+
+
+class TestInLookup(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ConstrainedModel.objects.bulk_create(
+            [
+                ConstrainedModel(
+                    text_choice=TextChoice.FIRST, str_enum=StringEnum.A, level=level
+                )
+                for level in [*Level, None]
+            ]
+        )
+
+    def sql(self, queryset: models.QuerySet[Any]) -> tuple[str, tuple[Any, ...]]:
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        return sql.split(" WHERE ", 1)[1], params
+
+    def assert_levels(
+        self, queryset: models.QuerySet[Any], expected: list[Any]
+    ) -> None:
+        assert sorted(
+            queryset.values_list("level", flat=True), key=lambda level: level or 0
+        ) == sorted(expected, key=lambda level: level or 0)
+
+    def test_compares_all_members_as_not_null(self) -> None:
+        queryset = ConstrainedModel.objects.filter(level__in=list(Level))
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."level" IS NOT NULL',
+            (),
+        )
+        self.assert_levels(queryset, list(Level))
+        self.assert_levels(
+            ConstrainedModel.objects.exclude(level__in=list(Level)), [None]
+        )
+
+    def test_compares_contiguous_values_as_range(self) -> None:
+        queryset = ConstrainedModel.objects.filter(level__in=[Level.MEDIUM, 2, "4"])
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."level" BETWEEN %s AND %s',
+            (2, 4),
+        )
+        self.assert_levels(queryset, [Level.LOW, Level.MEDIUM, Level.HIGH])
+        self.assert_levels(
+            ConstrainedModel.objects.exclude(level__in=[2, 3, 4]),
+            [Level.LOWEST, Level.HIGHEST, None],
+        )
+
+    def test_compares_most_members_by_complement(self) -> None:
+        queryset = ConstrainedModel.objects.filter(level__in=[1, 2, 4, 5])
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."level" NOT IN (%s)',
+            (3,),
+        )
+        self.assert_levels(queryset, [1, 2, 4, 5])
+        self.assert_levels(
+            ConstrainedModel.objects.exclude(level__in=[1, 2, 4, 5]),
+            [Level.MEDIUM, None],
+        )
+
+    def test_compares_few_members_as_list(self) -> None:
+        queryset = ConstrainedModel.objects.filter(level__in=[1, 5, None])
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."level" IN (%s, %s)',
+            (1, 5),
+        )
+        self.assert_levels(queryset, [Level.LOWEST, Level.HIGHEST])
+
+    def test_empty_list_matches_nothing(self) -> None:
+        assert not ConstrainedModel.objects.filter(level__in=[None]).exists()
+
+    def test_compares_codes(self) -> None:
+        queryset = ConstrainedModel.objects.filter(str_enum__in=["A", StringEnum.B])
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."str_enum" IS NOT NULL',
+            (),
+        )
+        assert queryset.count() == 6
+
+    def test_keeps_list_without_database_constraint(self) -> None:
+        queryset = ChoiceModel.objects.filter(text_choice__in=list(TextChoice))
+        assert self.sql(queryset) == (
+            '"test_app_choicemodel"."text_choice" IN (%s, %s)',
+            ("FIRST", "SECOND"),
+        )
+
+    def test_compares_raw_values_as_stored(self) -> None:
+        queryset = ConstrainedModel.objects.filter(str_enum__raw__in=[1, 2])
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."str_enum" IN (%s, %s)',
+            (1, 2),
+        )
+        assert queryset.count() == 6
+
+    def test_compares_subquery(self) -> None:
+        subquery = ConstrainedModel.objects.filter(level=Level.LOW).values("level")
+        self.assert_levels(
+            ConstrainedModel.objects.filter(level__in=subquery), [Level.LOW]
+        )
+
+
+class TestMemberLookups(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ConstrainedModel.objects.bulk_create(
+            [
+                ConstrainedModel(
+                    text_choice=TextChoice.FIRST, str_enum=StringEnum.A, level=level
+                )
+                for level in [*Level, None]
+            ]
+        )
+
+    def sql(self, queryset: models.QuerySet[Any]) -> tuple[str, tuple[Any, ...]]:
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        return sql.split(" WHERE ", 1)[1], params
+
+    def levels(self, **lookups: Any) -> set[Any]:
+        return set(
+            ConstrainedModel.objects.filter(**lookups).values_list("level", flat=True)
+        )
+
+    def test_compiles_to_in_lookup_of_matching_members(self) -> None:
+        queryset = ChoiceModel.objects.filter(text_choice__label__icontains="SEC")
+        assert self.sql(queryset) == (
+            '"test_app_choicemodel"."text_choice" IN (%s)',
+            ("SECOND",),
+        )
+
+    def test_compiles_via_rewrites_of_in_lookup(self) -> None:
+        queryset = ConstrainedModel.objects.filter(level__label__iregex="low|high")
+        assert self.sql(queryset) == (
+            '"test_app_constrainedmodel"."level" NOT IN (%s)',
+            (3,),
+        )
+
+    def test_matches_names(self) -> None:
+        assert self.levels(level__name="LOW") == {Level.LOW}
+        assert self.levels(level__name__iexact="low") == {Level.LOW}
+        assert self.levels(level__name__startswith="LOW") == {Level.LOWEST, Level.LOW}
+        assert self.levels(level__name__istartswith="high") == {
+            Level.HIGH,
+            Level.HIGHEST,
+        }
+        assert self.levels(level__name__endswith="EST") == {
+            Level.LOWEST,
+            Level.HIGHEST,
+        }
+        assert self.levels(level__name__contains="IU") == {Level.MEDIUM}
+        assert self.levels(level__name__regex=r"^L.W$") == {Level.LOW}
+
+    def test_matches_labels(self) -> None:
+        assert self.levels(level__label="Medium") == {Level.MEDIUM}
+        assert self.levels(level__label__iendswith="EST") == {
+            Level.LOWEST,
+            Level.HIGHEST,
+        }
+        assert self.levels(level__label__icontains="o") == {
+            Level.LOWEST,
+            Level.LOW,
+        }
+        assert self.levels(level__label__in=["Low", "High", "Unknown"]) == {
+            Level.LOW,
+            Level.HIGH,
+        }
+        assert self.levels(level__label__iregex=r"^(low|high)$") == {
+            Level.LOW,
+            Level.HIGH,
+        }
+
+    def test_matches_labels_of_native_enum_by_name(self) -> None:
+        NativeEnumModel.objects.create(str_enum=StringEnum.B, int_enum=3)
+        assert NativeEnumModel.objects.filter(str_enum__label="B").exists()
+        assert not NativeEnumModel.objects.filter(str_enum__label="A").exists()
+
+    def test_excludes_matching_members(self) -> None:
+        assert set(
+            ConstrainedModel.objects.exclude(level__name__startswith="LOW").values_list(
+                "level", flat=True
+            )
+        ) == {Level.MEDIUM, Level.HIGH, Level.HIGHEST, None}
+
+    def test_matching_nothing_matches_no_rows(self) -> None:
+        assert self.levels(level__label="Unknown") == set()
+        assert self.levels(level__name__in=[]) == set()
+
+    def test_matches_flags_having_any_matching_member(self) -> None:
+        FlagModel.objects.create(permissions=Permission.READ | Permission.EXECUTE)
+        FlagModel.objects.create(permissions=Permission.WRITE)
+        assert set(
+            FlagModel.objects.filter(
+                permissions__name__in=["READ", "EXECUTE"]
+            ).values_list("permissions", flat=True)
+        ) == {Permission.READ | Permission.EXECUTE}
+
+    def test_matches_sets_overlapping_matching_members(self) -> None:
+        MultiChoiceModel.objects.create(text_choices=[TextChoice.FIRST], int_choices=[])
+        MultiChoiceModel.objects.create(
+            text_choices=[TextChoice.SECOND], int_choices=[]
+        )
+        assert list(
+            MultiChoiceModel.objects.filter(
+                text_choices__label__startswith="s"
+            ).values_list("text_choices", flat=True)
+        ) == [frozenset({TextChoice.SECOND})]
+
+    def test_matches_labels_of_active_language(self) -> None:
+        class Localized(models.TextChoices):
+            VALUE = "VALUE", lazy(translation.get_language, str)()
+
+        field = ChoiceField(Localized)
+        field.set_attributes_from_name("localized")
+        transform = MemberLabel(Col("t", field))
+        with translation.override("sv"):
+            assert transform.match_table() == ((Localized.VALUE, "sv", "sv"),)
+        with translation.override("en"):
+            assert transform.match_table() == ((Localized.VALUE, "en", "en"),)
+
+    def test_errors_selecting_transform(self) -> None:
+        with pytest.raises(FieldError, match=r"'label' of a ChoiceField"):
+            list(ChoiceModel.objects.values_list("text_choice__label"))
+
+    def test_errors_comparing_expression(self) -> None:
+        with pytest.raises(TypeError, match=r"'exact' of 'name' requires a value"):
+            ChoiceModel.objects.filter(text_choice__name=F("int_choice"))
+        with pytest.raises(TypeError, match=r"'in' of 'label' requires an iterable"):
+            ChoiceModel.objects.filter(text_choice__label__in="first")
+
+
+class TestEnumMetadata:
+    def test_fields_share_metadata_of_enum(self) -> None:
+        field = ChoiceField(TextChoice)
+        other = ChoiceField(TextChoice, null=True)
+        assert field._decode_table is other._decode_table
+        assert field._encode_table is other._encode_table
+        assert field._stored_values is other._stored_values
+        assert field.choices == other.choices == TextChoice.choices
+        assert field.choices is not other.choices
+
+    def test_fields_storing_codes_have_own_tables(self) -> None:
+        field = ChoiceField(StringEnum, codes={"A": 1, "B": 2})
+        assert field._encode_table is not ChoiceField(StringEnum)._encode_table
+        assert field._stored_values == {1, 2}
+
+    def test_computes_metadata_once_per_enum(self) -> None:
+        class Fresh(Enum):
+            A = "A"
+
+        with mock.patch(
+            "choicefield.fields.build_decode_table", wraps=build_decode_table
+        ) as build:
+            ChoiceField(Fresh)
+            ChoiceField(Fresh, compact=True)
+        build.assert_called_once()
+
+    def test_drops_metadata_of_discarded_enum(self) -> None:
+        class Discarded(Enum):
+            A = "A"
+
+        ChoiceField(Discarded)
+        assert get_enum_metadata(Discarded).values == ("A",)
+        reference = weakref.ref(Discarded)
+        del Discarded
+        gc.collect()
+        assert reference() is None
+
+    def test_errors_on_unsupported_value_type(self) -> None:
+        class Unsupported(Enum):
+            A = 1.5
+
+        with pytest.raises(TypeError, match=r"values of type 'float'"):
+            ChoiceField(Unsupported)
+        assert metadata_attribute not in Unsupported.__dict__
+
+
+class TestUnknownValues(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        TolerantModel.objects.create(
+            text_choice=TextChoice.FIRST, int_choice=1, str_enum=StringEnum.A
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE test_app_tolerantmodel"
+                " SET text_choice = 'THIRD', int_choice = 3, str_enum = 3"
+            )
+
+    def setUp(self) -> None:
+        super().setUp()
+        for field in TolerantModel._meta.get_fields():
+            if isinstance(field, ChoiceField):
+                field.unknown_values.clear()
+
+    def test_wraps_unknown_values(self) -> None:
+        instance = TolerantModel.objects.get()
+        assert instance.text_choice == UnknownChoice("THIRD")
+        assert instance.str_enum == UnknownChoice(3)
+        assert TolerantModel.objects.filter(text_choice=UnknownChoice("THIRD")).exists()
+
+    def test_keeps_unknown_values_as_is(self) -> None:
+        assert list(TolerantModel.objects.values_list("int_choice", flat=True)) == [3]
+        assert TolerantModel.objects.get().int_choice == 3
+
+    def test_saves_unknown_values_as_found(self) -> None:
+        instance = TolerantModel.objects.get()
+        instance.save()
+        assert list(
+            TolerantModel.objects.values_list(
+                "text_choice__raw", "int_choice__raw", "str_enum__raw"
+            )
+        ) == [("THIRD", 3, 3)]
+
+    def test_validation_rejects_unknown_values(self) -> None:
+        instance = TolerantModel.objects.get()
+        with pytest.raises(ValidationError) as exc_info:
+            instance.full_clean()
+        assert set(exc_info.value.message_dict) == {
+            "text_choice",
+            "int_choice",
+            "str_enum",
+        }
+
+    def test_counts_unknown_values(self) -> None:
+        list(TolerantModel.objects.values_list("text_choice", "str_enum"))
+        list(TolerantModel.objects.values_list("text_choice", flat=True))
+        assert TolerantModel._meta.get_field("text_choice").unknown_values == {
+            "THIRD": 2
+        }
+        assert TolerantModel._meta.get_field("str_enum").unknown_values == {3: 1}
+
+    def test_counts_values_raising(self) -> None:
+        field = ChoiceField(TextChoice)
+        for __ in range(2):
+            with pytest.raises(ValidationError):
+                field.from_db_value("THIRD", None, connection)
+        assert field.unknown_values == {"THIRD": 2}
+
+    def test_bounds_counted_values(self) -> None:
+        field = ChoiceField(IntChoice, on_unknown="raw")
+        field.max_unknown_values = 2
+        for value in (3, 4, 5, 3):
+            assert field.from_db_value(value, None, connection) == value
+        assert field.unknown_values == {3: 2, 4: 1}
+
+    def test_counts_loaded_values_once(self) -> None:
+        instance = TolerantModel.objects.get()
+        for __ in range(5):
+            assert instance.text_choice == UnknownChoice("THIRD")
+            assert instance.int_choice == 3
+        assert TolerantModel._meta.get_field("text_choice").unknown_values == {
+            "THIRD": 1
+        }
+        assert TolerantModel._meta.get_field("int_choice").unknown_values == {3: 1}
+
+    def test_policy_only_applies_to_loaded_values(self) -> None:
+        instance = TolerantModel.objects.get()
+        for field, value in [("text_choice", "typo"), ("int_choice", 4)]:
+            with pytest.raises(ValidationError):
+                setattr(instance, field, value)
+            with pytest.raises(ValidationError):
+                TolerantModel.objects.filter(**{field: value}).exists()
+            choice_field = cast(ChoiceField, TolerantModel._meta.get_field(field))
+            assert value not in choice_field.unknown_values
+
+    @isolate_apps("tests.test_app")
+    def test_lazy_field_counts_decoded_values_once(self) -> None:
+        class Lazy(models.Model):
+            choice = ChoiceField(IntChoice, lazy=True, on_unknown="raw")
+
+            class Meta:
+                app_label = "test_app"
+
+        instance = Lazy(choice=3)
+        assert instance.choice == 3
+        assert instance.choice == 3
+        choice_field = cast(ChoiceField, Lazy._meta.get_field("choice"))
+        assert choice_field.unknown_values == {3: 1}
+
+    def test_refreshes_unknown_values(self) -> None:
+        instance = TolerantModel.objects.get()
+        instance.refresh_from_db()
+        assert instance.text_choice == UnknownChoice("THIRD")
+        assert instance.int_choice == 3
+
+    def test_keeps_raw_values_when_saving_other_fields(self) -> None:
+        instance = TolerantModel.objects.get()
+        instance.text_choice = TextChoice.SECOND
+        instance.save(update_fields=["text_choice", "int_choice"])
+        assert list(TolerantModel.objects.values_list("text_choice", "int_choice")) == [
+            (TextChoice.SECOND, 3)
+        ]
+
+    def test_logs_first_occurrence_of_value(self) -> None:
+        with self.assertLogs("choicefield", level="WARNING") as logs:
+            list(TolerantModel.objects.values_list("text_choice", flat=True))
+            list(TolerantModel.objects.values_list("text_choice", flat=True))
+        assert logs.output == [
+            (
+                "WARNING:choicefield:Unknown value 'THIRD' of"
+                " test_app.TolerantModel.text_choice"
+            )
+        ]
+
+    def test_deconstruct_includes_policy(self) -> None:
+        field = ChoiceField(TextChoice, on_unknown="wrap")
+        __, ___, args, kwargs = field.deconstruct()
+        assert kwargs["on_unknown"] == "wrap"
+        assert ChoiceField(*args, **kwargs).on_unknown == "wrap"
+        __, ___, ____, kwargs = ChoiceField(TextChoice).deconstruct()
+        assert "on_unknown" not in kwargs
+
+    def test_errors_on_invalid_policy(self) -> None:
+        with pytest.raises(TypeError, match=r"'on_unknown' must be one of"):
+            ChoiceField(TextChoice, on_unknown="ignore")
+        with pytest.raises(TypeError, match=r"'on_unknown' isn't supported"):
+            FlagField(Permission, on_unknown="raw")
+        with pytest.raises(TypeError, match=r"'on_unknown' isn't supported"):
+            MultiChoiceField(TextChoice, on_unknown="wrap")
+
+
+class TestTransitions(TestCase):
+    def test_moves_instance_along_graph(self) -> None:
+        instance = WorkflowModel.objects.create(level=Level.LOW)
+        assert instance.transition_level(Level.MEDIUM) is True
+        assert instance.level is Level.MEDIUM
+        assert WorkflowModel.objects.get().level is Level.MEDIUM
+
+    def test_updates_conditionally_in_a_single_statement(self) -> None:
+        instance = WorkflowModel.objects.create(level=Level.LOW)
+        with CaptureQueriesContext(connection) as queries:
+            instance.transition_level(3)
+        (query,) = queries.captured_queries
+        assert query["sql"].startswith("UPDATE")
+        assert '"level" IN (2)' in query["sql"]
+
+    def test_fails_when_row_has_moved_on(self) -> None:
+        instance = WorkflowModel.objects.create(level=Level.LOW)
+        stale = WorkflowModel.objects.get()
+        assert instance.transition_level(Level.MEDIUM) is True
+        assert stale.transition_level(Level.LOWEST) is False
+        assert stale.level is Level.LOW
+        assert WorkflowModel.objects.get().level is Level.MEDIUM
+
+    def test_only_the_first_concurrent_transition_wins(self) -> None:
+        first = WorkflowModel.objects.create(level=Level.MEDIUM)
+        second = WorkflowModel.objects.get()
+        assert first.transition_level(Level.HIGH) is True
+        assert second.transition_level(Level.HIGH) is False
+        assert second.level is Level.MEDIUM
+
+    def test_moves_lazy_instance(self) -> None:
+        instance = WorkflowModel.objects.create(level=Level.LOW)
+        instance = WorkflowModel.objects.get()
+        assert instance.transition_lazy_level(Level.LOW) is True
+        assert instance.lazy_level is Level.LOW
+
+    def test_errors_on_target_without_transitions(self) -> None:
+        instance = WorkflowModel.objects.create(level=Level.LOW)
+        with pytest.raises(ValidationError, match=r"No transitions to LOWEST"):
+            instance.transition_lazy_level(Level.LOWEST)
+        with pytest.raises(ValidationError):
+            instance.transition_level(6)
+
+    def test_errors_on_unsaved_instance(self) -> None:
+        with pytest.raises(ValueError, match=r"without a primary key"):
+            WorkflowModel(level=Level.LOW).transition_level(Level.MEDIUM)
+
+    def test_checks_transitions(self) -> None:
+        field = WorkflowModel._meta.get_field("level")
+        field.check_transitions({Level.LOW: Level.LOWEST, Level.HIGH: Level.HIGHEST})
+        with pytest.raises(
+            ValidationError, match=r"not allowed: LOW -> HIGH, HIGHEST -> LOWEST"
+        ):
+            field.check_transitions(
+                {
+                    Level.LOW: Level.HIGH,
+                    Level.HIGHEST: Level.LOWEST,
+                    Level.LOWEST: Level.LOW,
+                }
+            )
+        # Fields without a graph allow anything
+        ChoiceModel._meta.get_field("int_choice").check_transitions(
+            {IntChoice.ONE: IntChoice.TWO}
+        )
+
+    def test_isnt_added_without_graph(self) -> None:
+        assert not hasattr(ChoiceModel, "transition_text_choice")
+
+    def test_is_left_out_of_migrations(self) -> None:
+        __, __, __, kwargs = WorkflowModel._meta.get_field("level").deconstruct()
+        assert "transitions" not in kwargs
+
+    def test_errors_on_unknown_member(self) -> None:
+        with pytest.raises(TypeError, match=r"6 in 'transitions' is not a member"):
+            ChoiceField(Level, transitions={Level.LOW: [6]})
+
+    def test_isnt_supported_by_sets_of_members(self) -> None:
+        for field_class in (FlagField, MultiChoiceField):
+            with pytest.raises(TypeError, match=r"'transitions' isn't supported"):
+                field_class(Permission, transitions={Permission.READ: []})
+
+
+class TestLazy(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        LazyChoiceModel.objects.create(
+            text_choice=TextChoice.SECOND, int_choice=IntChoice.ONE
+        )
+
+    def test_loads_instance_with_stored_values(self) -> None:
+        instance = LazyChoiceModel.objects.get()
+        assert instance.__dict__["text_choice"] == "SECOND"
+        assert type(instance.__dict__["text_choice"]) is str
+        assert instance.__dict__["int_choice"] == 1
+        assert type(instance.__dict__["int_choice"]) is int
+
+    def test_decodes_on_first_access(self) -> None:
+        instance = LazyChoiceModel.objects.get()
+        assert instance.text_choice is TextChoice.SECOND
+        assert instance.__dict__["text_choice"] is TextChoice.SECOND
+        assert instance.int_choice is IntChoice.ONE
+
+    def test_queryset_values_returns_enum_instances(self) -> None:
+        assert list(LazyChoiceModel.objects.values("text_choice", "int_choice")) == [
+            {"text_choice": TextChoice.SECOND, "int_choice": IntChoice.ONE}
+        ]
+        (row,) = LazyChoiceModel.objects.values_list("text_choice", "int_choice")
+        assert row[0] is TextChoice.SECOND
+        assert row[1] is IntChoice.ONE
+        (value,) = LazyChoiceModel.objects.values_list("text_choice", flat=True)
+        assert value is TextChoice.SECOND
+
+    def test_annotation_returns_enum_instance(self) -> None:
+        instance = LazyChoiceModel.objects.annotate(status=F("text_choice")).get()
+        assert instance.status is TextChoice.SECOND
+        assert instance.__dict__["text_choice"] == "SECOND"
+        assert type(instance.__dict__["text_choice"]) is str
+
+    def test_raw_lookup_returns_stored_values(self) -> None:
+        assert list(LazyChoiceModel.objects.values_list("text_choice__raw")) == [
+            ("SECOND",)
+        ]
+
+    def test_can_save_undecoded_instance(self) -> None:
+        instance = LazyChoiceModel.objects.get()
+        instance.save()
+        instance.refresh_from_db()
+        assert instance.text_choice is TextChoice.SECOND
+        assert instance.int_choice is IntChoice.ONE
+
+    def test_can_assign_enum_value(self) -> None:
+        instance = LazyChoiceModel(text_choice="FIRST")
+        assert instance.text_choice is TextChoice.FIRST
+        assert instance.int_choice is None
+
+    def test_errors_accessing_unknown_value(self) -> None:
+        instance = LazyChoiceModel(text_choice="UNKNOWN")
+        with pytest.raises(
+            ValidationError, match=r"'UNKNOWN' is not a valid TextChoice"
+        ):
+            instance.text_choice  # noqa: B018
+
+    def test_deconstruct_includes_lazy(self) -> None:
+        __, ___, args, kwargs = ChoiceField(TextChoice, lazy=True).deconstruct()
+        assert kwargs["lazy"] is True
+        assert ChoiceField(*args, **kwargs).lazy is True
+        __, ___, ____, kwargs = ChoiceField(TextChoice).deconstruct()
+        assert "lazy" not in kwargs
+
+
 class TestSerialization(TestCase):
     @classmethod
     def setUpTestData(cls) -> None:
@@ -464,3 +1692,107 @@ class TestSerialization(TestCase):
             ValidationError, match=r"'UNKNOWN' is not a valid TextChoice"
         ):
             list(ChoiceModel.objects.values())
+
+
+class TestFormField:
+    def form_class(self) -> "type[forms.ModelForm[ChoiceModel]]":
+        return modelform_factory(ChoiceModel, fields=["text_choice", "int_choice"])
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("SECOND", id="value"),
+            pytest.param(TextChoice.SECOND, id="member"),
+            pytest.param(StringEnum.B, id="native_member"),
+        ],
+    )
+    def test_valid_value(self, value: Any) -> None:
+        field = ChoiceFormField(choices=[("Group", [("SECOND", "second")]), ("B", "b")])
+        assert field.valid_value(value) is True
+        assert field.valid_value("FIRST") is False
+        assert field.valid_value(["SECOND"]) is False
+
+    def test_valid_value_follows_replaced_choices(self) -> None:
+        field = ChoiceFormField(choices=TextChoice.choices)
+        assert field.valid_value("FIRST") is True
+        field.choices = [("SECOND", "second")]
+        assert field.valid_value("FIRST") is False
+
+    def test_form_copies_share_choices(self) -> None:
+        form_class = self.form_class()
+        first, second = (
+            cast(ChoiceFormField, form.fields["text_choice"])
+            for form in (form_class(), form_class())
+        )
+        assert first.choices_key() == second.choices_key()
+        assert cast(ChoiceSelect, first.widget).choices_key() == (
+            cast(ChoiceSelect, second.widget).choices_key()
+        )
+        second.choices = [("SECOND", "second")]
+        assert first.choices_key() != second.choices_key()
+
+    @pytest.mark.parametrize(
+        ("value", "attrs"),
+        [
+            pytest.param("SECOND", None, id="selected"),
+            pytest.param(None, None, id="unselected"),
+            pytest.param("FIRST", {"id": "id_choice", "required": True}, id="attrs"),
+        ],
+    )
+    def test_renders_like_select(self, value: Any, attrs: Any) -> None:
+        choices = [("", "---------"), *TextChoice.choices]
+        widget, select = ChoiceSelect(choices=choices), Select(choices=choices)
+        for __ in range(2):
+            assert widget.render("choice", value, attrs) == select.render(
+                "choice", value, attrs
+            )
+
+    def test_renders_grouped_choices_like_select(self) -> None:
+        choices = [("Group", [("FIRST", "first")]), ("SECOND", "second")]
+        widget = ChoiceSelect(choices=choices)
+        assert widget.render("choice", "FIRST") == Select(choices=choices).render(
+            "choice", "FIRST"
+        )
+
+    def test_renders_other_option_templates_like_select(self) -> None:
+        class RadioOptionChoiceSelect(ChoiceSelect):
+            option_template_name = "django/forms/widgets/radio_option.html"
+
+        class RadioOptionSelect(Select):
+            option_template_name = "django/forms/widgets/radio_option.html"
+
+        choices = TextChoice.choices
+        widget = RadioOptionChoiceSelect(choices=choices)
+        select = RadioOptionSelect(choices=choices)
+        for name in ("first", "second"):
+            html = widget.render(name, "FIRST")
+            assert f'name="{name}"' in html.partition(">")[2]
+            assert html == select.render(name, "FIRST")
+
+    def test_renders_options_once(self) -> None:
+        form_class = self.form_class()
+        renders = 0
+        render = Select.render
+
+        def count_render(*args: Any, **kwargs: Any) -> Any:
+            nonlocal renders
+            renders += 1
+            return render(*args, **kwargs)
+
+        with mock.patch.object(Select, "render", count_render):
+            for prefix in ("first", "second", "third"):
+                form = form_class(
+                    prefix=prefix, initial={"text_choice": TextChoice.FIRST}
+                )
+                html = str(form["text_choice"])
+                assert f'name="{prefix}-text_choice"' in html
+                assert '<option value="FIRST" selected>first</option>' in html
+        assert renders == 1
+
+    def test_renders_options_per_language(self) -> None:
+        label = lazy(translation.get_language, str)()
+        widget = ChoiceSelect(choices=[("FIRST", label)])
+        with translation.override("sv"):
+            assert '<option value="FIRST">sv</option>' in widget.render("choice", "")
+        with translation.override("en"):
+            assert '<option value="FIRST">en</option>' in widget.render("choice", "")
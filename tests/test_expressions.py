@@ -0,0 +1,221 @@
+import django
+import pytest
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, isolate_apps
+from django.utils import translation
+from django.utils.functional import lazy
+
+from choicefield import ChoiceField, ChoiceLabel, ChoiceName, ChoiceOrder
+
+from .test_app.models import (
+    ChoiceModel,
+    IntChoice,
+    Level,
+    NullableModel,
+    OrdinalModel,
+    StringEnum,
+    TextChoice,
+    WorkflowModel,
+)
+
+
+class TestChoiceOrder(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        WorkflowModel.objects.bulk_create(
+            [WorkflowModel(level=level) for level in (3, 1, 5, 2, 4)]
+        )
+
+    def levels(self, *ordering: object) -> list[Level]:
+        return list(
+            WorkflowModel.objects.order_by(*ordering).values_list("level", flat=True)
+        )
+
+    def test_orders_by_declaration(self) -> None:
+        assert self.levels(ChoiceOrder("level")) == list(Level)
+        assert self.levels(ChoiceOrder("level").desc()) == list(reversed(Level))
+
+    def test_orders_by_explicit_ordering(self) -> None:
+        ordering = [Level.MEDIUM, Level.HIGHEST, 1, Level.HIGH, Level.LOW]
+        with CaptureQueriesContext(connection) as queries:
+            assert self.levels(ChoiceOrder("level", ordering)) == [3, 5, 1, 4, 2]
+        (query,) = queries.captured_queries
+        assert "ORDER BY CASE WHEN" in query["sql"]
+
+    def test_unranked_members_come_last(self) -> None:
+        levels = self.levels(ChoiceOrder("level", [Level.HIGH, Level.LOW]), "-level")
+        assert levels == [4, 2, 5, 3, 1]
+
+    def test_annotates_rank(self) -> None:
+        ranks = dict(
+            WorkflowModel.objects.annotate(
+                rank=ChoiceOrder("level", [Level.HIGHEST, Level.HIGHEST, Level.LOW])
+            ).values_list("level", "rank")
+        )
+        assert ranks == {
+            Level.LOWEST: 2,
+            Level.LOW: 1,
+            Level.MEDIUM: 2,
+            Level.HIGH: 2,
+            Level.HIGHEST: 0,
+        }
+
+    def test_ranks_codes(self) -> None:
+        OrdinalModel.objects.create(text_choice="FIRST", str_enum=StringEnum.A)
+        OrdinalModel.objects.create(text_choice="FIRST", str_enum=StringEnum.B)
+        ordered = OrdinalModel.objects.order_by(ChoiceOrder("str_enum", ["B", "A"]))
+        assert list(ordered.values_list("str_enum", flat=True)) == [
+            StringEnum.B,
+            StringEnum.A,
+        ]
+
+    def test_orders_null_last_unless_ranked(self) -> None:
+        NullableModel.objects.bulk_create(
+            [NullableModel(choice=None), NullableModel(choice=2), NullableModel()]
+        )
+        ordered = NullableModel.objects.order_by(ChoiceOrder("choice"), "pk")
+        assert list(ordered.values_list("choice", flat=True)) == [2, None, None]
+        ordered = NullableModel.objects.order_by(ChoiceOrder("choice", [None, 2]))
+        assert list(ordered.values_list("choice", flat=True)) == [None, None, 2]
+
+    def test_errors_on_non_choice_field(self) -> None:
+        with pytest.raises(TypeError, match=r"'id' is not a ChoiceField"):
+            self.levels(ChoiceOrder("id"))
+
+    def test_deconstructs_to_package(self) -> None:
+        path, args, kwargs = ChoiceOrder("level", [Level.LOW]).deconstruct()
+        assert path == "choicefield.ChoiceOrder"
+        assert args == ("level", [Level.LOW])
+        assert kwargs == {}
+
+
+class TestChoiceText(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ChoiceModel.objects.bulk_create(
+            [
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.TWO),
+                ChoiceModel(text_choice=TextChoice.SECOND, int_choice=IntChoice.ONE),
+            ]
+        )
+
+    def test_selects_labels_and_names(self) -> None:
+        rows = ChoiceModel.objects.order_by("pk").values_list(
+            ChoiceLabel("text_choice"), ChoiceName("int_choice")
+        )
+        with CaptureQueriesContext(connection) as queries:
+            assert list(rows) == [("first", "TWO"), ("second", "ONE")]
+        (query,) = queries.captured_queries
+        assert query["sql"].count("CASE") == 2
+
+    def test_annotates_values(self) -> None:
+        rows = ChoiceModel.objects.filter(int_choice=IntChoice.ONE).values(
+            label=ChoiceLabel("int_choice")
+        )
+        assert [dict(row) for row in rows] == [{"label": "one"}]
+
+    def test_groups_by_label(self) -> None:
+        rows = (
+            ChoiceModel.objects.values(label=ChoiceLabel("text_choice"))
+            .annotate(count=models.Count("*"))
+            .order_by("label")
+        )
+        assert list(rows) == [
+            {"label": "first", "count": 1},
+            {"label": "second", "count": 1},
+        ]
+
+    def test_selects_names_of_codes(self) -> None:
+        OrdinalModel.objects.create(text_choice="SECOND", str_enum=StringEnum.B)
+        assert list(
+            OrdinalModel.objects.values_list(
+                ChoiceName("str_enum"), ChoiceLabel("text_choice")
+            )
+        ) == [("B", "second")]
+
+    def test_selects_null_for_values_without_a_member(self) -> None:
+        NullableModel.objects.create(choice=None)
+        assert list(NullableModel.objects.values_list(ChoiceName("choice"))) == [
+            (None,)
+        ]
+
+    @isolate_apps("tests.test_app")
+    def test_labels_are_of_language_active_when_compiled(self) -> None:
+        class Localized(models.TextChoices):
+            VALUE = "VALUE", lazy(translation.get_language, str)()
+
+        class LocalizedModel(models.Model):
+            choice = ChoiceField(Localized)
+
+            class Meta:
+                app_label = "test_app"
+
+        rows = LocalizedModel._default_manager.values_list(ChoiceLabel("choice"))
+        with translation.override("sv"):
+            assert rows.query.sql_with_params()[1] == ("VALUE", "sv")
+        with translation.override("en"):
+            assert rows.query.sql_with_params()[1] == ("VALUE", "en")
+
+    def test_caches_fragment_by_enum_and_language(self) -> None:
+        ChoiceLabel.fragments.clear()
+        rows = ChoiceModel.objects.values_list(
+            ChoiceLabel("text_choice"), ChoiceLabel("text_choice")
+        )
+        with translation.override("en"):
+            list(rows.all())
+        with translation.override("sv"):
+            list(rows.all())
+            list(rows.all())
+        assert [key[1:] for key in ChoiceLabel.fragments] == [
+            (TextChoice, None, "en"),
+            (TextChoice, None, "sv"),
+        ]
+
+    def test_errors_on_non_choice_field(self) -> None:
+        with pytest.raises(TypeError, match=r"'id' is not a ChoiceField"):
+            ChoiceModel.objects.values_list(ChoiceName("id"))
+
+    def test_deconstructs_to_package(self) -> None:
+        assert ChoiceLabel("status").deconstruct() == (
+            "choicefield.ChoiceLabel",
+            ("status",),
+            {},
+        )
+        assert ChoiceName("status").deconstruct()[0] == "choicefield.ChoiceName"
+
+
+@pytest.mark.skipif(django.VERSION < (5, 0), reason="GeneratedField requires 5.0")
+@pytest.mark.django_db(transaction=True)
+@isolate_apps("tests.test_app")
+def test_ranks_generated_column() -> None:
+    class Ranked(models.Model):
+        level = ChoiceField(Level)
+        rank = models.GeneratedField(
+            expression=ChoiceOrder("level", [Level.HIGH, Level.LOW]),
+            output_field=models.PositiveSmallIntegerField(),
+            db_persist=True,
+        )
+
+        class Meta:
+            app_label = "test_app"
+            indexes = (models.Index(fields=["rank", "id"], name="ranked_rank_idx"),)
+
+    with connection.schema_editor() as editor:
+        editor.create_model(Ranked)
+    try:
+        Ranked._default_manager.bulk_create([Ranked(level=level) for level in Level])
+        assert list(
+            Ranked._default_manager.order_by("rank", "id").values_list("level", "rank")
+        ) == [
+            (Level.HIGH, 0),
+            (Level.LOW, 1),
+            (Level.LOWEST, 2),
+            (Level.MEDIUM, 2),
+            (Level.HIGHEST, 2),
+        ]
+    finally:
+        with connection.schema_editor() as editor:
+            editor.delete_model(Ranked)
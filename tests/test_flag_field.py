@@ -0,0 +1,156 @@
+from enum import Enum
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.forms import modelform_factory
+from django.test import TestCase
+
+from choicefield import FlagField
+
+from .test_app.models import Feature, FlagModel, Permission
+
+
+class TestFlagField:
+    def test_errors_on_non_flag_enum(self) -> None:
+        class NotAFlag(Enum):
+            A = 1
+
+        with pytest.raises(
+            TypeError, match=r"NotAFlag' is not a subclass of enum.Flag"
+        ):
+            FlagField(NotAFlag)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(Permission.READ, Permission.READ, id="member"),
+            pytest.param(3, Permission.READ | Permission.WRITE, id="combination"),
+            pytest.param("5", Permission.READ | Permission.EXECUTE, id="string"),
+            pytest.param(
+                [Permission.READ, 2], Permission.READ | Permission.WRITE, id="list"
+            ),
+            pytest.param(0, Permission(0), id="empty"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_to_python(self, value: object, expected: object) -> None:
+        assert FlagField(Permission).to_python(value) == expected
+
+    def test_errors_on_unknown_flag(self) -> None:
+        with pytest.raises(ValidationError) as exc:
+            FlagField(Feature).to_python(8)
+        assert exc.value.code == "invalid"
+
+    def test_get_prep_value(self) -> None:
+        field = FlagField(Feature)
+        assert field.get_prep_value(Feature.SEARCH | Feature.EXPORT) == 3
+        assert field.get_prep_value([Feature.EXPORT]) == 2
+
+    def test_remembers_decoded_combinations(self) -> None:
+        field = FlagField(Permission)
+        member = field.to_python(6)
+        assert field._decode_table[6] is member
+        assert field._encode_table[member] == 6
+
+    def test_compact_column_fits_all_combinations(self) -> None:
+        field = FlagField(Permission, compact=True)
+        assert field.get_internal_type() == "PositiveSmallIntegerField"
+
+    def test_deconstruct(self) -> None:
+        field = FlagField(Permission)
+        __, path, args, kwargs = field.deconstruct()
+        assert path == "choicefield.FlagField"
+        assert "choices" not in kwargs
+        assert FlagField(*args, **kwargs).enum is Permission
+
+    def test_validate_accepts_combinations(self) -> None:
+        field = FlagField(Permission)
+        field.validate(Permission.READ | Permission.EXECUTE, None)
+        field.validate(Permission(0), None)
+
+
+class TestFlagLookups(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        FlagModel.objects.create(
+            permissions=Permission.READ | Permission.WRITE, features=Feature.SEARCH
+        )
+        FlagModel.objects.create(permissions=Permission.READ, features=None)
+        FlagModel.objects.create(
+            permissions=Permission(0), features=Feature.SEARCH | Feature.EXPORT
+        )
+
+    def test_fetches_combinations(self) -> None:
+        assert list(
+            FlagModel.objects.order_by("pk").values_list("permissions", flat=True)
+        ) == [Permission.READ | Permission.WRITE, Permission.READ, Permission(0)]
+        assert list(
+            FlagModel.objects.order_by("pk").values_list("features__raw", flat=True)
+        ) == [1, None, 3]
+
+    def test_has_any(self) -> None:
+        queryset = FlagModel.objects.all()
+        assert queryset.filter(permissions__has_any=Permission.READ).count() == 2
+        assert (
+            queryset.filter(
+                permissions__has_any=[Permission.WRITE, Permission.EXECUTE]
+            ).count()
+            == 1
+        )
+        assert queryset.filter(permissions__has_any=0).count() == 0
+        assert queryset.filter(features__has_any=Feature.EXPORT).count() == 1
+
+    def test_has_all(self) -> None:
+        queryset = FlagModel.objects.all()
+        assert (
+            queryset.filter(
+                permissions__has_all=Permission.READ | Permission.WRITE
+            ).count()
+            == 1
+        )
+        assert queryset.filter(permissions__has_all=Permission.READ).count() == 2
+        assert queryset.filter(features__has_all=Feature.SEARCH).count() == 2
+
+    def test_has_none(self) -> None:
+        queryset = FlagModel.objects.all()
+        assert queryset.filter(permissions__has_none=Permission.READ).count() == 1
+        # Null isn't considered to have no flags
+        assert queryset.filter(features__has_none=Feature.EXPORT).count() == 1
+
+    def test_compiles_to_bitwise_and(self) -> None:
+        queryset = FlagModel.objects.filter(permissions__has_all=Permission.WRITE)
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        assert '("test_app_flagmodel"."permissions" & %s) = %s' in sql
+        assert params == (2, 2)
+
+    def test_in_compares_combinations(self) -> None:
+        queryset = FlagModel.objects.filter(
+            permissions__in=[Permission.READ | Permission.WRITE, Permission(0)]
+        )
+        assert queryset.count() == 2
+
+    def test_can_exclude(self) -> None:
+        queryset = FlagModel.objects.exclude(features__has_any=Feature.SEARCH)
+        assert list(queryset.values_list("permissions", flat=True)) == [Permission.READ]
+
+
+class TestFlagFormField(TestCase):
+    def test_can_select_multiple_flags(self) -> None:
+        form_class = modelform_factory(FlagModel, fields=["permissions", "features"])
+        form = form_class(data={"permissions": ["1", "4"], "features": []})
+        assert form.is_valid(), form.errors
+        instance = form.save()
+        instance.refresh_from_db()
+        assert instance.permissions == Permission.READ | Permission.EXECUTE
+        # An empty selection stores "no flags" rather than null
+        assert instance.features == Feature(0)
+
+    def test_renders_selected_flags(self) -> None:
+        instance = FlagModel(permissions=Permission.READ | Permission.WRITE)
+        form = modelform_factory(FlagModel, fields=["permissions"])(instance=instance)
+        html = str(form["permissions"])
+        assert '<option value="1" selected>READ</option>' in html
+        assert '<option value="2" selected>WRITE</option>' in html
+        assert '<option value="4">EXECUTE</option>' in html
@@ -0,0 +1,123 @@
+import logging
+from typing import Any
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+
+from choicefield.fields import Choice, ChoiceField
+from choicefield.instrumentation import LoggingSink, Recorder, Report
+
+from .test_app.models import ChoiceModel, FlagModel, IntChoice, Permission, TextChoice
+
+
+class TestRecorder(TestCase):
+    def test_counts_conversions_by_field_and_direction(self) -> None:
+        ChoiceModel.objects.create(text_choice=TextChoice.FIRST, int_choice=1)
+        with Recorder() as recorder:
+            instance = ChoiceModel.objects.get()
+            assert instance.text_choice is TextChoice.FIRST
+            report = recorder.flush()
+        assert report.conversions[("test_app.ChoiceModel.text_choice", "from_db")] == 1
+        assert report.conversions[("test_app.ChoiceModel.int_choice", "from_db")] == 1
+        assert report.conversions[("test_app.ChoiceModel.text_choice", "get")] == 1
+        assert ("test_app.ChoiceModel.int_choice", "get") not in report.conversions
+
+    def test_counts_decode_table_hits_and_misses(self) -> None:
+        field = ChoiceModel._meta.get_field("int_choice")
+        with Recorder() as recorder:
+            field.to_python(IntChoice.ONE)
+            field.to_python("1")
+            field.to_python("01")
+            field.get_db_prep_value(IntChoice.TWO, connection)
+            report = recorder.flush()
+        key = ("test_app.ChoiceModel.int_choice", "to_python")
+        assert report.conversions[key] == 3
+        assert report.hits[key] == 2
+        assert report.misses[key] == 1
+        assert report.hits[("test_app.ChoiceModel.int_choice", "to_db")] == 1
+
+    def test_counts_invalid_values(self) -> None:
+        field = ChoiceModel._meta.get_field("text_choice")
+        with Recorder() as recorder:
+            with pytest.raises(ValidationError):
+                field.to_python("UNKNOWN")
+            report = recorder.flush()
+        key = ("test_app.ChoiceModel.text_choice", "to_python")
+        assert report.errors == {key: 1}
+        assert report.misses == {key: 1}
+
+    def test_samples_latency(self) -> None:
+        field = ChoiceModel._meta.get_field("int_choice")
+        with Recorder(sample_every=2) as recorder:
+            for __ in range(5):
+                field.to_python(1)
+            report = recorder.flush()
+        (samples,) = report.latencies.values()
+        assert len(samples) == 2
+        assert all(sample >= 0 for sample in samples)
+        (row,) = report.summary()
+        assert row["samples"] == 2
+        assert row["mean"] == sum(samples) / 2
+
+    def test_counts_overridden_methods_once(self) -> None:
+        field = FlagModel._meta.get_field("permissions")
+        with Recorder() as recorder:
+            field.to_python(5)
+            report = recorder.flush()
+        assert report.conversions == {
+            ("test_app.FlagModel.permissions", "to_python"): 1
+        }
+        assert field.to_python(5) is Permission.READ | Permission.EXECUTE
+
+    def test_restores_methods_once_every_recorder_stopped(self) -> None:
+        to_python, get = ChoiceField.to_python, Choice.__dict__["__get__"]
+        outer = Recorder()
+        outer.start()
+        with Recorder() as inner:
+            assert ChoiceField.to_python is not to_python
+            ChoiceField(TextChoice).to_python("FIRST")
+        assert ChoiceField.to_python is not to_python
+        outer.stop()
+        assert ChoiceField.to_python is to_python
+        assert Choice.__dict__["__get__"] is get
+        assert sum(inner.flush().conversions.values()) == 0
+        assert sum(outer.flush().conversions.values()) == 1
+
+    def test_passes_report_to_sink_when_flushed(self) -> None:
+        reports: list[Report] = []
+        with Recorder(sink=reports.append):
+            ChoiceField(TextChoice).to_python("FIRST")
+        (report,) = reports
+        assert list(report.conversions.values()) == [1]
+
+    def test_errors_on_invalid_sample_rate(self) -> None:
+        with pytest.raises(TypeError, match=r"'sample_every' must be a positive"):
+            Recorder(sample_every=0)
+
+
+class TestLoggingSink:
+    def test_logs_a_line_per_field_and_direction(self, caplog: Any) -> None:
+        field = ChoiceModel._meta.get_field("int_choice")
+        with (
+            caplog.at_level(logging.INFO, logger="choicefield"),
+            Recorder(sink=LoggingSink(), sample_every=1),
+        ):
+            field.to_python(1)
+            field.to_python(2)
+        (record,) = caplog.records
+        assert record.getMessage().startswith(
+            "test_app.ChoiceModel.int_choice to_python: 2 conversions, mean "
+        )
+        assert record.getMessage().endswith(
+            "us (2 samples), 2 hits, 0 misses, 0 errors"
+        )
+
+    def test_skips_disabled_level(self, caplog: Any) -> None:
+        with (
+            caplog.at_level(logging.WARNING, logger="choicefield"),
+            Recorder(sink=LoggingSink(level=logging.DEBUG)),
+        ):
+            ChoiceField(TextChoice).to_python("FIRST")
+        assert caplog.records == []
@@ -0,0 +1,315 @@
+from typing import Any
+
+import pytest
+from django.core import serializers
+from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.forms import modelform_factory
+from django.test import TestCase
+
+from choicefield import MultiChoiceField
+
+from .test_app.models import (
+    IntChoice,
+    Letter,
+    MultiChoiceModel,
+    StringEnum,
+    TextChoice,
+)
+
+BITS = {"FIRST": 0, "SECOND": 1}
+
+
+class TestMultiChoiceField:
+    def test_defaults_to_bitmask_given_bits(self) -> None:
+        field = MultiChoiceField(TextChoice, bits=BITS)
+        assert field.storage == "bitmask"
+        assert field.get_internal_type() == "PositiveSmallIntegerField"
+        assert field.max_length is None
+        assert MultiChoiceField(TextChoice).storage == "delimited"
+
+    def test_sizes_delimited_column_by_enum(self) -> None:
+        field = MultiChoiceField(TextChoice, storage="delimited", headroom=3)
+        assert field.get_internal_type() == "CharField"
+        assert field.max_length == len(",FIRST,SECOND,") + 3
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            pytest.param({"storage": "json"}, r"Storage must be one of", id="storage"),
+            pytest.param({"lazy": True}, r"'lazy' isn't supported", id="lazy"),
+            pytest.param(
+                {"codes": {"FIRST": 1, "SECOND": 2}},
+                r"'codes' isn't supported",
+                id="codes",
+            ),
+            pytest.param(
+                {"storage": "delimited", "delimiter": "I"},
+                r"can't contain the delimiter 'I'",
+                id="delimiter",
+            ),
+            pytest.param(
+                {"storage": "bitmask"}, r"requires 'bits' for members", id="no_bits"
+            ),
+            pytest.param(
+                {"storage": "delimited", "bits": BITS},
+                r"'bits' are only supported by bitmask storage",
+                id="delimited_bits",
+            ),
+            pytest.param(
+                {"bits": {"FIRST": 0}},
+                r"Missing bits for members: SECOND",
+                id="missing_bits",
+            ),
+            pytest.param(
+                {"bits": {"FIRST": 0, "SECOND": 1, "THIRD": 0}},
+                r"Bits must be unique",
+                id="duplicate_bits",
+            ),
+            pytest.param(
+                {"bits": {"FIRST": 0, "SECOND": 63}},
+                r"Bits must be between 0 and 62",
+                id="bit_range",
+            ),
+        ],
+    )
+    def test_errors_on_invalid_options(
+        self, kwargs: dict[str, Any], message: str
+    ) -> None:
+        with pytest.raises(TypeError, match=message):
+            MultiChoiceField(TextChoice, **kwargs)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(TextChoice.FIRST, {TextChoice.FIRST}, id="member"),
+            pytest.param(["SECOND", TextChoice.FIRST], set(TextChoice), id="list"),
+            pytest.param(3, set(TextChoice), id="bitmask"),
+            pytest.param(0, set(), id="empty"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_to_python(self, value: object, expected: object) -> None:
+        assert MultiChoiceField(TextChoice, bits=BITS).to_python(value) == expected
+
+    def test_to_python_reads_delimited_strings(self) -> None:
+        field = MultiChoiceField(IntChoice, storage="delimited")
+        assert field.to_python(",2,1,") == {IntChoice.ONE, IntChoice.TWO}
+        assert field.to_python("") == frozenset()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(4, id="unknown_bit"),
+            pytest.param(["THIRD"], id="unknown_value"),
+            pytest.param([None], id="none_member"),
+        ],
+    )
+    def test_errors_on_invalid_value(self, value: object) -> None:
+        with pytest.raises(ValidationError) as exc:
+            MultiChoiceField(TextChoice, bits=BITS).to_python(value)
+        assert exc.value.code == "invalid"
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param({"bits": BITS}, 3, id="bitmask"),
+            pytest.param({}, ",FIRST,SECOND,", id="delimited"),
+        ],
+    )
+    def test_get_prep_value(self, kwargs: dict[str, Any], expected: object) -> None:
+        field = MultiChoiceField(TextChoice, **kwargs)
+        assert field.get_prep_value([TextChoice.SECOND, TextChoice.FIRST]) == expected
+        assert field.get_prep_value(frozenset(TextChoice)) == expected
+
+    def test_reuses_decoded_sets(self) -> None:
+        field = MultiChoiceField(TextChoice, bits=BITS)
+        decoded = field.to_python(3)
+        assert field.to_python(3) is decoded
+        assert field.to_python(decoded) is decoded
+        assert field.get_prep_value(decoded) == 3
+
+    def test_validates_blank(self) -> None:
+        field = MultiChoiceField(TextChoice)
+        field.validate(frozenset(TextChoice), None)
+        with pytest.raises(ValidationError) as exc:
+            field.validate(frozenset(), None)
+        assert exc.value.code == "blank"
+
+    def test_deconstruct_pins_storage(self) -> None:
+        field = MultiChoiceField(StringEnum, delimiter=";")
+        __, path, __, kwargs = field.deconstruct()
+        assert path == "choicefield.MultiChoiceField"
+        assert kwargs["storage"] == "delimited"
+        assert kwargs["delimiter"] == ";"
+        assert "choices" not in kwargs
+        assert "bits" not in kwargs
+
+    def test_deconstruct_pins_bits_by_value(self) -> None:
+        field = MultiChoiceField(TextChoice, bits={TextChoice.SECOND: 1, "FIRST": 0})
+        __, ___, args, kwargs = field.deconstruct()
+        assert kwargs["storage"] == "bitmask"
+        assert kwargs["bits"] == BITS
+        assert "max_length" not in kwargs
+        assert MultiChoiceField(*args, **kwargs).bits == BITS
+
+    def test_inserting_a_member_keeps_stored_sets(self) -> None:
+        class Before(models.TextChoices):
+            A = "A"
+            B = "B"
+            C = "C"
+
+        class After(models.TextChoices):
+            A = "A"
+            X = "X"
+            B = "B"
+            C = "C"
+
+        before = MultiChoiceField(Before, bits={"A": 0, "B": 1, "C": 2})
+        stored = before.get_prep_value([Before.B])
+        # The inserted member is given a new bit, instead of shifting the others
+        after = MultiChoiceField(After, bits={"A": 0, "B": 1, "C": 2, "X": 3})
+        assert after.to_python(stored) == {After.B}
+        assert after.get_prep_value([After.B]) == stored
+        assert after.get_prep_value([After.X]) == 8
+
+
+class TestMultiChoiceQueries(TestCase):
+    both: MultiChoiceModel
+    first: MultiChoiceModel
+    second: MultiChoiceModel
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        cls.both = MultiChoiceModel.objects.create(
+            text_choices=[TextChoice.FIRST, TextChoice.SECOND],
+            int_choices=[IntChoice.TWO, IntChoice.ONE],
+            str_enums=[StringEnum.A],
+        )
+        cls.first = MultiChoiceModel.objects.create(
+            text_choices=[TextChoice.FIRST],
+            int_choices=[],
+            str_enums=None,
+        )
+        cls.second = MultiChoiceModel.objects.create(
+            text_choices=[TextChoice.SECOND],
+            int_choices=[IntChoice.TWO],
+            str_enums=[StringEnum.B, StringEnum.A],
+        )
+
+    def test_fetches_sets(self) -> None:
+        instance = MultiChoiceModel.objects.get(pk=self.both.pk)
+        assert instance.text_choices == {TextChoice.FIRST, TextChoice.SECOND}
+        assert instance.int_choices == {IntChoice.ONE, IntChoice.TWO}
+        assert instance.str_enums == {StringEnum.A}
+        assert isinstance(instance.text_choices, frozenset)
+
+    def test_stores_compact_encoding(self) -> None:
+        assert list(
+            MultiChoiceModel.objects.order_by("pk").values_list(
+                "text_choices__raw", "int_choices__raw", "str_enums__raw"
+            )
+        ) == [(3, ",1,2,", ",A,"), (1, "", None), (2, ",2,", ",A,B,")]
+
+    def test_filters_exact_set(self) -> None:
+        assert list(
+            MultiChoiceModel.objects.filter(
+                str_enums=[StringEnum.A, StringEnum.B]
+            ).values_list("pk", flat=True)
+        ) == [self.second.pk]
+
+    def test_contains(self) -> None:
+        for field, members in [
+            ("text_choices", (TextChoice.FIRST, TextChoice.SECOND)),
+            ("int_choices", (IntChoice.ONE, IntChoice.TWO)),
+        ]:
+            queryset = MultiChoiceModel.objects.order_by("pk")
+            assert list(
+                queryset.filter(**{f"{field}__contains": members}).values_list(
+                    "pk", flat=True
+                )
+            ) == [self.both.pk]
+            assert list(
+                queryset.filter(**{f"{field}__contains": members[1]}).values_list(
+                    "pk", flat=True
+                )
+            ) == [self.both.pk, self.second.pk]
+            assert queryset.filter(**{f"{field}__contains": []}).count() == 3
+        # Null isn't considered a set
+        assert MultiChoiceModel.objects.filter(str_enums__contains=[]).count() == 2
+
+    def test_overlaps(self) -> None:
+        for field, members in [
+            ("text_choices", [TextChoice.FIRST]),
+            ("str_enums", [StringEnum.A, StringEnum.B]),
+        ]:
+            queryset = MultiChoiceModel.objects.order_by("pk")
+            assert queryset.filter(**{f"{field}__overlaps": members}).count() == 2
+            assert queryset.filter(**{f"{field}__overlaps": []}).count() == 0
+
+    def test_compiles_containment(self) -> None:
+        queryset = MultiChoiceModel.objects.filter(
+            text_choices__contains=TextChoice.SECOND,
+            str_enums__overlaps=[StringEnum.A, StringEnum.B],
+        )
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        assert '("test_app_multichoicemodel"."text_choices" & %s) = %s' in sql
+        assert sql.count('INSTR("test_app_multichoicemodel"."str_enums", %s) > 0') == 2
+        assert sorted(params, key=str) == [",A,", ",B,", 2, 2]
+
+    def test_matches_case_of_values(self) -> None:
+        lower = MultiChoiceModel.objects.create(
+            text_choices=[], int_choices=[], letters=[Letter.LOWER]
+        )
+        upper = MultiChoiceModel.objects.create(
+            text_choices=[], int_choices=[], letters=[Letter.UPPER]
+        )
+        queryset = MultiChoiceModel.objects.order_by("pk")
+        assert list(
+            queryset.filter(letters__contains=Letter.LOWER).values_list("pk", flat=True)
+        ) == [lower.pk]
+        assert list(
+            queryset.filter(letters__overlaps=[Letter.UPPER]).values_list(
+                "pk", flat=True
+            )
+        ) == [upper.pk]
+
+    def test_serializes_values(self) -> None:
+        data = serializers.serialize("python", [self.second])
+        assert data[0]["fields"]["text_choices"] == ["SECOND"]
+        assert data[0]["fields"]["str_enums"] == ["A", "B"]
+        (instance,) = serializers.deserialize("python", data)
+        assert isinstance(instance.object, MultiChoiceModel)
+        assert instance.object.str_enums == {StringEnum.A, StringEnum.B}
+
+
+class TestMultiChoiceFormField(TestCase):
+    def test_can_select_multiple_choices(self) -> None:
+        form_class = modelform_factory(
+            MultiChoiceModel, fields=["text_choices", "int_choices", "str_enums"]
+        )
+        form = form_class(
+            data={"text_choices": ["FIRST", "SECOND"], "str_enums": ["B"]}
+        )
+        assert form.is_valid(), form.errors
+        instance = form.save()
+        instance.refresh_from_db()
+        assert instance.text_choices == set(TextChoice)
+        assert instance.int_choices == frozenset()
+        assert instance.str_enums == {StringEnum.B}
+
+    def test_requires_a_choice_unless_blank(self) -> None:
+        form_class = modelform_factory(MultiChoiceModel, fields=["text_choices"])
+        form = form_class(data={"text_choices": []})
+        assert not form.is_valid()
+        assert form.errors["text_choices"][0] == "This field is required."
+
+    def test_renders_selected_choices(self) -> None:
+        instance = MultiChoiceModel(text_choices=[TextChoice.SECOND])
+        form = modelform_factory(MultiChoiceModel, fields=["text_choices"])(
+            instance=instance
+        )
+        html = str(form["text_choices"])
+        assert '<option value="FIRST">first</option>' in html
+        assert '<option value="SECOND" selected>second</option>' in html
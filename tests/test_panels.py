@@ -0,0 +1,24 @@
+from debug_toolbar.toolbar import DebugToolbar
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory
+
+from choicefield import ChoiceField
+from choicefield.panels import ChoiceFieldPanel
+
+from .test_app.models import TextChoice
+
+
+def get_response(request: HttpRequest) -> HttpResponse:
+    return HttpResponse()
+
+
+class TestChoiceFieldPanel:
+    def test_lists_conversions_of_request(self) -> None:
+        request = RequestFactory().get("/")
+        panel = ChoiceFieldPanel(DebugToolbar(request, get_response), get_response)
+        panel.enable_instrumentation()
+        ChoiceField(TextChoice).to_python("FIRST")
+        panel.disable_instrumentation()
+        panel.generate_stats(request, HttpResponse())
+        assert panel.nav_subtitle == "1 conversion"
+        assert "<td>to_python</td>" in panel.content
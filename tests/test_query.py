@@ -0,0 +1,209 @@
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from choicefield import ChoiceQuerySet
+
+from .test_app.models import (
+    ChoiceModel,
+    IntChoice,
+    Level,
+    NullableModel,
+    OrdinalModel,
+    StringEnum,
+    TextChoice,
+    WorkflowModel,
+)
+
+
+class TestCountByChoice(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ChoiceModel.objects.bulk_create(
+            [
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE),
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.TWO),
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.TWO),
+            ]
+        )
+
+    def test_counts_members_in_a_single_query(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            counts = ChoiceModel.objects.count_by_choice("text_choice")
+        assert counts == {TextChoice.FIRST: 3, TextChoice.SECOND: 0}
+        assert all(isinstance(member, TextChoice) for member in counts)
+        (query,) = queries.captured_queries
+        assert "GROUP BY" in query["sql"]
+
+    def test_counts_filtered_rows(self) -> None:
+        assert ChoiceModel.objects.filter(int_choice=IntChoice.TWO).count_by_choice(
+            "int_choice"
+        ) == {IntChoice.ONE: 0, IntChoice.TWO: 2}
+
+    def test_cross_tabulates_multiple_fields(self) -> None:
+        assert ChoiceModel.objects.count_by_choice("text_choice", "int_choice") == {
+            (TextChoice.FIRST, IntChoice.ONE): 1,
+            (TextChoice.FIRST, IntChoice.TWO): 2,
+            (TextChoice.SECOND, IntChoice.ONE): 0,
+            (TextChoice.SECOND, IntChoice.TWO): 0,
+        }
+
+    def test_counts_null_when_present(self) -> None:
+        assert NullableModel.objects.count_by_choice("choice") == {
+            IntChoice.ONE: 0,
+            IntChoice.TWO: 0,
+        }
+        NullableModel.objects.create(choice=None)
+        NullableModel.objects.create(choice=IntChoice.TWO)
+        assert NullableModel.objects.count_by_choice("choice") == {
+            IntChoice.ONE: 0,
+            IntChoice.TWO: 1,
+            None: 1,
+        }
+
+    def test_decodes_codes(self) -> None:
+        OrdinalModel.objects.create(text_choice=TextChoice.SECOND, str_enum="B")
+        assert OrdinalModel.objects.count_by_choice("text_choice", "str_enum") == {
+            (TextChoice.FIRST, StringEnum.A): 0,
+            (TextChoice.FIRST, StringEnum.B): 0,
+            (TextChoice.SECOND, StringEnum.A): 0,
+            (TextChoice.SECOND, StringEnum.B): 1,
+        }
+
+    def test_errors_without_fields(self) -> None:
+        with pytest.raises(TypeError, match=r"requires at least one field"):
+            ChoiceModel.objects.count_by_choice()
+
+    def test_errors_on_other_fields(self) -> None:
+        with pytest.raises(TypeError, match=r"'id' is not a ChoiceField"):
+            ChoiceQuerySet(ChoiceModel).count_by_choice("text_choice", "id")
+
+
+class TestTransition(TestCase):
+    databases = "__all__"
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        ChoiceModel.objects.bulk_create(
+            [
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE),
+                ChoiceModel(text_choice=TextChoice.FIRST, int_choice=IntChoice.TWO),
+                ChoiceModel(text_choice=TextChoice.SECOND, int_choice=IntChoice.TWO),
+            ]
+        )
+
+    def test_updates_rows_in_a_single_statement(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            counts = ChoiceModel.objects.transition(
+                "text_choice",
+                {TextChoice.FIRST: TextChoice.SECOND, "SECOND": TextChoice.FIRST},
+            )
+        assert counts == {TextChoice.FIRST: 2, TextChoice.SECOND: 1}
+        (update,) = (
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        )
+        assert "CASE WHEN" in update
+        assert ChoiceModel.objects.count_by_choice("text_choice") == {
+            TextChoice.FIRST: 1,
+            TextChoice.SECOND: 2,
+        }
+
+    def test_updates_filtered_rows(self) -> None:
+        counts = ChoiceModel.objects.filter(int_choice=IntChoice.TWO).transition(
+            "text_choice", {TextChoice.FIRST: TextChoice.SECOND}
+        )
+        assert counts == {TextChoice.FIRST: 1}
+        assert ChoiceModel.objects.count_by_choice("text_choice", "int_choice") == {
+            (TextChoice.FIRST, IntChoice.ONE): 1,
+            (TextChoice.FIRST, IntChoice.TWO): 0,
+            (TextChoice.SECOND, IntChoice.ONE): 0,
+            (TextChoice.SECOND, IntChoice.TWO): 2,
+        }
+
+    def test_counts_sources_without_rows(self) -> None:
+        ChoiceModel.objects.filter(text_choice=TextChoice.SECOND).delete()
+        assert ChoiceModel.objects.transition(
+            "text_choice", {TextChoice.SECOND: TextChoice.FIRST}
+        ) == {TextChoice.SECOND: 0}
+
+    def test_encodes_codes(self) -> None:
+        OrdinalModel.objects.create(text_choice=TextChoice.FIRST, str_enum="A")
+        assert OrdinalModel.objects.transition("str_enum", {"A": StringEnum.B}) == {
+            StringEnum.A: 1
+        }
+        assert list(OrdinalModel.objects.values_list("str_enum__raw", flat=True)) == [2]
+
+    def test_moves_rows_to_null(self) -> None:
+        NullableModel.objects.create(choice=IntChoice.ONE)
+        assert NullableModel.objects.transition("choice", {IntChoice.ONE: None}) == {
+            IntChoice.ONE: 1
+        }
+        assert NullableModel.objects.count_by_choice("choice") == {
+            IntChoice.ONE: 0,
+            IntChoice.TWO: 0,
+            None: 1,
+        }
+
+    def test_empty_mapping_updates_nothing(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            assert ChoiceModel.objects.transition("text_choice", {}) == {}
+        assert queries.captured_queries == []
+
+    def test_errors_on_unknown_members(self) -> None:
+        with pytest.raises(ValidationError):
+            ChoiceModel.objects.transition("text_choice", {"THIRD": "FIRST"})
+
+    def test_errors_on_null_source(self) -> None:
+        with pytest.raises(TypeError, match=r"Rows without a value"):
+            NullableModel.objects.transition("choice", {None: IntChoice.ONE})
+
+    def test_errors_moving_rows_to_null_of_non_nullable_field(self) -> None:
+        with pytest.raises(ValidationError):
+            ChoiceModel.objects.transition("text_choice", {TextChoice.FIRST: None})
+
+    def test_errors_on_transitions_not_allowed_by_field(self) -> None:
+        WorkflowModel.objects.create(level=Level.LOW)
+        assert WorkflowModel.objects.transition(
+            "level", {Level.LOW: Level.MEDIUM, Level.MEDIUM: Level.HIGH}
+        ) == {Level.LOW: 1, Level.MEDIUM: 0}
+        with pytest.raises(ValidationError, match=r"not allowed: HIGH -> LOWEST"):
+            WorkflowModel.objects.transition("level", {Level.HIGH: Level.LOWEST})
+        assert WorkflowModel.objects.get().level is Level.MEDIUM
+
+    def test_updates_rows_of_selected_database(self) -> None:
+        ChoiceModel.objects.using("other").create(
+            text_choice=TextChoice.FIRST, int_choice=IntChoice.ONE
+        )
+        assert ChoiceModel.objects.using("other").transition(
+            "text_choice", {TextChoice.FIRST: TextChoice.SECOND}
+        ) == {TextChoice.FIRST: 1}
+        assert ChoiceModel.objects.using("other").count_by_choice("text_choice") == {
+            TextChoice.FIRST: 0,
+            TextChoice.SECOND: 1,
+        }
+        assert ChoiceModel.objects.count_by_choice("text_choice") == {
+            TextChoice.FIRST: 2,
+            TextChoice.SECOND: 1,
+        }
+
+    def test_warns_when_counts_disagree_with_rows_updated(self) -> None:
+        count_by_choice = mock.patch.object(
+            ChoiceQuerySet, "count_by_choice", return_value={TextChoice.FIRST: 1}
+        )
+        with count_by_choice, self.assertLogs("choicefield", level="WARNING") as logs:
+            counts = ChoiceModel.objects.transition(
+                "text_choice", {TextChoice.FIRST: TextChoice.SECOND}
+            )
+        assert counts == {TextChoice.FIRST: 1}
+        assert logs.output == [
+            "WARNING:choicefield:Counted 1 rows to transition by"
+            " test_app.ChoiceModel.text_choice, while 2 were updated"
+        ]